@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from pathlib import Path
 import pandas as pd
-import re
+
+from excel_cache import read_excel_cached
+from posh_parser import POS_SATIS, POSH_PATTERN, UIY_KOMISYON, parse_posh
 
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -18,7 +20,7 @@ class DataReader:
         self.file_path = file_path
         self.data: pd.DataFrame | None = None
         # Doğru pattern: POSH ile başlayan ve 15 haneli sayı ile biten
-        self.valid_pattern = r'^POSH.*\/\d{15}$'
+        self.valid_pattern = POSH_PATTERN
 
     def read_excel(self) -> bool:
         """Excel dosyasını oku."""
@@ -26,7 +28,7 @@ class DataReader:
             if not Path(self.file_path).exists():
                 raise FileNotFoundError(f"Excel dosyası bulunamadı: {self.file_path}")
 
-            self.data = pd.read_excel(self.file_path)
+            self.data = read_excel_cached(self.file_path)
             print(f"{GREEN}\u2705 Excel dosyası okundu: {len(self.data)} satır{RESET}")
             return True
         except Exception as e:  # pragma: no cover - basit çıktı
@@ -41,18 +43,17 @@ class DataReader:
         filtered_data: list[dict[str, str | float]] = []
         for item in original_data:
             aciklama = str(item.get('Açıklama', ''))
-            if re.match(self.valid_pattern, aciklama):
-                terminal_match = re.search(r'/([A-Z0-9]+)\s+[A-Z]\s+P\s+', aciklama)
-                terminal = terminal_match.group(1) if terminal_match else ''
+            # Doğrulama ve alan çıkarımı tek regex geçişinde yapılır
+            alanlar = parse_posh(aciklama)
+            if alanlar is not None:
+                terminal = alanlar.terminal or ''
+                tip = alanlar.tip
 
-                if 'POS Satış' in aciklama:
-                    tip = 'POS Satış'
+                if tip == POS_SATIS:
                     kisa_aciklama = f"POS Satış - Terminal {terminal}" if terminal else 'POS Satış'
-                elif 'ÜİY Komisyon' in aciklama:
-                    tip = 'ÜİY Komisyon'
+                elif tip == UIY_KOMISYON:
                     kisa_aciklama = 'ÜİY Komisyon Kesinti'
                 else:
-                    tip = 'Diğer'
                     kisa_aciklama = aciklama[:50] + '...' if len(aciklama) > 50 else aciklama
 
                 filtered_data.append({
@@ -61,6 +62,7 @@ class DataReader:
                     'Tutar': item.get('Tutar', 0),
                     'Tip': tip,
                     'Terminal': terminal,
+                    'Referans': alanlar.referans,
                     'Orijinal_Açıklama': aciklama,
                 })
 
@@ -0,0 +1,223 @@
+"""
+Excel Disk Önbelleği - içerik hash'iyle anahtarlanan sütun dosyaları
+Her sütun bir .npy dosyası, metin/karışık sütunlar pickle'sız tipli dizilere ayrılır
+"""
+
+import hashlib
+import json
+import logging
+import numbers
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from datetime import datetime, time
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+CACHE_FORMAT_VERSION = 2
+DEFAULT_CACHE_DIR = Path(os.environ.get(
+    "RPA_CACHE_DIR", Path(__file__).resolve().parent / ".cache" / "statements"
+))
+
+PathLike = Union[str, Path]
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(path: PathLike, chunk_size: int = 1024 * 1024) -> str:
+    """Dosya içeriğinin SHA-256 değeri"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _entry_dir(cache_dir: Path, content_hash: str, header: Optional[int]) -> Path:
+    header_part = "none" if header is None else str(header)
+    return cache_dir / f"{content_hash}-h{header_part}"
+
+
+# Karışık sütun hücre türleri
+_NONE, _TEXT, _INT, _FLOAT, _DATETIME, _BOOL, _TIME = range(7)
+_MICROS_PER_SECOND = 1_000_000
+_PARTS = ("kind", "text", "int", "float", "datetime")
+
+
+def _encode_object(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """Object sütunu pickle'sız tipli dizilere ayır; desteklenmeyen hücrede ValueError"""
+    rows = len(values)
+    kind = np.zeros(rows, dtype=np.uint8)
+    text = [""] * rows
+    ints = np.zeros(rows, dtype=np.int64)
+    floats = np.zeros(rows, dtype=np.float64)
+    stamps = np.zeros(rows, dtype=np.int64)
+    for row, value in enumerate(values):
+        if value is None:
+            continue
+        if isinstance(value, str):
+            kind[row], text[row] = _TEXT, value
+        elif isinstance(value, (bool, np.bool_)):
+            kind[row], ints[row] = _BOOL, int(value)
+        elif isinstance(value, numbers.Integral):
+            kind[row], ints[row] = _INT, int(value)
+        elif isinstance(value, numbers.Real):
+            kind[row], floats[row] = _FLOAT, float(value)
+        elif value is pd.NaT or isinstance(value, datetime):
+            kind[row], stamps[row] = _DATETIME, pd.Timestamp(value).value
+        elif isinstance(value, time) and value.tzinfo is None:
+            # Saat hücresi: gece yarısından bu yana mikrosaniye
+            seconds = value.hour * 3600 + value.minute * 60 + value.second
+            kind[row], ints[row] = _TIME, seconds * _MICROS_PER_SECOND + value.microsecond
+        else:
+            raise ValueError(f"desteklenmeyen hücre türü: {type(value).__name__}")
+    return {
+        "kind": kind,
+        "text": np.array(text, dtype=np.str_),
+        "int": ints,
+        "float": floats,
+        "datetime": stamps,
+    }
+
+
+def _decode_object(parts: Dict[str, np.ndarray]) -> np.ndarray:
+    kind = parts["kind"]
+    values = np.empty(len(kind), dtype=object)
+    for row, code in enumerate(kind):
+        if code == _TEXT:
+            values[row] = str(parts["text"][row])
+        elif code == _INT:
+            values[row] = int(parts["int"][row])
+        elif code == _BOOL:
+            values[row] = bool(parts["int"][row])
+        elif code == _FLOAT:
+            values[row] = float(parts["float"][row])
+        elif code == _DATETIME:
+            values[row] = pd.Timestamp(int(parts["datetime"][row]))
+        elif code == _TIME:
+            seconds, micros = divmod(int(parts["int"][row]), _MICROS_PER_SECOND)
+            minutes, second = divmod(seconds, 60)
+            values[row] = time(minutes // 60, minutes % 60, second, micros)
+    return values
+
+
+def load_sidecar(entry_dir: Path) -> Optional[pd.DataFrame]:
+    """Önbellekteki tabloyu yükle; kayıt yoksa veya okunamıyorsa None"""
+    meta_path = entry_dir / "meta.json"
+    if not meta_path.exists():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        columns = {}
+        for index, (dtype, mixed) in enumerate(zip(meta["dtypes"], meta["mixed"])):
+            if mixed:
+                values = _decode_object({
+                    part: np.load(entry_dir / f"{index}.{part}.npy", allow_pickle=False) for part in _PARTS
+                })
+            else:
+                values = np.load(entry_dir / f"{index}.npy", allow_pickle=False)
+            series = pd.Series(values)
+            if str(series.dtype) != dtype and dtype != "object":
+                series = series.astype(dtype)
+            columns[index] = series
+        frame = pd.DataFrame(columns)
+        frame.columns = meta["columns"]
+        return frame
+    except Exception:
+        return None
+
+
+def write_sidecar(entry_dir: Path, frame: pd.DataFrame, source: PathLike, content_hash: str) -> bool:
+    """Tabloyu sütun dosyaları olarak atomik yaz; önbelleğe alınamıyorsa False"""
+    if not isinstance(frame.index, pd.RangeIndex) or frame.index.start != 0:
+        return False
+    columns = list(frame.columns)
+    if not all(isinstance(col, (str, int, float)) for col in columns):
+        return False
+
+    entry_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=entry_dir.parent))
+    try:
+        dtypes, mixed = [], []
+        for index in range(len(columns)):
+            series = frame.iloc[:, index]
+            values = series.to_numpy()
+            # Metin/karışık sütunlar türlerine ayrılır, sayısal sütunlar ham yazılır (pickle yok)
+            is_object = values.dtype == object
+            if is_object:
+                try:
+                    parts = _encode_object(values)
+                except ValueError as error:
+                    raise ValueError(f"{columns[index]!r} sütunu: {error}") from None
+                for part, array in parts.items():
+                    np.save(tmp_dir / f"{index}.{part}.npy", array, allow_pickle=False)
+            else:
+                np.save(tmp_dir / f"{index}.npy", values, allow_pickle=False)
+            dtypes.append(str(series.dtype))
+            mixed.append(bool(is_object))
+        meta = {
+            "version": CACHE_FORMAT_VERSION,
+            "source": str(Path(source).resolve()),
+            "sha256": content_hash,
+            "columns": columns,
+            "dtypes": dtypes,
+            "mixed": mixed,
+            "rows": len(frame),
+        }
+        (tmp_dir / "meta.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        if entry_dir.exists():
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(tmp_dir, entry_dir)
+        return True
+    except Exception as error:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        logger.warning("Disk önbelleği yazılmadı (%s): %s", Path(source).name, error)
+        return False
+
+
+def prune_stale_entries(cache_dir: Path, source: PathLike, content_hash: str) -> int:
+    """source'un eski sürümlerine ait kayıtları sil; silinen sayısını döndürür"""
+    source_str = str(Path(source).resolve())
+    removed = 0
+    if not cache_dir.exists():
+        return removed
+    for meta_path in cache_dir.glob("*/meta.json"):
+        entry_dir = meta_path.parent
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        if meta.get("source") == source_str and meta.get("sha256") != content_hash:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def read_excel_cached(path: PathLike, header: Optional[int] = 0,
+                      cache_dir: Optional[PathLike] = None, use_cache: bool = True) -> pd.DataFrame:
+    """openpyxl çalışmadan önce disk önbelleğine bakan pd.read_excel"""
+    if not use_cache:
+        return pd.read_excel(path, header=header)
+
+    cache_root = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    content_hash = file_sha256(path)
+    entry_dir = _entry_dir(cache_root, content_hash, header)
+
+    frame = load_sidecar(entry_dir)
+    if frame is not None:
+        return frame
+
+    frame = pd.read_excel(path, header=header)
+    try:
+        if write_sidecar(entry_dir, frame, path, content_hash):
+            prune_stale_entries(cache_root, path, content_hash)
+    except OSError:
+        # Önbelleğe yazılamaması okumayı engellememeli
+        pass
+    return frame
@@ -3,70 +3,93 @@
 from __future__ import annotations
 
 import logging
-import datetime
-import pandas as pd
-from pathlib import Path
 from colorama import init, Fore, Style
 
+from results_sink import ResultsSink, timestamp
+from structured_log import get_logger
+from transaction import Transaction
+
 # Colorama'yı başlat
 init(autoreset=True)
 
+# Her sonuç oluştuğu anda bu dosyaya eklenir; XLSX rapor istenince üretilir
+RESULTS_PATH = "../data/sonuclar.jsonl"
+RESULTS_XLSX_PATH = "../data/sonuclar.xlsx"
+# Yeniden başlatmada aynı satırı tanımak için kullanılan alanlar
+RESULT_KEY_FIELDS = ("Tarih", "Açıklama", "Tutar")
+
+
+class ColorConsoleFormatter(logging.Formatter):
+    """Konsol satırlarını seviyeye göre renklendirir."""
+
+    COLORS = {"INFO": Fore.CYAN, "ERROR": Fore.RED, "SUCCESS": Fore.GREEN}
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = getattr(record, "fields", None) or {}
+        label = "SUCCESS" if "durum" in fields else record.levelname
+        return f"{self.COLORS.get(label, '')}[{label}]{Style.RESET_ALL} {record.getMessage()}"
+
 
 class RPALogger:
     """RPA işlemleri için logger sınıfı."""
 
     def __init__(self) -> None:
-        # Logs klasörünü oluştur
-        Path("logs").mkdir(exist_ok=True)
+        # Kuyruk tabanlı logger: dosya (logs/rpa_log.jsonl, dönen) ve konsol
+        # arka plan thread'inde yazılır; tekrar oluşturmak handler eklemez
+        self.logger = get_logger(
+            "RPA_Bot", file_name="rpa_log.jsonl", console_formatter=ColorConsoleFormatter()
+        )
 
-        # Logger ayarları
-        self.logger = logging.getLogger("RPA_Bot")
-        self.logger.setLevel(logging.INFO)
+        self.sink = ResultsSink(RESULTS_PATH)
 
-        # Dosya handler
-        file_handler = logging.FileHandler("logs/rpa_log.txt", encoding="utf-8")
-        file_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        file_handler.setFormatter(file_formatter)
+    @staticmethod
+    def _result_fields(row_data: Transaction | dict[str, str | float]) -> tuple:
+        """Satırdan (tarih, açıklama, tutar) alanlarını çıkar."""
+        if isinstance(row_data, Transaction):
+            # Tutar Decimal bırakılır; rapora sayı olarak yazılır
+            return row_data.tarih_text(), row_data.aciklama, row_data.tutar
+        return row_data.get("Tarih", ""), row_data.get("Açıklama", ""), row_data.get("Tutar", "")
 
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_formatter = logging.Formatter("%(levelname)s - %(message)s")
-        console_handler.setFormatter(console_formatter)
+    def result_key(self, row_data: Transaction | dict[str, str | float]) -> tuple[str, ...]:
+        """Satırın sonuç dosyasındaki anahtarı (metin olarak)."""
+        return tuple(str(value) for value in self._result_fields(row_data))
 
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+    def committed_keys(self) -> set[tuple[str, ...]]:
+        """Önceki (yarıda kalmış) çalıştırmada başarıyla işlenmiş satırlar."""
+        return self.sink.committed_keys(RESULT_KEY_FIELDS, "Durum", "BAŞARILI")
 
-        self.results: list[dict[str, str]] = []
+    def reset_results(self) -> None:
+        """Yeni çalıştırma: önceki sonuçları sil."""
+        self.sink.reset()
 
     def log_info(self, message: str) -> None:
         """Bilgi mesajı yaz."""
-        print(f"{Fore.CYAN}[INFO]{Style.RESET_ALL} {message}")
         self.logger.info(message)
 
     def log_error(self, message: str) -> None:
         """Hata mesajı yaz."""
-        print(f"{Fore.RED}[ERROR]{Style.RESET_ALL} {message}")
         self.logger.error(message)
 
-    def log_success(self, row_data: dict[str, str | float], status: str = "BAŞARILI") -> None:
-        """İşlem sonucunu kaydet."""
-        print(f"{Fore.GREEN}[SUCCESS]{Style.RESET_ALL} {row_data.get('Açıklama', '')} - {row_data.get('Tutar', '')} TL")
+    def log_success(self, row_data: Transaction | dict[str, str | float], status: str = "BAŞARILI") -> None:
+        """İşlem sonucunu kaydet (Transaction veya satır sözlüğü)."""
+        tarih, aciklama, tutar = self._result_fields(row_data)
         result = {
-            "Zaman": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "Tarih": row_data.get("Tarih", ""),
-            "Açıklama": row_data.get("Açıklama", ""),
-            "Tutar": row_data.get("Tutar", ""),
+            "Zaman": timestamp(),
+            "Tarih": tarih,
+            "Açıklama": aciklama,
+            "Tutar": tutar,
             "Durum": status,
         }
-        self.results.append(result)
-        self.log_info(
-            f"İşlem kaydedildi: {row_data.get('Açıklama', '')} - {row_data.get('Tutar', '')} TL"
+        # Sonuç anında diske eklenir; çökmede yalnızca yarım satır kaybolur
+        self.sink.append(result)
+        self.logger.info(
+            f"İşlem kaydedildi: {aciklama} - {tutar} TL",
+            extra={"fields": {"tarih": tarih, "tutar": str(tutar), "durum": status}},
         )
 
     def save_results(self) -> None:
-        """Sonuçları Excel'e kaydet."""
-        if self.results:
-            df = pd.DataFrame(self.results)
-            Path("../data").mkdir(exist_ok=True)
-            df.to_excel("../data/sonuclar.xlsx", index=False)
-            self.log_info(f"Sonuçlar kaydedildi: {len(self.results)} işlem")
+        """Biriken sonuçlardan Excel raporu üret."""
+        self.sink.close()
+        count = self.sink.to_xlsx(RESULTS_XLSX_PATH, numeric_columns=("Tutar",))
+        if count:
+            self.log_info(f"Sonuçlar kaydedildi: {count} işlem")
@@ -0,0 +1,107 @@
+"""
+POSH Ayrıştırıcı - banka ekstresi açıklamaları
+Tek derlenmiş regex satırı doğrular ve tüm alanları tek geçişte yakalar
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Filtreleme için gevşek kontrol: POSH ile başlar, 15 haneli referansla biter
+POSH_PATTERN = r'^POSH.*\/\d{15}$'
+# Alanları tek geçişte yakalar; yapı tutmazsa grup atlanır ve yalnızca
+# referans yakalanır, böylece POSH_PATTERN ile aynı satırlar eşleşir
+POSH_FIELDS_PATTERN = (
+    r'^POSH'
+    r'(?:/(?P<tarih>\d{8})/(?P<isyeri>\d+)/(?P<terminal>[A-Z0-9]+)\s+\S\s+P\s+'
+    r'(?P<islem>[^/]*)(?=/\d{15}$))?'
+    r'.*/(?P<referans>\d{15})$'
+)
+
+POSH_RE = re.compile(POSH_PATTERN)
+POSH_FIELDS_RE = re.compile(POSH_FIELDS_PATTERN)
+
+POS_SATIS = 'POS Satış'
+UIY_KOMISYON = 'ÜİY Komisyon'
+DIGER = 'Diğer'
+
+
+class PoshFields(NamedTuple):
+    """Bir POSH açıklamasının alanları (yapı alanları yoksa None)"""
+
+    tarih: Optional[str]
+    isyeri: Optional[str]
+    terminal: Optional[str]
+    islem: Optional[str]
+    referans: str
+    tip: str
+
+
+def is_posh(aciklama: str) -> bool:
+    """Açıklama POSH satırı mı (POSH_PATTERN ile aynı kural)"""
+    return POSH_RE.match(aciklama) is not None
+
+
+def classify(text: str) -> str:
+    """İşlem metnini 'POS Satış' / 'ÜİY Komisyon' / 'Diğer' olarak sınıflandır"""
+    if POS_SATIS in text:
+        return POS_SATIS
+    if UIY_KOMISYON in text:
+        return UIY_KOMISYON
+    return DIGER
+
+
+def parse_posh(aciklama: str) -> Optional[PoshFields]:
+    """Tek regex geçişiyle ayrıştır; POSH değilse None"""
+    match = POSH_FIELDS_RE.match(aciklama)
+    if match is None:
+        return None
+    tarih, isyeri, terminal, islem, referans = match.groups()
+    if islem is None:
+        # Yapısal alan yoksa tür tüm açıklamadan belirlenir
+        tip = classify(aciklama)
+    else:
+        # Açgözlü yakalama geri izlemeyi önler; sondaki boşluklar burada atılır
+        islem = islem.rstrip()
+        tip = classify(islem)
+    return PoshFields(tarih, isyeri, terminal, islem, referans, tip)
+
+
+def extract_posh_fields(column: pd.Series) -> pd.DataFrame:
+    """Bütün sütun için parse_posh: tarih, isyeri, terminal, islem, referans, tip (POSH olmayan satırlar NaN)"""
+    # numpy/pandas yalnızca sütun işlemlerinde yüklenir (GUI tek satır classify'ı kullanır)
+    import numpy as np
+    import pandas as pd
+
+    text = column.astype(object).where(column.notna(), '').astype(str)
+    fields = text.str.extract(POSH_FIELDS_RE)
+    fields['islem'] = fields['islem'].str.rstrip()
+    kaynak = fields['islem'].where(fields['islem'].notna(), text)
+    tip = np.select(
+        [kaynak.str.contains(POS_SATIS, regex=False), kaynak.str.contains(UIY_KOMISYON, regex=False)],
+        [POS_SATIS, UIY_KOMISYON],
+        DIGER,
+    )
+    fields['tip'] = pd.Series(tip, index=fields.index, dtype=object).where(fields['referans'].notna())
+    return fields
+
+
+def reference_key(aciklama: str) -> Optional[str]:
+    """Tekrar anahtarı '<referans>:<tip>' (satış ve komisyonu aynı referansı paylaşır); POSH değilse None"""
+    fields = parse_posh(aciklama)
+    return None if fields is None else f"{fields.referans}:{fields.tip}"
+
+
+def reference_keys(column: pd.Series) -> pd.Series:
+    """Bütün sütun için reference_key (POSH olmayan satırlar NaN)"""
+    return reference_keys_from_fields(extract_posh_fields(column))
+
+
+def reference_keys_from_fields(fields: pd.DataFrame) -> pd.Series:
+    """extract_posh_fields çıktısından reference_key değerleri"""
+    return (fields['referans'] + ':' + fields['tip']).where(fields['referans'].notna())
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
-import time
 import threading
 import tkinter as tk
 from tkinter import messagebox
 
 from data_reader import DataReader
 from logger import RPALogger
+from pacing import PacingScheduler
+from structured_log import start_run
 
 
 class RPABot:
     """Excel verilerini GUI'ye otomatik giren bot."""
 
-    # İşlemler arası bekleme süresi (saniye)
+    # İşlemler arası bekleme süresi (saniye); pacer bu bütçeyle bekler
     WAIT_BETWEEN_OPS = 1.6
 
     def __init__(self, gui_title: str = "Menü / Dashboard") -> None:
@@ -23,6 +24,8 @@ class RPABot:
         self.logger = RPALogger()
         self.is_running = False
         self.current_progress = 0
+        # Beklemeler loglamadan ayrı; toplu çalıştırmada set_factor(0) ile kapatılır
+        self.pacer = PacingScheduler(budgets={"record": self.WAIT_BETWEEN_OPS})
 
     def _find_gui(self) -> bool:
         """GUI penceresini bulur"""
@@ -50,8 +53,8 @@ class RPABot:
         self.logger.log_info(f"GUI referansı ayarlandı: {self.gui_title}")
         return True
 
-    def run(self) -> None:
-        """Botu çalıştır."""
+    def run(self, resume: bool = False) -> None:
+        """Botu çalıştır; ``resume`` ile yarıda kalan çalıştırmaya devam eder."""
         if not self.reader.read_excel() or not self.reader.validate_data():
             self.logger.log_error("Veri okunamadı veya doğrulanamadı")
             return
@@ -60,22 +63,34 @@ class RPABot:
         if not self._find_gui():
             return
 
+        self.pacer.reset()
+        self.logger.log_info(f"Çalıştırma kimliği: {start_run()}")
+        if resume:
+            done = self.logger.committed_keys()
+            self.logger.log_info(f"Devam modu: {len(done)} satır daha önce işlenmiş")
+        else:
+            done = set()
+            self.logger.reset_results()
+
         for idx, row in enumerate(data_list, start=1):
+            if done and self.logger.result_key(row) in done:
+                continue
             self.logger.log_info(f"{idx}. satır işleniyor")
             try:
                 self.gui_window.add_transaction_via_popup(row)
                 self.logger.log_success(row)
-                time.sleep(self.WAIT_BETWEEN_OPS)
+                self.pacer.pause(action="record")
             except Exception as exc:  # pragma: no cover - otomasyon hataları
                 self.logger.log_error(str(exc))
+        self.logger.log_info(f"Bekleme/iş dağılımı: {self.pacer.format_stats()}")
         self.logger.save_results()
 
-    def run_automation_threaded(self, gui_callback=None):
+    def run_automation_threaded(self, gui_callback=None, resume: bool = False):
         """RPA'yı ayrı thread'de çalıştırır (GUI donmaması için)."""
 
         def automation_worker():
             self.is_running = True
-            self.run()
+            self.run(resume=resume)
             if gui_callback:
                 gui_callback("completed")
             self.is_running = False
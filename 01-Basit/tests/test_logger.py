@@ -0,0 +1,52 @@
+from datetime import date
+
+import pytest
+
+import logger as logger_module
+from logger import RPALogger
+from transaction import Transaction
+
+
+@pytest.fixture
+def results_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "sonuclar.jsonl"
+    monkeypatch.setattr(logger_module, "RESULTS_PATH", str(path))
+    monkeypatch.setattr(logger_module, "RESULTS_XLSX_PATH", str(tmp_path / "sonuclar.xlsx"))
+    return path
+
+
+def test_resume_finds_rows_saved_before_a_crash(results_path):
+    saved = Transaction(date(2025, 7, 23), "POSH/1", 67099)
+    failed = Transaction(date(2025, 7, 23), "POSH/2", 100)
+    first_run = RPALogger()
+    first_run.log_success(saved)
+    first_run.log_success(failed, status="HATA")
+    first_run.log_success({"Tarih": "24.07.2025", "Açıklama": "POSH/3", "Tutar": 5})
+
+    # Yeni süreç: sonuç dosyası diskten okunur
+    done = RPALogger().committed_keys()
+
+    assert first_run.result_key(saved) in done
+    assert first_run.result_key(failed) not in done
+    assert ("24.07.2025", "POSH/3", "5") in done
+
+
+def test_fresh_run_forgets_previous_results(results_path):
+    first_run = RPALogger()
+    first_run.log_success(Transaction(date(2025, 7, 23), "POSH/1", 67099))
+    first_run.sink.close()
+
+    second_run = RPALogger()
+    second_run.reset_results()
+
+    assert second_run.committed_keys() == set()
+
+
+def test_save_results_writes_the_report(results_path, tmp_path):
+    run = RPALogger()
+    run.log_success(Transaction(date(2025, 7, 23), "POSH/1", 67099))
+
+    run.save_results()
+
+    assert (tmp_path / "sonuclar.xlsx").exists()
@@ -3,6 +3,9 @@ from tkinter import ttk, messagebox
 import pandas as pd
 from datetime import datetime
 
+from dashboard_stats import DashboardStats
+from virtual_table import VirtualTable
+
 class AdvancedAccountingGUI:
     def __init__(self):
         self.root = tk.Tk()
@@ -13,6 +16,7 @@ class AdvancedAccountingGUI:
         # Veri depolama
         self.main_data = []  # Ana tablodaki kayıtlar
         self.current_records = []  # Excel'den okunan kayıtlar
+        self.dashboard_stats = DashboardStats()  # Kart sayaçları (main_data taranmaz)
         
         # GUI'yi öne getir
         self.root.lift()
@@ -157,6 +161,24 @@ class AdvancedAccountingGUI:
                                                  font=('Arial', 24, 'bold'))
         self.today_transactions_label.pack()
         
+        # Kart 3: Toplam Tutar
+        card3 = ttk.LabelFrame(info_frame, text="Toplam Tutar", 
+                               padding=20, style='Card.TLabelframe')
+        card3.pack(side='left', fill='both', expand=True, padx=10)
+        
+        self.total_amount_label = ttk.Label(card3, text="0.00 TL", 
+                                           font=('Arial', 24, 'bold'))
+        self.total_amount_label.pack()
+        
+        # Kart 4: Ortalama Tutar
+        card4 = ttk.LabelFrame(info_frame, text="Ortalama Tutar", 
+                               padding=20, style='Card.TLabelframe')
+        card4.pack(side='left', fill='both', expand=True, padx=10)
+        
+        self.average_amount_label = ttk.Label(card4, text="0.00 TL", 
+                                             font=('Arial', 24, 'bold'))
+        self.average_amount_label.pack()
+        
         # Ana tablo (tüm kayıtlar)
         self.create_main_table()
         
@@ -204,9 +226,9 @@ class AdvancedAccountingGUI:
         ttk.Label(table_frame, text="📋 Tüm İşlem Kayıtları", 
                  font=('Arial', 12, 'bold')).pack(anchor='w', pady=(0, 10))
         
-        # Treeview
+        # Sanal tablo: yalnizca gorunen satirlar cizilir, kaynak main_data listesi
         columns = ['ID', 'Tarih', 'Açıklama', 'Tutar', 'Durum', 'Zaman']
-        self.main_tree = ttk.Treeview(table_frame, columns=columns, show='headings', height=15)
+        self.main_tree = VirtualTable(table_frame, columns, self.main_data, self.main_row_values, height=15)
         
         # Sütun ayarları
         widths = [50, 100, 400, 120, 100, 150]
@@ -214,13 +236,14 @@ class AdvancedAccountingGUI:
             self.main_tree.heading(col, text=col)
             self.main_tree.column(col, width=width, anchor='center' if i in [0, 1, 4, 5] else 'w')
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(table_frame, orient='vertical', command=self.main_tree.yview)
-        self.main_tree.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack
-        self.main_tree.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
+        # Pack (kaydirma cubugu tablonun icinde)
+        self.main_tree.pack(fill='both', expand=True)
+
+    @staticmethod
+    def main_row_values(row):
+        """main_data kaydinin tablo sutunlari"""
+        return [row['id'], row['date'], row['description'], f"{row['amount']:.2f} TL",
+                row['status'], row['time']]
         
     def create_status_bar(self):
         """Alt durum çubuğu"""
@@ -334,18 +357,19 @@ class AdvancedAccountingGUI:
         
         if not all([date_val, desc_val, amount_val]):
             messagebox.showwarning("Uyarı", "Lütfen tüm alanları doldurun!")
-            return
+            return False
             
         try:
             amount_float = float(amount_val.replace(',', '.'))
         except ValueError:
             messagebox.showerror("Hata", "Geçersiz tutar formatı!")
-            return
+            return False
             
         # Ana tabloya ekle
         record_id = len(self.main_data) + 1
         timestamp = datetime.now().strftime('%H:%M:%S')
         
+        self.dashboard_stats.add(date_val, amount_float, description=desc_val)
         self.main_data.append({
             'id': record_id,
             'date': date_val,
@@ -355,20 +379,14 @@ class AdvancedAccountingGUI:
             'time': timestamp
         })
         
-        # Ana tabloyu güncelle
-        self.main_tree.insert('', 'end', values=[
-            record_id, date_val, desc_val, f"{amount_float:.2f} TL",
-            'Kaydedildi', timestamp
-        ])
-        print(f"DEBUG: main_tree children: {len(self.main_tree.get_children())}")
+        # Ana tabloyu güncelle (yalnızca görünen satırlar yeniden çizilir)
+        self.main_tree.notify_appended()
         
         # Dashboard'u güncelle
         self.update_dashboard_stats()
 
         # Tablo en alta scroll et (yeni kayıt görünsün)
-        children = self.main_tree.get_children()
-        if children:
-            self.main_tree.see(children[-1])
+        self.main_tree.see_end()
 
         # Dashboard'ı highlight et (0.5 saniye)
         self.total_transactions_label.config(foreground='#A3BE8C')
@@ -381,6 +399,7 @@ class AdvancedAccountingGUI:
         self.modal_status.config(text=f"✅ Kayıt {record_id} başarıyla kaydedildi!", 
                                 foreground='green')
         self.update_status(f"Yeni kayıt eklendi: ID {record_id}")
+        return True
         
     def clear_form(self):
         """Formu temizle"""
@@ -392,11 +411,11 @@ class AdvancedAccountingGUI:
         
     def update_dashboard_stats(self):
         """Dashboard istatistiklerini güncelle"""
-        total = len(self.main_data)
-        today = len([r for r in self.main_data if r['date'] == datetime.now().strftime('%d.%m.%Y')])
-        
-        self.total_transactions_label.config(text=str(total))
-        self.today_transactions_label.config(text=str(today))
+        stats = self.dashboard_stats
+        self.total_transactions_label.config(text=str(stats.total))
+        self.today_transactions_label.config(text=str(stats.today))
+        self.total_amount_label.config(text=f"{stats.total_amount:,.2f} TL")
+        self.average_amount_label.config(text=f"{stats.average_amount:,.2f} TL")
         
     def search_records(self):
         """Kayıt arama"""
@@ -424,12 +443,11 @@ class AdvancedAccountingGUI:
         preview.title("Yüklenen Veriler")
 
         columns = list(self.current_records[0].keys())
-        tree = ttk.Treeview(preview, columns=columns, show="headings", height=15)
+        tree = VirtualTable(preview, columns, self.current_records,
+                            lambda rec: [rec.get(col, "") for col in columns], height=15, follow=False)
         for col in columns:
             tree.heading(col, text=col.title())
             tree.column(col, width=150, anchor="w")
-        for rec in self.current_records:
-            tree.insert("", "end", values=[rec.get(col, "") for col in columns])
         tree.pack(fill="both", expand=True, padx=10, pady=10)
 
         ttk.Button(preview, text="Kapat", command=preview.destroy).pack(pady=5)
@@ -445,7 +463,7 @@ class AdvancedAccountingGUI:
         self.root.mainloop()
 
     def set_current_records(self, records):
-        """Excel'den okunan kayıtları ata"""
+        """Excel'den okunan kayıtları ata (Transaction veya dict)"""
         self.current_records = list(records)
 
 # Test
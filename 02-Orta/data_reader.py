@@ -1,6 +1,90 @@
+from collections.abc import Iterator
+import re
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from excel_cache import read_excel_cached
+from posh_parser import POSH_PATTERN, extract_posh_fields, reference_keys
+from transaction import StatementRecords, dates_from_column, kurus_from_column, kurus_or_invalid, parse_date
+
+
+def _column_as_text(column: pd.Series) -> list[str]:
+    """Convert a whole column to ``str`` values exactly like ``str(value)``."""
+    return np.asarray(column.astype(object)).astype(str).tolist()
+
+
+def extract_records(filtered: pd.DataFrame, aciklama_col) -> StatementRecords:
+    """Filtrelenmis tablodan tipli kayitlari iterrows kullanmadan, sutun islemleriyle uret."""
+    row_count = len(filtered)
+    column_count = len(filtered.columns)
+    tarih = dates_from_column(filtered.iloc[:, 0]) if column_count > 0 else [None] * row_count
+    aciklama_values = filtered[aciklama_col]
+    aciklama = _column_as_text(aciklama_values.where(aciklama_values.notna(), ""))
+    if column_count > 3:
+        tutar = kurus_from_column(filtered.iloc[:, 3])
+    else:
+        tutar = np.zeros(row_count, dtype=np.int64)
+    return StatementRecords(tarih, aciklama, tutar)
+
+
+def description_index(header) -> int:
+    """Baslik satirinda 'Aciklama' sutununun indeksini bul; yoksa varsayilan 2."""
+    return next((i for i, col in enumerate(header) if 'açıklama' in str(col).lower()), 2)
+
+
+def iter_posh_rows(excel_path, header_row: int = 23,
+                   pattern: str = POSH_PATTERN) -> Iterator[tuple]:
+    """Read-only openpyxl ile satirlari tek tek okuyup eslesen POSH satirlarini uret.
+
+    Baslik satirindan onceki satirlar atlanir, regex okuma sirasinda uygulanir;
+    tablo bellege alinmadigi icin bellek yalnizca eslesme sayisiyla buyur.
+    Her eleman ``(baslik, satir)`` ikilisidir.
+    """
+    from openpyxl import load_workbook
+
+    matcher = re.compile(pattern)
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(min_row=header_row + 1, values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        aciklama_idx = description_index(header)
+        for row in rows:
+            if len(row) <= aciklama_idx:
+                continue
+            aciklama = row[aciklama_idx]
+            if aciklama is not None and matcher.match(str(aciklama)):
+                yield header, row
+    finally:
+        workbook.close()
+
+
+def stream_records(excel_path, header_row: int = 23) -> StatementRecords:
+    """Akis modunda okunan POSH satirlarini tipli tarih/aciklama/tutar sutunlarina topla."""
+    tarih, aciklama, tutar = [], [], []
+    aciklama_idx = None
+    for header, row in iter_posh_rows(excel_path, header_row):
+        if aciklama_idx is None:
+            aciklama_idx = description_index(header)
+        tarih.append(parse_date(row[0]))
+        aciklama.append(str(row[aciklama_idx]))
+        tutar.append(kurus_or_invalid(row[3]) if len(row) > 3 else 0)
+    return StatementRecords(tarih, aciklama, np.array(tutar, dtype=np.int64))
+
+
+def drop_known_references(records: StatementRecords, index) -> tuple[StatementRecords, int]:
+    """Referans dizininde (ReferenceIndex) zaten bulunan kayitlari at; (kalanlar, atlanan) doner."""
+    if index is None or not len(records):
+        return records, 0
+    keys = reference_keys(pd.Series(records.descriptions(), dtype=object))
+    known = index.known_mask([key if isinstance(key, str) else None for key in keys.tolist()])
+    skipped = sum(known)
+    if not skipped:
+        return records, 0
+    return records.select([not is_known for is_known in known]), skipped
+
 
 class DataReader:
     """Excel dosyasini okuyup regex filtresi uygulayan sinif."""
@@ -14,7 +98,7 @@ class DataReader:
         self.tutar_col: str | None = None
         # row index that contains the real headers in the Excel file
         self.header_row = 23
-        self.pattern = r'^POSH.*\/\d{15}$'
+        self.pattern = POSH_PATTERN
 
     def read_excel(self) -> bool:
         try:
@@ -22,7 +106,7 @@ class DataReader:
                 raise FileNotFoundError(f"Excel dosyasi bulunamadi: {self.file_path}")
             # the excel contains informational rows before the headers,
             # therefore pass the known header row index when reading
-            self.data = pd.read_excel(self.file_path, header=self.header_row)
+            self.data = read_excel_cached(self.file_path, header=self.header_row)
             print(f"\u2705 Excel okundu: {len(self.data)} satir")
             return True
         except Exception as exc:
@@ -55,6 +139,12 @@ class DataReader:
 
         self.tutar_col = tutar_col
 
-        filtered = self.data[self.data[aciklama_col].astype(str).str.match(self.pattern, na=False)]
+        if self.pattern == POSH_PATTERN:
+            # filtre ve alan cikarimi tek vektorel gecis; POSH olmayan satirda referans NaN
+            fields = extract_posh_fields(self.data[aciklama_col])
+            mask = fields['referans'].notna()
+        else:
+            mask = self.data[aciklama_col].astype(str).str.match(self.pattern, na=False)
+        filtered = self.data[mask]
         print(f"🔍 Pattern eslesmesi: {len(filtered)} kayit")
         return filtered.to_dict("records")
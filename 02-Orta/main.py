@@ -1,12 +1,34 @@
 """Gelişmiş RPA Sistemi - Ana Program"""
 
 from __future__ import annotations
+import argparse
 import threading
 import time
 
 # Global GUI referansı
 gui_app = None
 
+# Komut satırından gelen bot ayarları
+bot_options = {}
+
+def parse_command_line_args(argv=None) -> argparse.Namespace:
+    """Komut satırı argümanlarını parse et"""
+    parser = argparse.ArgumentParser(description='Gelişmiş RPA Sistemi')
+    parser.add_argument('--streaming', action='store_true',
+                       help='Büyük ekstreleri satır satır akış modunda oku')
+    parser.add_argument('--dedupe', action='store_true',
+                       help='Daha önce girilmiş işlemleri (referanslar.sqlite) atla')
+    return parser.parse_args(argv)
+
+def create_bot():
+    """Komut satırı ayarlarıyla RPA bot'unu oluştur"""
+    from rpa_bot import AdvancedRPABot
+
+    bot = AdvancedRPABot()
+    for name, value in bot_options.items():
+        setattr(bot, name, value)
+    return bot
+
 def start_gui() -> None:
     """Sadece GUI'yi başlat"""
     global gui_app
@@ -23,9 +45,7 @@ def start_bot() -> None:
         print("❌ Önce GUI'yi açın (Seçenek 1 veya 3)")
         return
 
-    from rpa_bot import AdvancedRPABot
-    
-    bot = AdvancedRPABot()
+    bot = create_bot()
     bot.set_gui_reference(gui_app)
     bot.run()
 
@@ -37,9 +57,7 @@ def start_bot_threaded() -> threading.Thread | None:
         print("❌ GUI referansı bulunamadı")
         return None
 
-    from rpa_bot import AdvancedRPABot
-    
-    bot = AdvancedRPABot()
+    bot = create_bot()
     bot.set_gui_reference(gui_app)
     return bot.run()
 
@@ -97,6 +115,10 @@ def show_demo_info():
 
 def main() -> None:
     """Ana menü"""
+    args = parse_command_line_args()
+    bot_options['streaming'] = args.streaming
+    bot_options['dedupe'] = args.dedupe
+
     while True:
         print("\n" + "="*50)
         print("🤖 GELİŞMİŞ RPA SİSTEMİ")
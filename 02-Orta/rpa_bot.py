@@ -1,10 +1,16 @@
-import time
 import threading
-import pandas as pd
 from pathlib import Path
 import tkinter as tk
 import pyautogui
 
+from data_reader import drop_known_references, extract_records, stream_records
+from excel_cache import read_excel_cached
+from pacing import PacingScheduler
+from structured_log import get_logger, start_run
+from posh_parser import POSH_PATTERN, reference_key
+from reference_index import ReferenceIndex
+from transaction import as_transaction
+
 class AdvancedRPABot:
     """Gerçekçi RPA botu - Presto benzeri akış"""
     
@@ -13,33 +19,60 @@ class AdvancedRPABot:
         self.is_running = False
         self.excel_data = []
         self.current_record_index = 0
+        # True: Excel tablo olarak yuklenmeden satir satir akis modunda okunur
+        self.streaming = False
+        # Beklemeler loglamadan ayri; toplu calistirmada pacer.set_factor(0)
+        self.pacer = PacingScheduler()
+        # Kuyruk tabanli log: dosya ve konsol arka planda yazilir
+        self.logger = get_logger("rpa.orta", file_name="rpa_orta.jsonl",
+                                 console_format="[RPA] %(message)s")
+        # True: daha once girilmis islemler atlanir (Excel'in yanindaki referanslar.sqlite).
+        # Varsayilan kapali (main.py --dedupe ile acilir): demo her calistirmada ayni ekstreyi bastan girer
+        self.dedupe = False
+        self.reference_index = None
+        self.duplicates_skipped = 0
+        self.source_name = ""
         
     def set_gui_reference(self, gui_app):
         """GUI referansını ayarla"""
         self.gui = gui_app
         print("✅ GUI referansı ayarlandı")
         
-    def log_step(self, message, delay=0.5):
-        """Adımları logla ve bekle"""
-        print(f"[RPA] {message}")
+    def log(self, message):
+        """Mesajı log kuyruğuna, GUI durumunu engellemeden Tk kuyruğuna bırak"""
+        self.logger.info(message)
         if self.gui:
-            self.gui.update_status(f"RPA: {message}")
-        time.sleep(delay)
+            try:
+                self.gui.root.after(0, self.gui.update_status, f"RPA: {message}")
+            except (tk.TclError, RuntimeError):
+                pass
+
+    def log_step(self, message, delay=0.5):
+        """Adımı logla, ardından pacer ile bekle"""
+        self.log(message)
+        self.pacer.pause(delay)
 
     def call_in_gui_thread(self, func, *args, **kwargs):
         """Tkinter ana döngüsünde fonksiyon çalıştır"""
         if not self.gui:
-            return
+            return None
         done = threading.Event()
+        outcome = {}
 
         def wrapper():
             try:
-                func(*args, **kwargs)
+                outcome['result'] = func(*args, **kwargs)
+            except Exception as exc:
+                outcome['error'] = exc
             finally:
                 done.set()
 
         self.gui.root.after(0, wrapper)
         done.wait()
+        # GUI tarafındaki hata çağırana iletilir (Tk geri çağrısında kaybolmasın)
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('result')
         
     def click_simulation(self, widget_name, delay=0.5):
         """Widget tıklama simülasyonu"""
@@ -59,7 +92,7 @@ class AdvancedRPABot:
         if widget is not None:
             self.call_in_gui_thread(self.move_mouse_to_widget, widget)
 
-        time.sleep(delay)
+        self.pacer.pause(delay, "click")
         self.log_step(f"✅ {widget_name} tıklandı", 0.25)
 
     def move_mouse_to_widget(self, widget):
@@ -97,12 +130,23 @@ class AdvancedRPABot:
             if not excel_path.exists():
                 excel_path = Path("data/Vadesiz_Hesap_Detay.xlsx")
                 
-            if excel_path.exists():
+            if excel_path.exists() and self.dedupe and self.reference_index is None:
+                self.reference_index = ReferenceIndex(excel_path.parent / "referanslar.sqlite")
+            self.source_name = excel_path.name
+                
+            if excel_path.exists() and self.streaming:
+                # Akış modu: read-only satır okuma, filtre okuma sırasında uygulanır
+                self.excel_data.extend(self.drop_duplicates(stream_records(excel_path, header_row=23)))
+                # Tüm kayıtlar mükerrer olsa da dosya okundu; test verisine düşülmez
+                self.log_step(f"✅ {len(self.excel_data)} adet geçerli kayıt bulundu", 0.5)
+                return True
+                
+            elif excel_path.exists():
                 # Excel'i header satırından oku
-                raw_data = pd.read_excel(excel_path, header=23)
+                raw_data = read_excel_cached(excel_path, header=23)
                 
                 # POSH pattern'i ile filtrele
-                pattern = r'^POSH.*\/\d{15}$'
+                pattern = POSH_PATTERN
                 
                 # Açıklama sütununu bul
                 aciklama_cols = [col for col in raw_data.columns if 'açıklama' in str(col).lower()]
@@ -110,17 +154,8 @@ class AdvancedRPABot:
                     aciklama_col = aciklama_cols[0]
                     filtered_data = raw_data[raw_data[aciklama_col].astype(str).str.match(pattern, na=False)]
                     
-                    # Veriyi işle
-                    for _, row in filtered_data.iterrows():
-                        tarih = str(row.iloc[0]) if len(row) > 0 else ""
-                        aciklama = str(row[aciklama_col]) if pd.notna(row[aciklama_col]) else ""
-                        tutar = str(row.iloc[3]) if len(row) > 3 else "0"
-                        
-                        self.excel_data.append({
-                            'tarih': tarih,
-                            'aciklama': aciklama,
-                            'tutar': tutar
-                        })
+                    # Veriyi işle (sütun bazlı)
+                    self.excel_data.extend(self.drop_duplicates(extract_records(filtered_data, aciklama_col)))
                         
                     self.log_step(f"✅ {len(self.excel_data)} adet geçerli kayıt bulundu", 0.5)
                     return True
@@ -134,6 +169,14 @@ class AdvancedRPABot:
             self.create_test_data()
             return True
             
+    def drop_duplicates(self, records):
+        """Referans dizininde olan (önceden girilmiş) kayıtları filtre aşamasında at"""
+        records, skipped = drop_known_references(records, self.reference_index)
+        if skipped:
+            self.duplicates_skipped += skipped
+            self.log_step(f"🗂️ {skipped} mükerrer kayıt (önceden girilmiş) atlandı", 0.5)
+        return records
+
     def create_test_data(self):
         """Test verisi oluştur"""
         self.log_step("🧪 Test verisi oluşturuluyor...", 0.5)
@@ -146,44 +189,53 @@ class AdvancedRPABot:
             {"tarih": "24.07.2025", "aciklama": "POSH/20250724/000000002391280/N001 N P POS Satış /000001661601485", "tutar": "4559.47"},
         ]
         
-        self.excel_data = test_records
+        self.excel_data = [as_transaction(record) for record in test_records]
         self.log_step(f"✅ {len(self.excel_data)} test kaydı hazırlandı", 0.5)
         
     def process_single_record(self, record):
-        """Tek kaydı işle - Form doldur ve kaydet"""
-        self.log_step(f"📝 Kayıt işleniyor: {record['aciklama'][:50]}...", 0.5)
+        """Tek kaydı işle - Form doldur ve kaydet (Transaction veya eski dict)"""
+        record = as_transaction(record)
+        self.log_step(f"📝 Kayıt işleniyor: {record.aciklama[:50]}...", 0.5)
         
-        # 1. Tarih alanına tıkla ve veri gir
+        # 1. Tarih alanına tıkla ve veri gir (metne yalnızca form sınırında çevrilir)
+        tarih = record.tarih_text()
         self.click_simulation("Tarih alanı")
         self.call_in_gui_thread(self.gui.date_entry.delete, 0, tk.END)
-        self.call_in_gui_thread(self.gui.date_entry.insert, 0, record['tarih'])
-        self.log_step(f"📅 Tarih girildi: {record['tarih']}", 0.5)
+        self.call_in_gui_thread(self.gui.date_entry.insert, 0, tarih)
+        self.log_step(f"📅 Tarih girildi: {tarih}", 0.5)
         
         # 2. Açıklama alanına tıkla ve veri gir
         self.click_simulation("Açıklama alanı")
         self.call_in_gui_thread(self.gui.desc_entry.delete, 0, tk.END)
         
         # Açıklamayı kısalt
-        short_desc = record['aciklama'][:80] + "..." if len(record['aciklama']) > 80 else record['aciklama']
+        short_desc = record.aciklama[:80] + "..." if len(record.aciklama) > 80 else record.aciklama
         self.call_in_gui_thread(self.gui.desc_entry.insert, 0, short_desc)
         self.log_step(f"📝 Açıklama girildi: {short_desc[:30]}...", 0.5)
         
         # 3. Tutar alanına tıkla ve veri gir
         self.click_simulation("Tutar alanı")
         self.call_in_gui_thread(self.gui.amount_entry.delete, 0, tk.END)
-        self.call_in_gui_thread(self.gui.amount_entry.insert, 0, record['tutar'])
-        self.log_step(f"💰 Tutar girildi: {record['tutar']} TL", 0.5)
+        tutar = record.tutar_text()
+        self.call_in_gui_thread(self.gui.amount_entry.insert, 0, tutar)
+        self.log_step(f"💰 Tutar girildi: {tutar} TL", 0.5)
         
         # 4. Kaydet butonuna tıkla
         self.click_simulation("Kaydet butonu", 1)
-        self.call_in_gui_thread(self.gui.save_current_record)
-        self.log_step("✅ Kayıt başarıyla kaydedildi", 0.5)
+        saved = self.call_in_gui_thread(self.gui.save_current_record)
+        if saved:
+            self.log_step("✅ Kayıt başarıyla kaydedildi", 0.5)
+        else:
+            self.log_step("❌ Kayıt kaydedilemedi", 0.5)
         
         # 5. Kısa bekleme
         self.log_step("⏳ Sonraki kayıt için hazırlanıyor...", 0.75)
+        return bool(saved)
         
     def run_automation_sequence(self):
         """Ana otomasyon sekansı"""
+        self.pacer.reset()
+        self.log(f"🆔 Çalıştırma kimliği: {start_run()}")
         self.log_step("🤖 RPA Otomasyonu başlatılıyor...", 1)
         
         try:
@@ -211,13 +263,22 @@ class AdvancedRPABot:
                 
             # 4. Her kayıt için döngü
             total_records = len(self.excel_data)
+            saved_records = 0
             self.log_step(f"🔄 {total_records} kayıt işlenecek", 1)
             
             for i, record in enumerate(self.excel_data, 1):
                 self.log_step(f"--- İŞLEM {i}/{total_records} ---", 0.5)
                 
-                # Kaydı işle
-                self.process_single_record(record)
+                # Kaydı işle; referans yalnızca başarılı girişte eklenir (başarısız kayıt sonraki çalıştırmada tekrar denenir)
+                try:
+                    saved = self.process_single_record(record)
+                except Exception as exc:
+                    self.log_step(f"❌ Kayıt hatası: {exc}", 0.5)
+                    saved = False
+                if saved:
+                    saved_records += 1
+                    if self.reference_index is not None:
+                        self.reference_index.add_many([reference_key(as_transaction(record).aciklama)], self.source_name)
                 
                 # İlerleme raporu
                 if i % 5 == 0:
@@ -225,7 +286,12 @@ class AdvancedRPABot:
                     
             # Tamamlandı
             self.log_step("🎉 TÜM KAYITLAR BAŞARIYLA İŞLENDİ!", 1.5)
-            self.log_step(f"📈 Sonuç: {total_records} kayıt ana tabloya eklendi", 0.5)
+            self.log_step(f"📈 Sonuç: {saved_records}/{total_records} kayıt ana tabloya eklendi", 0.5)
+            self.log(f"🐢 Bekleme/iş dağılımı: {self.pacer.format_stats()}")
+            if self.reference_index is not None:
+                stats = self.reference_index.stats()
+                self.log(f"🗂️ Referans dizini: {stats['size']} kayıt, mükerrer atlanan {self.duplicates_skipped}, "
+                         f"Bloom eledi {stats['bloom_rejected']}/{stats['checked']}")
             
         except Exception as e:
             self.log_step(f"❌ RPA Sistemi Hatası: {e}", 0.5)
@@ -0,0 +1,58 @@
+from datetime import date
+
+import numpy as np
+from openpyxl import Workbook
+
+from data_reader import description_index, drop_known_references, stream_records
+from posh_parser import reference_key
+from reference_index import ReferenceIndex
+from transaction import StatementRecords
+
+SALE = 'POSH/20250723/000000002391280/N042 K P POS Satış                /000001660659421'
+COMMISSION = 'POSH/20250723/000000002391280/N042 K P ÜİY Komisyon            /000001660659421'
+OTHER_SALE = 'POSH/20250724/000000002391280/N042 K P POS Satış                /000001660659999'
+
+
+def test_stream_records_reads_posh_rows_after_preamble(tmp_path):
+    workbook = Workbook()
+    sheet = workbook.active
+    for _ in range(23):
+        sheet.append(["banka ekstresi başlığı"])
+    sheet.append(["Tarih", "Saat", "Açıklama", "Tutar"])
+    sheet.append(["23.07.2025", "10:00", SALE, 670.99])
+    sheet.append(["23.07.2025", "10:05", "Havale", 10])
+    sheet.append(["24.07.2025", "11:00", OTHER_SALE, "1.234,56"])
+    path = tmp_path / "ekstre.xlsx"
+    workbook.save(path)
+
+    records = stream_records(path)
+
+    assert records.descriptions() == [SALE, OTHER_SALE]
+    assert [record.tutar_kurus for record in records] == [67099, 123456]
+    assert records[0].tarih == date(2025, 7, 23)
+
+
+def _records():
+    return StatementRecords([None] * 3, [SALE, COMMISSION, OTHER_SALE], np.array([100, 5, 200], dtype=np.int64))
+
+
+def test_drop_known_references(tmp_path):
+    index = ReferenceIndex(tmp_path / "referanslar.sqlite")
+    index.add_many([reference_key(SALE), reference_key(OTHER_SALE)])
+
+    remaining, skipped = drop_known_references(_records(), index)
+
+    assert skipped == 2
+    assert [record.aciklama for record in remaining] == [COMMISSION]
+    index.close()
+
+
+def test_drop_known_references_without_index():
+    records = _records()
+
+    assert drop_known_references(records, None) == (records, 0)
+
+
+def test_description_index_finds_header_or_defaults():
+    assert description_index(["Tarih", "Saat", "Tutar", "Açıklama"]) == 3
+    assert description_index(["Tarih", None, "Tutar"]) == 2
@@ -0,0 +1,172 @@
+"""
+Sanal Tablo - yalnızca ekrandaki satırları tutan Treeview
+Görünür satır kadar öğe havuzu; liste kaynak olarak kalır, yeniden çizimler after_idle'da birleşir
+"""
+
+from tkinter import ttk
+from typing import Any, Callable, Optional, Sequence
+
+
+class VirtualTable(ttk.Frame):
+    """Havuzlu Treeview ve dikey kaydırma çubuğu (rows büyüyebilir, formatter satırı sütun değerlerine çevirir)"""
+
+    # Ölçüm yapılamadığında kullanılan satır ve başlık yüksekliği (piksel)
+    DEFAULT_ROW_HEIGHT = 20
+    DEFAULT_HEADER_HEIGHT = 25
+
+    def __init__(self, parent, columns: Sequence[str], rows: Sequence[Any],
+                 formatter: Optional[Callable[[Any], Sequence[Any]]] = None,
+                 height: int = 12, tree_style: Optional[str] = None, follow: bool = True,
+                 **frame_kwargs):
+        super().__init__(parent, **frame_kwargs)
+        self.rows = rows
+        self.formatter = formatter or (lambda row: row)
+        self.offset = 0
+        # True: yeni satırlar eklendikçe tablo sonda kalır
+        self.follow = follow
+        self._visible = max(1, height)
+        self._row_height = self.DEFAULT_ROW_HEIGHT
+        self._header_height = self.DEFAULT_HEADER_HEIGHT
+        self._render_pending = False
+        self.render_count = 0
+
+        tree_options = {'columns': list(columns), 'show': 'headings', 'height': height}
+        if tree_style:
+            tree_options['style'] = tree_style
+        self.tree = ttk.Treeview(self, **tree_options)
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self._on_scrollbar)
+        self.tree.pack(side='left', fill='both', expand=True)
+        self.scrollbar.pack(side='right', fill='y')
+
+        self._pool = []
+        self._attached = []
+        self._resize_pool(self._visible)
+
+        self.tree.bind('<Configure>', self._on_configure)
+        # Ağacın kendi kaydırması kapatılır; kaydırma offset üzerinden yapılır
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda event: self._scroll_by(-3))
+        self.tree.bind('<Button-5>', lambda event: self._scroll_by(3))
+        self.tree.bind('<Prior>', lambda event: self._scroll_by(-self._visible))
+        self.tree.bind('<Next>', lambda event: self._scroll_by(self._visible))
+        self.tree.bind('<Home>', lambda event: self.scroll_to(0))
+        self.tree.bind('<End>', lambda event: self.see_end())
+        self.refresh()
+
+    # Treeview yapılandırması
+    def heading(self, column, **options):
+        return self.tree.heading(column, **options)
+
+    def column(self, column, **options):
+        return self.tree.column(column, **options)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def set_rows(self, rows: Sequence[Any]) -> None:
+        """Başka bir diziyi göster (ör. liste değiştirildiğinde)"""
+        self.rows = rows
+        self.offset = 0
+        self.follow = True
+        self.refresh()
+
+    def notify_appended(self, count: int = 1) -> None:
+        """rows'a count satır eklendi; yalnızca ekrandaysa yeniden çiz"""
+        if self.follow:
+            self.offset = self._max_offset()
+            self.refresh()
+        elif self.offset + self._visible > len(self.rows) - count:
+            self.refresh()
+        else:
+            # Görünmeyen ekleme: yalnızca kaydırma çubuğu güncellenir
+            self._update_scrollbar()
+
+    def see_end(self) -> None:
+        """O(1) ile son satıra kaydır ve yeni satırları izlemeye devam et"""
+        self.follow = True
+        self.offset = self._max_offset()
+        self.refresh()
+
+    def scroll_to(self, index: int) -> None:
+        self.offset = min(max(0, int(index)), self._max_offset())
+        self.follow = self.offset >= self._max_offset()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Görünür satırları olay döngüsü boşta kalınca yeniden çiz"""
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render)
+
+    def _max_offset(self) -> int:
+        return max(0, len(self.rows) - self._visible)
+
+    def _resize_pool(self, size: int) -> None:
+        while len(self._pool) < size:
+            # Yeni havuz satırı gizli başlar; _render sırasına göre yerleştirir
+            item = self.tree.insert('', 'end', values=())
+            self.tree.detach(item)
+            self._pool.append(item)
+            self._attached.append(False)
+        while len(self._pool) > size:
+            self.tree.delete(self._pool.pop())
+            self._attached.pop()
+
+    def _render(self) -> None:
+        self._render_pending = False
+        total = len(self.rows)
+        if self.follow:
+            self.offset = self._max_offset()
+        else:
+            self.offset = min(self.offset, self._max_offset())
+        rows, formatter, tree = self.rows, self.formatter, self.tree
+        for position, item in enumerate(self._pool):
+            index = self.offset + position
+            if index < total:
+                tree.item(item, values=list(formatter(rows[index])))
+                if not self._attached[position]:
+                    tree.move(item, '', position)
+                    self._attached[position] = True
+            elif self._attached[position]:
+                # Boş havuz satırları gizlenir, tablo normal bir Treeview gibi görünür
+                tree.detach(item)
+                self._attached[position] = False
+        self.render_count += 1
+        self._update_scrollbar()
+
+    def _update_scrollbar(self) -> None:
+        total = len(self.rows)
+        if total <= self._visible:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + self._visible) / total)
+
+    def _measure(self) -> None:
+        # İlk satırın kutusu gerçek başlık ve satır yüksekliğini verir
+        if self._pool and self._attached[0]:
+            bbox = self.tree.bbox(self._pool[0])
+            if bbox:
+                self._header_height, self._row_height = bbox[1], bbox[3]
+
+    def _on_configure(self, event) -> None:
+        self._measure()
+        visible = max(1, (event.height - self._header_height) // max(1, self._row_height))
+        if visible != self._visible:
+            self._visible = visible
+            self._resize_pool(visible)
+            self.refresh()
+
+    def _on_scrollbar(self, action, *args) -> None:
+        if action == 'moveto':
+            self.scroll_to(float(args[0]) * len(self.rows))
+        elif action == 'scroll':
+            step = int(args[0])
+            self._scroll_by(step * self._visible if args[1] == 'pages' else step)
+
+    def _on_mousewheel(self, event):
+        self._scroll_by(-3 if event.delta > 0 else 3)
+        return 'break'
+
+    def _scroll_by(self, lines: int):
+        self.scroll_to(self.offset + lines)
+        return 'break'
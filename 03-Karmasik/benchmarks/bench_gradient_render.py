@@ -0,0 +1,132 @@
+"""
+Gradient benchmark'ı - satır başına create_line vs önbellekli PhotoImage
+Level 3 GUI açılışta altı canvas'a gradient çizer. Eski yol her piksel
+satırı için hex renk üretip bir çizgi öğesi ekliyordu; yeni yol tek piksel
+genişlikte bir PPM sütunu üretir, Tk onu genişliğe yayar ve tek görüntü öğesi
+olarak konur; aynı renk/boyut için önbellekten döner.
+
+Kazanç hesaplamadan değil canvas tarafından gelir: yüzlerce create_line öğesi
+yerine tek görüntü öğesi. Sütun en fazla birkaç yüz satır olduğundan saf
+Python ile üretilir (NumPy dizisi kurmak bu boyutta daha yavaştı).
+
+Ekran yoksa yalnızca hesaplama (hex satırları vs PPM) ölçülür; ekran varsa
+canvas'lara gerçek çizim süresi ve öğe sayısı da raporlanır.
+
+Çalıştırma (03-Karmasik klasöründen):
+    python benchmarks/bench_gradient_render.py --repeat 20
+"""
+import argparse
+import sys
+import time
+import tkinter as tk
+import types
+from pathlib import Path
+
+# gui paketi sys.path'e eklenmeden yalnızca alt modül yolu ile tanıtılır
+GUI_DIR = Path(__file__).resolve().parent.parent / "gui"
+if "gui" not in sys.modules:
+    _gui = types.ModuleType("gui")
+    _gui.__path__ = [str(GUI_DIR)]
+    sys.modules["gui"] = _gui
+
+from gui.gradients import GradientCache, gradient_ppm, hex_to_rgb  # noqa: E402
+
+# Açılışta çizilen gradient'ler: (renk1, renk2, genişlik, yükseklik)
+STARTUP_GRADIENTS = [
+    ('#181825', '#313244', 1600, 70),   # araç çubuğu
+    ('#1e1e2e', '#313244', 1600, 80),   # dashboard başlığı
+    ('#1e1e2e', '#313244', 1600, 80),   # finans başlığı
+    ('#181825', '#313244', 1600, 100),  # süreç paneli
+    ('#181825', '#0d1117', 1600, 40),   # durum çubuğu
+    ('#1e1e2e', '#313244', 1600, 80),   # modal başlığı
+]
+
+
+def legacy_rows(color1, color2, height):
+    """Eski create_gradient_background'ın satır başına hesapladığı renkler"""
+    rgb1, rgb2 = hex_to_rgb(color1), hex_to_rgb(color2)
+    colors = []
+    for i in range(height):
+        ratio = i / height
+        r = int(rgb1[0] * (1 - ratio) + rgb2[0] * ratio)
+        g = int(rgb1[1] * (1 - ratio) + rgb2[1] * ratio)
+        b = int(rgb1[2] * (1 - ratio) + rgb2[2] * ratio)
+        colors.append('#{:02x}{:02x}{:02x}'.format(r, g, b))
+    return colors
+
+
+def legacy_paint(canvas, color1, color2, width, height):
+    for i, color in enumerate(legacy_rows(color1, color2, height)):
+        canvas.create_line(0, i, width, i, fill=color, width=1, tags="gradient")
+
+
+def cached_paint(cache, canvas, color1, color2, width, height):
+    image = cache.get(canvas, color1, color2, width, height)
+    canvas.gradient_image = image
+    canvas.create_image(0, 0, image=image, anchor='nw', tags="gradient")
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def bench_compute(repeat):
+    legacy = timed(lambda: [legacy_rows(c1, c2, h) for c1, c2, _, h in STARTUP_GRADIENTS], repeat)
+    column = timed(lambda: [gradient_ppm(c1, c2, h) for c1, c2, _, h in STARTUP_GRADIENTS], repeat)
+    print("Hesaplama (ekransız):")
+    print(f"  Eski: satır başına hex         : {legacy * 1000:8.2f} ms")
+    print(f"  Yeni: PPM sütunu (bayt)        : {column * 1000:8.2f} ms")
+
+
+def bench_canvas(root, repeat):
+    def startup(paint):
+        canvases = [tk.Canvas(root, width=w, height=h) for _, _, w, h in STARTUP_GRADIENTS]
+        for canvas, spec in zip(canvases, STARTUP_GRADIENTS):
+            paint(canvas, *spec)
+        root.update_idletasks()
+        items = sum(len(canvas.find_withtag("gradient")) for canvas in canvases)
+        for canvas in canvases:
+            canvas.destroy()
+        return items
+
+    legacy_items = startup(legacy_paint)
+    legacy = timed(lambda: startup(legacy_paint), repeat)
+
+    cold_times = []
+    for _ in range(repeat):
+        cache = GradientCache()
+        start = time.perf_counter()
+        new_items = startup(lambda *args: cached_paint(cache, *args))
+        cold_times.append(time.perf_counter() - start)
+    cold = sum(cold_times) / repeat
+    warm = timed(lambda: startup(lambda *args: cached_paint(cache, *args)), repeat)
+
+    print("Açılış çizimi (6 canvas):")
+    print(f"  Eski: create_line       : {legacy * 1000:8.2f} ms  ({legacy_items} öğe)")
+    print(f"  Yeni: soğuk önbellek    : {cold * 1000:8.2f} ms  ({new_items} öğe)")
+    print(f"  Yeni: sıcak önbellek    : {warm * 1000:8.2f} ms  ({cache.stats()})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Gradient çizimi eski/yeni ölçümü")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    bench_compute(args.repeat)
+    try:
+        root = tk.Tk()
+    except tk.TclError as exc:
+        print(f"Ekran yok, canvas ölçümü atlandı: {exc}")
+        return
+    root.withdraw()
+    try:
+        bench_canvas(root, args.repeat)
+    finally:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
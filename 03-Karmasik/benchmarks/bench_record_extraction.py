@@ -0,0 +1,112 @@
+"""
+Kayıt çıkarma benchmark'ı - iterrows vs sütun bazlı extract_records
+Sentetik 100.000 satırlık POSH ekstresi üzerinde iki yolu karşılaştırır.
+
+Çalıştırma (03-Karmasik klasöründen):
+    python benchmarks/bench_record_extraction.py --rows 100000
+"""
+import argparse
+import random
+import sys
+import time
+import types
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+# Betik benchmarks/ altından çalışır; rpa paketi sys.path'e eklenmeden,
+# __init__ çalıştırılmadan yalnızca alt modül yolu ile tanıtılır.
+RPA_DIR = Path(__file__).resolve().parent.parent / "rpa"
+if "rpa" not in sys.modules:
+    _rpa = types.ModuleType("rpa")
+    _rpa.__path__ = [str(RPA_DIR)]
+    sys.modules["rpa"] = _rpa
+
+from rpa.excel_processor import extract_records, filter_posh_frame  # noqa: E402
+from rpa.transaction import Transaction  # noqa: E402
+
+
+def build_synthetic_statement(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Gerçek ekstre sütunlarıyla sentetik tablo üret (~%90 POSH satırı)"""
+    rng = random.Random(seed)
+    terminals = ["N042", "TY01", "N001", "O002", "TY02"]
+    dates, descriptions, amounts, balances = [], [], [], []
+    balance = 0.0
+    for i in range(rows):
+        day = 1 + i % 28
+        dates.append(f"{day:02d}.07.2025")
+        if rng.random() < 0.9:
+            kind = "POS Satış" if i % 2 == 0 else "ÜİY Komisyon"
+            terminal = rng.choice(terminals)
+            descriptions.append(
+                f"POSH/202507{day:02d}/000000002391280/{terminal} N P {kind:<20}/{1660659421 + i:015d}"
+            )
+        else:
+            descriptions.append(f"EFT GELEN {rng.randint(1000, 9999)}")
+        amount = round(rng.uniform(-200, 5000), 2)
+        balance += amount
+        amounts.append(amount)
+        balances.append(round(balance, 2))
+    return pd.DataFrame({
+        "İşlem Tarihi": dates,
+        "Hesaba Giriş Tarihi": dates,
+        "Açıklama": descriptions,
+        "İşlem Tutarı": amounts,
+        "Yeni Bakiye": balances,
+    })
+
+
+def extract_with_iterrows(filtered_data: pd.DataFrame, aciklama_col, file_name: str) -> list:
+    """Eski core_engine döngüsü (referans)"""
+    processed_records = []
+    for _, row in filtered_data.iterrows():
+        processed_records.append({
+            'tarih': str(row.iloc[0]) if len(row) > 0 else datetime.now().strftime('%d.%m.%Y'),
+            'aciklama': str(row[aciklama_col]) if pd.notna(row[aciklama_col]) else "",
+            'tutar': str(row.iloc[3]) if len(row) > 3 else "0",
+            'dosya': file_name,
+        })
+    return processed_records
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="iterrows vs sütun bazlı kayıt çıkarma")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    raw_data = build_synthetic_statement(args.rows)
+    filtered_data, aciklama_col = filter_posh_frame(raw_data)
+    file_name = "sentetik_ekstre.xlsx"
+
+    legacy = extract_with_iterrows(filtered_data, aciklama_col, file_name)
+    columnar = extract_records(filtered_data, aciklama_col, file_name)
+    # Eski metin kayıtları aynı tipli kayda dönüşmeli
+    legacy_typed = [
+        Transaction.from_values(r['tarih'], r['aciklama'], r['tutar'], r['dosya']) for r in legacy
+    ]
+    if list(columnar) != legacy_typed:
+        raise SystemExit("❌ Sonuçlar farklı - sütun bazlı çıkarma iterrows ile eşleşmiyor")
+
+    iterrows_time = best_of(lambda: extract_with_iterrows(filtered_data, aciklama_col, file_name), args.repeat)
+    build_time = best_of(lambda: extract_records(filtered_data, aciklama_col, file_name), args.repeat)
+    full_time = best_of(lambda: list(extract_records(filtered_data, aciklama_col, file_name)), args.repeat)
+
+    print(f"📊 {args.rows} satır, {len(legacy)} POSH kaydı")
+    print(f"   iterrows                 : {iterrows_time * 1000:9.1f} ms")
+    print(f"   extract_records (lazy)   : {build_time * 1000:9.1f} ms  ({iterrows_time / build_time:.1f}x)")
+    print(f"   extract_records + list() : {full_time * 1000:9.1f} ms  ({iterrows_time / full_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Açılış içe aktarma benchmark'ı - `python -X importtime` ile mod başına soğuk başlangıç
+Her `--mode` için main.py'nin o modda yüklediği modüller ayrı süreçlerde birkaç
+kez içe aktarılır; çalıştırmaların medyan süresi bütçeyi aşarsa veya modun ihtiyaç
+duymadığı ağır bir kütüphane (ör. gui modunda pyautogui/pandas/numpy) yüklenirse
+betik 1 ile çıkar. Bütçeler boş makinedeki medyanın yaklaşık iki katıdır; yük
+altındaki makinede oynayan süreler kapıyı tek başına düşürmez.
+Böylece tembel içe aktarmaları bozan bir değişiklik regresyon olarak yakalanır.
+
+Eksik üçüncü taraf bağımlılığı yüzünden içe aktarılamayan mod atlanır (başarısız sayılmaz).
+
+Çalıştırma (03-Karmasik klasöründen):
+    python benchmarks/bench_startup_imports.py --repeat 7
+    python benchmarks/bench_startup_imports.py --project ../04-Notepad++ --budget notepad=200
+"""
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+# main.py'de her modun çalışmaya başlamadan önce yaptığı içe aktarmalar
+MODE_IMPORTS: Dict[str, List[str]] = {
+    "terminal": ["import main"],
+    "streamlit": ["import main"],
+    "gui": ["import main", "from gui.base_gui import EnterpriseGUI"],
+    "rpa": ["import main", "from rpa.core_engine import EnterpriseRPABot"],
+    "both": [
+        "import main",
+        "from gui.base_gui import EnterpriseGUI",
+        "from rpa.core_engine import EnterpriseRPABot",
+    ],
+    # Yalnızca 04-Notepad++ (notepad_automation.py varsa)
+    "notepad": ["import main", "from notepad_automation import NotepadPPAutomation"],
+}
+
+# Modun ihtiyaç duymadığı, yüklenmesi regresyon sayılan kütüphaneler
+FORBIDDEN: Dict[str, Tuple[str, ...]] = {
+    "terminal": ("tkinter", "pandas", "numpy", "pyautogui", "cv2", "pytesseract", "streamlit"),
+    "streamlit": ("tkinter", "pandas", "numpy", "pyautogui", "cv2", "pytesseract", "streamlit"),
+    "gui": ("pandas", "numpy", "pyautogui", "cv2", "pytesseract"),
+    "rpa": ("pyautogui", "cv2", "pytesseract"),
+    "both": ("pyautogui", "cv2", "pytesseract"),
+    "notepad": ("pandas", "cv2", "pytesseract"),
+}
+
+# Soğuk başlangıç bütçeleri (ms, medyan üzerinden); boş makinedeki medyanın ~2 katı.
+# Ağır kütüphanenin geri gelmesini asıl FORBIDDEN yakalar, bütçe kaba üst sınırdır
+DEFAULT_BUDGETS_MS: Dict[str, float] = {
+    "terminal": 100.0,
+    "streamlit": 100.0,
+    "gui": 200.0,
+    "rpa": 1000.0,
+    "both": 1100.0,
+    "notepad": 300.0,
+}
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+MISSING_MODULE = re.compile(r"No module named '([^']+)'")
+
+
+def run_importtime(project: Path, statements: List[str]) -> Tuple[Optional[str], List[Tuple[int, int, int, str]]]:
+    """Tek süreçte içe aktarır; (hata, [(self_us, cumulative_us, derinlik, modül)])"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(statements)],
+        cwd=project,
+        capture_output=True,
+        text=True,
+    )
+    entries = []
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((int(self_us), int(cumulative_us), len(indent) // 2, name))
+    if completed.returncode != 0:
+        missing = MISSING_MODULE.search(completed.stderr)
+        error = f"eksik bağımlılık: {missing.group(1)}" if missing else completed.stderr.strip().splitlines()[-1]
+        return error, entries
+    return None, entries
+
+
+def measure(project: Path, mode: str, repeat: int) -> Dict[str, object]:
+    statements = MODE_IMPORTS[mode]
+    # İlk çalıştırma .pyc önbelleğini ısıtır; ölçüme katılmaz
+    error, _ = run_importtime(project, statements)
+    if error is not None:
+        return {"mode": mode, "error": error}
+    runs = []
+    for _ in range(repeat):
+        _, entries = run_importtime(project, statements)
+        runs.append(entries)
+    # Medyan çalıştırma: tek bir hızlı veya yavaş çalıştırma sonucu değiştirmez
+    totals = [sum(entry[0] for entry in entries) / 1000 for entries in runs]
+    median_ms = statistics.median(totals)
+    typical = min(runs, key=lambda entries: abs(sum(entry[0] for entry in entries) / 1000 - median_ms))
+    loaded = {name for entries in runs for _, _, _, name in entries}
+    heaviest = sorted(
+        ((cumulative, name) for _, cumulative, depth, name in typical if depth == 1),
+        reverse=True,
+    )[:5]
+    return {
+        "mode": mode,
+        "total_ms": median_ms,
+        "min_ms": min(totals),
+        "max_ms": max(totals),
+        "modules": len(typical),
+        "forbidden": sorted(name for name in FORBIDDEN.get(mode, ()) if name in loaded),
+        "heaviest": [(name, cumulative / 1000) for cumulative, name in heaviest],
+    }
+
+
+def parse_budgets(values: List[str]) -> Dict[str, float]:
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for value in values:
+        mode, _, ms = value.partition("=")
+        if mode not in MODE_IMPORTS or not ms:
+            raise SystemExit(f"Geçersiz bütçe: {value} (ör. gui=250)")
+        budgets[mode] = float(ms)
+    return budgets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mod başına açılış içe aktarma süresi ve bütçe kontrolü")
+    parser.add_argument("--project", type=Path, default=PROJECT_DIR,
+                        help="main.py'nin bulunduğu klasör (03-Karmasik veya 04-Notepad++)")
+    parser.add_argument("--mode", nargs="*", choices=sorted(MODE_IMPORTS), default=None)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget", nargs="*", default=[], metavar="MOD=MS")
+    args = parser.parse_args()
+
+    project = args.project.resolve()
+    budgets = parse_budgets(args.budget)
+    modes = args.mode or [
+        mode for mode in MODE_IMPORTS
+        if mode != "notepad" or (project / "notepad_automation.py").exists()
+    ]
+
+    failures = []
+    print(f"Açılış içe aktarma süreleri ({project.name}, {args.repeat} çalıştırmanın medyanı):")
+    for mode in modes:
+        result = measure(project, mode, args.repeat)
+        if "error" in result:
+            print(f"  {mode:<10} atlandı ({result['error']})")
+            continue
+        budget = budgets[mode]
+        over = result["total_ms"] > budget
+        status = "AŞILDI" if over else "ok"
+        print(f"  {mode:<10} {result['total_ms']:8.1f} ms / {budget:6.0f} ms  "
+              f"({result['min_ms']:.1f}-{result['max_ms']:.1f})  {result['modules']:4d} modül  [{status}]")
+        for name, ms in result["heaviest"]:
+            print(f"      {name:<28} {ms:8.1f} ms")
+        if over:
+            failures.append(f"{mode}: {result['total_ms']:.1f} ms > {budget:.0f} ms")
+        if result["forbidden"]:
+            print(f"      gereksiz yüklenen: {', '.join(result['forbidden'])}")
+            failures.append(f"{mode}: gereksiz içe aktarma {', '.join(result['forbidden'])}")
+
+    if failures:
+        print("❌ Açılış bütçesi aşıldı:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("✅ Tüm modlar bütçe içinde")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Disk önbelleği benchmark'ı - soğuk vs sıcak başlangıç
+Sentetik ekstreyi gerçek dosyadaki gibi 23 satırlık ön bilgiyle XLSX olarak
+yazar; ardından doğrudan pd.read_excel, boş önbellekle (soğuk) ve dolu
+önbellekle (sıcak) read_excel_cached sürelerini karşılaştırır.
+
+Çalıştırma (03-Karmasik klasöründen):
+    python benchmarks/bench_statement_disk_cache.py --rows 20000
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# bench_record_extraction rpa paketini __init__ çalıştırmadan tanıtır
+from bench_record_extraction import build_synthetic_statement  # noqa: E402
+from rpa.excel_cache import read_excel_cached  # noqa: E402
+from rpa.excel_processor import HEADER_ROW  # noqa: E402
+
+
+def write_statement_xlsx(frame: pd.DataFrame, path: Path) -> None:
+    """Tabloyu banka ekstresi düzeninde (HEADER_ROW satır ön bilgi) yaz"""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for i in range(HEADER_ROW):
+        sheet.append([f"Ekstre bilgi satırı {i + 1}" if i % 3 == 0 else ""])
+    sheet.append(list(frame.columns))
+    for row in frame.itertuples(index=False):
+        sheet.append(list(row))
+    workbook.save(path)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ekstre disk önbelleği soğuk/sıcak ölçümü")
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        work_dir = Path(work_dir)
+        xlsx_path = work_dir / "sentetik_ekstre.xlsx"
+        cache_dir = work_dir / "cache"
+        write_statement_xlsx(build_synthetic_statement(args.rows), xlsx_path)
+
+        reference, plain_time = timed(lambda: pd.read_excel(xlsx_path, header=HEADER_ROW))
+        cold, cold_time = timed(lambda: read_excel_cached(xlsx_path, header=HEADER_ROW, cache_dir=cache_dir))
+        warm, warm_time = timed(lambda: read_excel_cached(xlsx_path, header=HEADER_ROW, cache_dir=cache_dir))
+
+        pd.testing.assert_frame_equal(reference, cold)
+        pd.testing.assert_frame_equal(reference, warm)
+
+        sidecar_bytes = sum(f.stat().st_size for f in cache_dir.rglob("*") if f.is_file())
+        print(f"📊 {args.rows} satır, XLSX {xlsx_path.stat().st_size / 1024:.0f} KB, "
+              f"önbellek {sidecar_bytes / 1024:.0f} KB")
+        print(f"   pd.read_excel (önbelleksiz) : {plain_time * 1000:9.1f} ms")
+        print(f"   soğuk (ayrıştır + yaz)      : {cold_time * 1000:9.1f} ms")
+        print(f"   sıcak (.npy yükle)          : {warm_time * 1000:9.1f} ms  ({plain_time / warm_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,6 @@
-from .base_gui import EnterpriseGUI
+# Alt modüller (ör. gui.gradients) tüm arayüzü yüklemeden içe aktarılabilsin
+def __getattr__(name):
+    if name == "EnterpriseGUI":
+        from .base_gui import EnterpriseGUI
+        return EnterpriseGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
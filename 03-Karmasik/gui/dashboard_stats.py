@@ -0,0 +1,94 @@
+"""
+Dashboard İstatistikleri - kartların artımlı toplamları
+Kayıt başına bir kez güncellenir, her kart O(1) yanıtlanır; tutarlar kuruşta tutulur
+"""
+
+from collections import Counter
+from datetime import date
+from typing import Any, Dict, Optional
+
+from rpa.posh_parser import classify
+
+
+def _kurus(amount) -> int:
+    return int(round(float(amount) * 100))
+
+
+class DashboardStats:
+    """Eklenen kayıt başına güncellenen sayaçlar ve toplamlar"""
+
+    def __init__(self, date_format: str = '%d.%m.%Y'):
+        self.date_format = date_format
+        self._today: Optional[date] = None
+        self._today_text = ''
+        self.reset()
+
+    def reset(self) -> None:
+        self.total = 0
+        self.total_kurus = 0
+        self.count_by_date: Counter = Counter()
+        self.kurus_by_date: Counter = Counter()
+        self.count_by_file: Counter = Counter()
+        self.kurus_by_file: Counter = Counter()
+        self.count_by_type: Counter = Counter()
+        self.kurus_by_type: Counter = Counter()
+
+    def add(self, date_text: str, amount, file_name: str = '', description: str = '') -> None:
+        """Eklenen tek kaydı hesaba kat (O(1))"""
+        kurus = _kurus(amount)
+        kind = classify(description)
+        self.total += 1
+        self.total_kurus += kurus
+        self.count_by_date[date_text] += 1
+        self.kurus_by_date[date_text] += kurus
+        self.count_by_file[file_name] += 1
+        self.kurus_by_file[file_name] += kurus
+        self.count_by_type[kind] += 1
+        self.kurus_by_type[kind] += kurus
+
+    def today_text(self) -> str:
+        """Kayıtlardaki biçimde bugünün tarihi; yalnızca gün değişince yeniden biçimlenir"""
+        today = date.today()
+        if today != self._today:
+            self._today = today
+            self._today_text = today.strftime(self.date_format)
+        return self._today_text
+
+    @property
+    def today(self) -> int:
+        return self.count_by_date[self.today_text()]
+
+    @property
+    def today_amount(self) -> float:
+        return self.kurus_by_date[self.today_text()] / 100
+
+    @property
+    def total_amount(self) -> float:
+        return self.total_kurus / 100
+
+    @property
+    def average_amount(self) -> float:
+        return self.total_kurus / self.total / 100 if self.total else 0.0
+
+    @property
+    def file_count(self) -> int:
+        return len(self.count_by_file)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Tüm kart değerleri ve dosya/tip dağılımları"""
+        return {
+            'total': self.total,
+            'today': self.today,
+            'total_amount': self.total_amount,
+            'today_amount': self.today_amount,
+            'average_amount': self.average_amount,
+            'files': self.file_count,
+            'by_file': {
+                name: {'count': count, 'amount': self.kurus_by_file[name] / 100}
+                for name, count in self.count_by_file.items()
+            },
+            'by_type': {
+                name: {'count': count, 'amount': self.kurus_by_type[name] / 100}
+                for name, count in self.count_by_type.items()
+            },
+        }
@@ -34,6 +34,20 @@ def parse_command_line_args():
                        help='GUI göstermeden çalıştır')
     parser.add_argument('--port', type=int, default=8501, 
                        help='Streamlit port numarası')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Paralel Excel ön-okuma işçi sayısı (0: kapalı)')
+    parser.add_argument('--streaming', action='store_true',
+                       help='Büyük ekstreleri satır satır akış modunda oku')
+    parser.add_argument('--direct-commit', action='store_true',
+                       help='Form simülasyonu olmadan kayıtları tabloya toplu yaz (gece işleri)')
+    parser.add_argument('--no-pacing', action='store_true',
+                       help='Adımlar arası beklemeleri kapat (toplu çalıştırma)')
+    parser.add_argument('--export-xlsx', metavar='YOL', default=None,
+                       help='Çalıştırma sonunda kayıt sonuçlarını XLSX olarak dışa aktar')
+    parser.add_argument('--no-resume', action='store_true',
+                       help='Kontrol noktasını silip dosyaları baştan işle')
+    parser.add_argument('--allow-duplicates', action='store_true',
+                       help='Referans dizininde kayıtlı (daha önce girilmiş) işlemleri de işle')
 
     return parser.parse_args()
 
@@ -168,23 +182,31 @@ def start_streamlit_server(port: int = 8501) -> subprocess.Popen:
 
 
 
-def run_rpa_with_gui(excel_paths: List[Path], progress_callback: Callable = None):
+def run_rpa_with_gui(excel_paths: List[Path], progress_callback: Callable = None,
+                     prefetch_workers: Optional[int] = None, streaming: bool = False,
+                     direct_commit: bool = False, pacing: bool = True, resume: bool = True,
+                     dedupe: bool = True):
     """DÜZELTME: Streamlit entegrasyonu - Gelişmiş hata yönetimi"""
     global gui_app, rpa_bot, active_threads
 
     print(f"🎯 RPA işlemi başlatılıyor: {len(excel_paths)} dosya")
 
+    # GUI nesnesi kurulduğunda (veya kurulum hata verdiğinde) işaretlenir
+    gui_created = threading.Event()
+
     def gui_worker():
         """DÜZELTME: GUI worker thread - hata yönetimi ile"""
         global gui_app
         try:
             from gui.base_gui import EnterpriseGUI
             gui_app = EnterpriseGUI()
+            gui_created.set()
             gui_app.set_processing_files(excel_paths)
             gui_app.run()
         except Exception as e:
             print(f"❌ GUI worker hatası: {e}")
         finally:
+            gui_created.set()
             print("🔄 GUI worker sonlandırıldı")
 
     # DÜZELTME: GUI thread'i daha güvenli başlat
@@ -193,18 +215,23 @@ def run_rpa_with_gui(excel_paths: List[Path], progress_callback: Callable = None
     gui_thread.start()
     active_threads.append(gui_thread)
 
-    # GUI'nin başlaması için bekle - timeout ile
+    # GUI'nin etkileşime hazır olmasını bekle - timeout ile (saniyelik yoklama yerine olay)
     max_wait = 10
-    for i in range(max_wait):
-        if gui_app and hasattr(gui_app, 'root'):
-            break
-        time.sleep(1)
-        print(f"⏳ GUI bekleniyor... ({i+1}/{max_wait})")
-
+    wait_started = time.time()
+    print("⏳ GUI bekleniyor...")
+    gui_created.wait(max_wait)
     if not gui_app:
         print("❌ GUI başlatılamadı - timeout")
         return []
 
+    # Nesne kuruldu; mainloop ilk kareyi çizip girdiye açılana kadar beklenir
+    remaining = max(0.0, max_wait - (time.time() - wait_started))
+    if not gui_app.interactive.wait(remaining):
+        print("❌ GUI başlatılamadı - timeout")
+        return []
+
+    print(f"⏱️ GUI etkileşime hazır: {time.time() - wait_started:.2f} sn")
+
     print("✅ GUI başlatıldı, RPA hazırlanıyor...")
 
     # DÜZELTME: RPA'yi ana thread'de çalıştır - hata yönetimi ile
@@ -215,6 +242,19 @@ def run_rpa_with_gui(excel_paths: List[Path], progress_callback: Callable = None
         rpa_bot.set_gui_reference(gui_app)
         rpa_bot.set_processing_speed("normal")
         rpa_bot.set_processing_files(excel_paths)
+        # Yarıda kalan çalıştırma kaldığı kayıttan devam eder
+        rpa_bot.enable_checkpoint(resume=resume)
+        # Günler arası çakışan ekstrelerde önceden girilmiş işlemler atlanır
+        if dedupe:
+            rpa_bot.enable_reference_index()
+        if prefetch_workers is not None:
+            rpa_bot.set_prefetch_options(workers=prefetch_workers)
+        if streaming:
+            rpa_bot.set_streaming_mode(True)
+        if direct_commit:
+            rpa_bot.set_direct_commit_mode(True)
+        if not pacing:
+            rpa_bot.set_pacing(False)
 
         print("🚀 RPA başlatılıyor...")
         result = rpa_bot.run_complete_automation_sequence()
@@ -393,7 +433,14 @@ def main() -> None:
         if args.files and len(args.files) > 0:
             print("📨 Streamlit entegrasyonu aktif")
             file_paths = [Path(f) for f in args.files]
-            results = run_rpa_with_gui(file_paths)
+            results = run_rpa_with_gui(file_paths, prefetch_workers=args.workers,
+                                       streaming=args.streaming,
+                                       direct_commit=args.direct_commit,
+                                       pacing=not args.no_pacing,
+                                       resume=not args.no_resume,
+                                       dedupe=not args.allow_duplicates)
+            if args.export_xlsx and rpa_bot:
+                rpa_bot.export_results_xlsx(Path(args.export_xlsx))
 
             # Sonuçları JSON formatında yazdır (Streamlit için)
             import json
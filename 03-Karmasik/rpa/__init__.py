@@ -1 +1,6 @@
-from .core_engine import EnterpriseRPABot
+# Alt modüller (ör. rpa.checkpoint) motoru ve bağımlılıklarını yüklemeden içe aktarılabilsin
+def __getattr__(name):
+    if name == "EnterpriseRPABot":
+        from .core_engine import EnterpriseRPABot
+        return EnterpriseRPABot
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
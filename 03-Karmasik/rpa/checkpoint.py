@@ -0,0 +1,96 @@
+"""
+Kontrol Noktası Günlüğü - yarıda kalan çok dosyalı çalıştırmaları sürdürme
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Set, Tuple, Union
+
+from .excel_cache import file_sha256
+from .transaction import Transaction
+
+
+DEFAULT_JOURNAL_PATH = Path("results") / "checkpoint.jsonl"
+
+
+def commit_key(date_text: str, file_name: str, description: str, amount: float) -> Tuple:
+    """GUI'nin main_data'sında saklandığı haliyle işlenmiş satırın kimliği"""
+    return (date_text, file_name, description, round(float(amount), 2))
+
+
+def record_commit_key(record: Transaction) -> Tuple:
+    """Kaydın giriş formunun kaydedeceği haliyle commit_key değeri"""
+    aciklama = record.aciklama
+    description = aciklama[:80] + "..." if len(aciklama) > 80 else aciklama
+    return commit_key(record.tarih_text(), record.dosya, description, float(record.tutar))
+
+
+def main_data_keys(main_data: Iterable[Dict]) -> Set[Tuple]:
+    """main_data'daki tüm satırların commit anahtarları"""
+    return {
+        commit_key(row.get('date', ''), row.get('file', ''), row.get('description', ''), row.get('amount', 0))
+        for row in main_data
+    }
+
+
+class CheckpointJournal:
+    """Dosya hash'i ve kayıt sırasıyla anahtarlanan, commit başına fsync'lenen JSONL günlüğü"""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_JOURNAL_PATH):
+        self.path = Path(path)
+        self._committed: Dict[str, Set[int]] = {}
+        self._hashes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, encoding='utf-8') as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Çökme anında yarım kalan son satır
+                    continue
+                self._committed.setdefault(entry['hash'], set()).update(entry['indices'])
+
+    def file_hash(self, excel_path: Path) -> str:
+        """excel_path'in içerik hash'i (yol başına bir kez hesaplanır)"""
+        key = str(Path(excel_path).resolve())
+        if key not in self._hashes:
+            self._hashes[key] = file_sha256(excel_path)
+        return self._hashes[key]
+
+    def committed(self, file_hash: str) -> Set[int]:
+        """Dosyanın zaten işlenmiş kayıtlarının 1 tabanlı sıraları"""
+        with self._lock:
+            return set(self._committed.get(file_hash, ()))
+
+    def mark(self, file_hash: str, indices: Iterable[int], file_name: str = '') -> None:
+        """Dosyanın indices kayıtlarının işlendiğini kalıcı olarak yaz"""
+        indices = sorted(indices)
+        if not indices:
+            return
+        line = json.dumps({'hash': file_hash, 'file': file_name, 'indices': indices}, ensure_ascii=False)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as handle:
+                handle.write(line + '\n')
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._committed.setdefault(file_hash, set()).update(indices)
+
+    def pending(self) -> int:
+        """Yarıda kalan çalıştırmadan devreden işlenmiş kayıt sayısı"""
+        with self._lock:
+            return sum(len(indices) for indices in self._committed.values())
+
+    def clear(self) -> None:
+        """Tüm kontrol noktalarını unut (çalıştırma bitti veya temiz başlangıç istendi)"""
+        with self._lock:
+            self._committed.clear()
+            if self.path.exists():
+                self.path.unlink()
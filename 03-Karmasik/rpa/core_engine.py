@@ -2,21 +2,40 @@
 Karmaşık RPA Motoru - Enterprise Seviye Otomasyon
 Çoklu Excel dosya işleme + 6 adımlı karmaşık GUI navigasyonu
 """
+import logging
 import time
 import threading
 import pandas as pd
-import numpy as np
 from pathlib import Path
-from typing import List, Dict, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Optional, Sequence, Union
 import tkinter as tk
 from tkinter import messagebox
-import pyautogui
 import random
-from datetime import datetime
 
-# DÜZELTME: PyAutoGUI güvenlik ayarları
-pyautogui.FAILSAFE = True
-pyautogui.PAUSE = 0.1
+from .checkpoint import CheckpointJournal, main_data_keys, record_commit_key
+from .excel_processor import StatementRecords, extract_records, stream_posh_records
+from .gui_batch import GuiCallBatch, GuiCallResult, GuiOperation, run_gui_operations
+from .lazy_import import lazy_import
+from .latency import LatencyHistogram
+from .pacing import PacingScheduler
+from .posh_parser import reference_key, reference_keys
+from .prefetch import StatementPrefetcher
+from .reference_index import ReferenceIndex
+from .results_sink import ResultsSink, timestamp
+from .status_channel import StatusChannel
+from .structured_log import get_logger, start_run
+from .statement_cache import StatementCache
+from .transaction import Transaction, as_transaction
+
+
+def _configure_pyautogui(module):
+    """DÜZELTME: PyAutoGUI güvenlik ayarları"""
+    module.FAILSAFE = True
+    module.PAUSE = 0.1
+
+
+# Fare kütüphanesi ilk fare hareketinde yüklenir (ekrana bağlanır, yavaş içe aktarılır)
+pyautogui = lazy_import('pyautogui', on_import=_configure_pyautogui)
 
 class EnterpriseRPABot:
     """Enterprise seviye RPA botu - Karmaşık navigasyon ve çoklu dosya işleme"""
@@ -36,16 +55,59 @@ class EnterpriseRPABot:
         self.processing_speed = "fast"  # "slow", "normal", "fast"
         # Tüm beklemeleri yarıya indirmek için katsayı
         self.delay_factor = 0.5
+        # Beklemeler loglamadan ayrı: hız ve delay_factor tek katsayıda birleşir
+        self.pacer = PacingScheduler(self._pacing_factor())
+        # Sonucu beklenmeden GUI kuyruğuna bırakılan işlem sayısı
+        self.status_posts = 0
+        # Durum satırı kanalı: Tk tarafında kare başına en son mesaj gösterilir
+        self.status_channel = StatusChannel()
         self.mouse_simulation = True
         self.detailed_logging = True
+        # Kayıt bazlı sonuçlar oluştukları anda buraya eklenir (çalıştırma başına bir dosya)
+        self.results_dir = Path("results")
+        # Kuyruk tabanlı log: JSONL dosyası (sonuçların yanında) + konsol arka plan thread'inde yazılır
+        self.logger = get_logger(
+            "rpa.enterprise", log_dir=self.results_dir / "logs", file_name="rpa_enterprise.jsonl",
+            console_format="[%(asctime)s.%(msecs)03d] [RPA] %(message)s",
+        )
+        self.run_id = None
         
         # RPA istatistikleri
         self.start_time = None
         self.results = []
+        self.results_sink: Optional[ResultsSink] = None
+        # Kontrol noktası: yarıda kalan çalıştırma kaldığı kayıttan devam eder
+        self.checkpoint: Optional[CheckpointJournal] = None
+        self.resumed_records = 0
+        # Kalıcı referans dizini: önceki çalıştırmalarda girilmiş POSH kayıtları atlanır
+        self.reference_index: Optional[ReferenceIndex] = None
+        self.duplicate_records = 0
+        
+        # Dosya başına tek ayrıştırma: önizleme, işleme ve rapor aynı tabloyu kullanır
+        self.statement_cache = StatementCache()
+        # Sonraki dosyaları paralel ön-okuma (None: otomatik, 0: kapalı)
+        self.prefetch_workers = None
+        self.prefetch_lookahead = 2
+        # Akış modu: tablo yerine read-only satır okuma, bellek eşleşme sayısıyla sınırlı
+        self.streaming_mode = False
+        # Doğrudan kayıt modu: form/mouse simülasyonu yok, kayıtlar GUI modeline toplu yazılır
+        self.direct_commit = False
+        self.direct_commit_chunk = 2000
+        # Doğrudan kayıt açılmadan önceki bekleme durumu (kapatılınca geri yüklenir)
+        self._pacing_before_direct: Optional[bool] = None
+        # Thread'ler arası GUI çağrı sayısı (tekli + toplu)
+        self.gui_round_trips = 0
+        # Modal/popup olayından bot'un uyanmasına kadar geçen süre
+        self.wait_latency = {
+            'modal_ready': LatencyHistogram('modal_ready'),
+            'popup_close': LatencyHistogram('popup_close'),
+        }
         
     def set_gui_reference(self, gui_app):
         """GUI referansını ayarla"""
         self.gui = gui_app
+        if hasattr(gui_app, 'update_status'):
+            self.post_to_gui(self.status_channel.start, gui_app.root, gui_app.update_status)
         self.log_step("✅ Enterprise GUI referansı ayarlandı", 0.3)
         
     def set_processing_files(self, file_paths: List[Path]):
@@ -53,24 +115,174 @@ class EnterpriseRPABot:
         self.excel_files = file_paths
         self.log_step(f"📁 {len(file_paths)} Excel dosyası işlenmeye hazırlandı", 0.5)
         
+    SPEED_MULTIPLIERS = {"slow": 2.0, "normal": 1.0, "fast": 0.3}
+
+    def _pacing_factor(self) -> float:
+        """Hız ayarı ve delay_factor'dan bekleme katsayısı"""
+        return self.SPEED_MULTIPLIERS.get(self.processing_speed, 1.0) * self.delay_factor
+
     def set_processing_speed(self, speed: str):
         """İşlem hızını ayarla: slow, normal, fast"""
         self.processing_speed = speed
+        if self.pacer.enabled:
+            self.pacer.set_factor(self._pacing_factor())
         self.log_step(f"⚡ İşlem hızı: {speed}", 0.2)
         
-    def log_step(self, message: str, delay: float = 0.5):
-        """Adımları logla ve bekle"""
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        if self.detailed_logging:
-            print(f"[{timestamp}] [RPA] {message}")
+    def set_prefetch_options(self, workers: Optional[int] = None, lookahead: int = 2):
+        """Paralel dosya ön-okuma ayarları: işçi sayısı ve ileri bakış derinliği"""
+        self.prefetch_workers = workers
+        self.prefetch_lookahead = max(1, lookahead)
+        worker_text = "otomatik" if workers is None else str(workers)
+        self.log_step(f"🧵 Ön-okuma: {worker_text} işçi, {self.prefetch_lookahead} dosya ileri", 0.2)
+        
+    def set_streaming_mode(self, enabled: bool = True):
+        """Büyük ekstreler için satır satır akış okumasını aç/kapat"""
+        self.streaming_mode = enabled
+        self.log_step(f"🌊 Akış okuma modu: {'açık' if enabled else 'kapalı'}", 0.2)
+        
+    def set_direct_commit_mode(self, enabled: bool = True, chunk_size: int = 2000):
+        """İzlenmeyen toplu işler için simülasyonsuz doğrudan kayıt modunu aç/kapat"""
+        self.direct_commit = enabled
+        self.direct_commit_chunk = max(1, chunk_size)
+        # Doğrudan kayıt modunda izleyen yok, bekleme yapılmaz; kapatılınca önceki durum döner
+        if enabled:
+            if self._pacing_before_direct is None:
+                self._pacing_before_direct = self.pacer.enabled
+            self.set_pacing(False)
+        elif self._pacing_before_direct is not None:
+            self.set_pacing(self._pacing_before_direct)
+            self._pacing_before_direct = None
+        self.log_step(f"⚡ Doğrudan kayıt modu: {'açık' if enabled else 'kapalı'}", 0.2)
         
+    def enable_checkpoint(self, resume: bool = True, journal_path: Optional[Path] = None):
+        """Kayıt bazlı kontrol noktası günlüğünü aç; resume=False önceki günlüğü siler"""
+        self.checkpoint = CheckpointJournal(journal_path or self.results_dir / "checkpoint.jsonl")
+        if not resume:
+            self.checkpoint.clear()
+        elif self.checkpoint.pending():
+            self.log_step(f"⏯️ Önceki çalıştırmadan {self.checkpoint.pending()} kayıt atlanacak", 0.3)
+
+    def enable_reference_index(self, index_path: Optional[Path] = None):
+        """Çalıştırmalar arası mükerrer kayıt dizinini aç"""
+        self.reference_index = ReferenceIndex(index_path or self.results_dir / "referanslar.sqlite")
+        self.log_step(f"🗂️ Referans dizini: {len(self.reference_index)} kayıtlı işlem", 0.3)
+
+    def duplicate_reference_mask(self, records: Sequence[Union[Transaction, Dict]],
+                                 skip: set = frozenset()) -> List[bool]:
+        """Kayıt başına: referans dizininde var mı (skip'teki sıra numaraları hariç)"""
+        if self.reference_index is None:
+            return [False] * len(records)
+        if isinstance(records, StatementRecords):
+            descriptions = records.descriptions()
+        else:
+            descriptions = [as_transaction(record).aciklama for record in records]
+        keys = reference_keys(pd.Series(descriptions, dtype=object)).tolist()
+        known = self.reference_index.known_mask([key if isinstance(key, str) else None for key in keys])
+        return [is_known and index not in skip for index, is_known in enumerate(known, 1)]
+
+    def find_duplicate_references(self, records: Sequence[Union[Transaction, Dict]],
+                                  skip: set = frozenset()) -> set:
+        """Referans dizininde zaten bulunan kayıtların sıra numaraları (filtre aşaması)"""
+        mask = self.duplicate_reference_mask(records, skip)
+        return {index for index, is_duplicate in enumerate(mask, 1) if is_duplicate}
+
+    def filter_duplicate_references(self, records: Sequence[Union[Transaction, Dict]],
+                                    skip: set = frozenset()):
+        """Filtre aşaması: dizindeki kayıtları ayıkla; (kalan kayıtlar, mükerrer sıra numaraları)"""
+        mask = self.duplicate_reference_mask(records, skip)
+        duplicates = {index for index, is_duplicate in enumerate(mask, 1) if is_duplicate}
+        if not duplicates:
+            return records, duplicates
+        keep = [not is_duplicate for is_duplicate in mask]
+        if isinstance(records, StatementRecords):
+            # Sütun tabanlı kayıtlar Transaction listesine açılmadan süzülür
+            return records.select(keep), duplicates
+        return [record for record, kept in zip(records, keep) if kept], duplicates
+
+    def remember_references(self, records: Sequence[Transaction], file_name: str):
+        """Kaydedilen kayıtların referanslarını dizine ekle"""
+        if self.reference_index is not None:
+            self.reference_index.add_many((reference_key(record.aciklama) for record in records), file_name)
+
+    def get_duplicate_stats(self) -> Dict[str, int]:
+        """Referans dizini sayaçları ve bu çalıştırmada atlanan mükerrer kayıtlar"""
+        stats = self.reference_index.stats() if self.reference_index is not None else {}
+        stats['skipped'] = self.duplicate_records
+        return stats
+
+    def find_committed_records(self, records: Sequence[Union[Transaction, Dict]],
+                               file_hash: Optional[str], file_name: str) -> set:
+        """Daha önce kaydedilmiş kayıtların sıra numaraları (günlük + main_data kontrolü)"""
+        if self.checkpoint is None or file_hash is None:
+            return set()
+        done = self.checkpoint.committed(file_hash)
+
+        # Günlüğe yazılmadan kesilen kayıtlar GUI tablosunda aranır
+        existing = set()
+        if self.gui and hasattr(self.gui, 'get_main_data'):
+            existing = self.call_in_gui_thread(
+                lambda: main_data_keys(self.gui.get_main_data())
+            ) or set()
+        if existing:
+            found = [
+                index for index, record in enumerate(records, 1)
+                if index not in done and record_commit_key(as_transaction(record)) in existing
+            ]
+            if found:
+                self.checkpoint.mark(file_hash, found, file_name)
+                done.update(found)
+        return done
+
+    def load_file_records(self, excel_path: Path):
+        """Dosyanın POSH kayıtlarını moda göre (akış veya önbellekli tablo) yükle"""
+        if self.streaming_mode:
+            return stream_posh_records(excel_path)
+        filtered_data, aciklama_col = self.statement_cache.get_filtered(excel_path)
+        if 'açıklama' not in str(aciklama_col).lower():
+            self.log_step("⚠️ Açıklama sütunu bulunamadı, varsayılan sütun kullanılıyor", 0.5)
+        # Veriyi işlenebilir formata çevir (sütun bazlı, iterrows yok)
+        return extract_records(filtered_data, aciklama_col, excel_path.name)
+        
+    def set_pacing(self, enabled: bool = True):
+        """Adımlar arası beklemeleri aç/kapat (kapalı: toplu çalıştırma)"""
+        self.pacer.set_factor(self._pacing_factor() if enabled else 0.0)
+
+    def get_status_stats(self) -> Dict[str, int]:
+        """Durum kanalı sayaçları (gönderilen, gösterilen, birleştirilen, düşürülen)"""
+        return self.status_channel.stats()
+
+    def get_pacing_stats(self) -> Dict[str, Any]:
+        """Çalışma süresinin bekleme ve gerçek iş olarak dağılımı"""
+        return self.pacer.stats()
+
+    def log(self, message: str):
+        """Mesajı log kuyruğuna ve GUI durum kanalına bırak (ikisi de engellemez)"""
+        # detailed_logging kapalıyken mesaj yalnızca dosyaya düşer (DEBUG)
+        self.logger.log(logging.INFO if self.detailed_logging else logging.DEBUG, message)
         if self.gui:
-            self.call_in_gui_thread(self.gui.update_status, f"RPA: {message}")
-            
-        # Hız ayarına göre bekleme
-        speed_multiplier = {"slow": 2.0, "normal": 1.0, "fast": 0.3}
-        actual_delay = delay * speed_multiplier.get(self.processing_speed, 1.0) * self.delay_factor
-        time.sleep(actual_delay)
+            self.status_channel.post(f"RPA: {message}")
+
+    def post_to_gui(self, func, *args) -> bool:
+        """İşlemi GUI kuyruğuna bırak, sonucunu beklemeden dön"""
+        if not self.gui or not hasattr(self.gui, 'root'):
+            return False
+        try:
+            self.gui.root.after(0, func, *args)
+        except (tk.TclError, RuntimeError):
+            # Ana döngü kapanmış olabilir; durum mesajı kaybı önemsiz
+            return False
+        self.status_posts += 1
+        return True
+
+    def set_gui_automation_active(self, active: bool):
+        """GUI arka plan animasyonunu otomasyon süresince duraklat / sürdür"""
+        if self.gui is not None and hasattr(self.gui, 'set_automation_active'):
+            self.post_to_gui(self.gui.set_automation_active, active)
+
+    def log_step(self, message: str, delay: float = 0.5):
+        """Adımı logla, ardından bekleme bütçesine göre duraklat"""
+        self.log(message)
+        self.pacer.pause(delay)
 
     def call_in_gui_thread(self, func, *args, timeout=None, **kwargs):
         """DÜZELTME: Tkinter ana döngüsünde güvenli fonksiyon çalıştırma"""
@@ -113,6 +325,7 @@ class EnterpriseRPABot:
                 done.set()
 
         try:
+            self.gui_round_trips += 1
             self.gui.root.after(0, wrapper)
             if done.wait(timeout=timeout):
                 if exception:
@@ -125,6 +338,52 @@ class EnterpriseRPABot:
             self.log_step("⚠️ GUI thread çağırma hatası", 0.1)
             return None
 
+    def call_in_gui_thread_batch(self, operations: List[GuiOperation], timeout=None) -> List[GuiCallResult]:
+        """Birden çok GUI işlemini tek ana döngü turunda çalıştır, sonuçları birlikte döndür"""
+        def failed(reason: str) -> List[GuiCallResult]:
+            return [GuiCallResult(op.label, error=reason) for op in operations]
+
+        if not self.gui or not hasattr(self.gui, 'root'):
+            self.log_step("⚠️ GUI referansı mevcut değil", 0.1)
+            return failed("GUI referansı mevcut değil")
+
+        try:
+            self.gui.root.winfo_exists()
+        except tk.TclError:
+            self.log_step("⚠️ Ana pencere mevcut değil", 0.1)
+            return failed("Ana pencere mevcut değil")
+
+        done = threading.Event()
+        results: List[GuiCallResult] = []
+
+        def wrapper():
+            nonlocal results
+            try:
+                results = run_gui_operations(operations)
+            finally:
+                done.set()
+
+        try:
+            self.gui_round_trips += 1
+            self.gui.root.after(0, wrapper)
+        except tk.TclError:
+            self.log_step("⚠️ GUI thread çağırma hatası", 0.1)
+            return failed("GUI thread çağırma hatası")
+
+        if not done.wait(timeout=timeout):
+            self.log_step("⚠️ GUI thread timeout", 0.1)
+            return failed("GUI thread timeout")
+
+        # İşlem bazında hata raporu
+        for result in results:
+            if result.error:
+                self.log_step(f"⚠️ GUI işlem hatası ({result.label}): {result.error}", 0.1)
+        return results
+
+    def gui_batch(self, timeout=None) -> GuiCallBatch:
+        """Tek turda çalışacak GUI işlemleri için yeni bir toplu çağrı oluştur"""
+        return GuiCallBatch(self.call_in_gui_thread_batch, timeout=timeout)
+
     def focus_window(self):
         """GUI penceresini öne getir"""
         if self.gui and hasattr(self.gui, 'root'):
@@ -171,8 +430,21 @@ class EnterpriseRPABot:
         except Exception:
             return False
 
+    def _gui_events(self):
+        """GUI olay yolu (yoksa None - eski polling kullanılır)"""
+        return getattr(self.gui, 'events', None) if self.gui else None
+
     def wait_for_popup_close(self, timeout: int = 30) -> bool:
-        """Pop-up kapanana kadar bekle"""
+        """Pop-up kapanana kadar bekle (GUI olayı varsa polling yok)"""
+        events = self._gui_events()
+        if events is not None:
+            closed, latency = events.wait_popups_closed(timeout)
+            if not closed:
+                self.log_step("⚠️ Pop-up kapanma süresi aşıldı", 0.1)
+                return False
+            self.wait_latency['popup_close'].record(latency)
+            return True
+
         start_time = time.time()
         while self._is_popup_open():
             if time.time() - start_time > timeout:
@@ -182,8 +454,21 @@ class EnterpriseRPABot:
         return True
 
     def wait_for_modal_ready(self, timeout: int = 10) -> bool:
-        """DÜZELTME: Modal'ın hazır olmasını bekle - Gelişmiş"""
-        print(f"🔍 Modal hazır mı kontrol ediliyor... (timeout: {timeout}s)")
+        """Modal'ın hazır olmasını bekle - GUI 'hazır' olayını yayınlar"""
+        events = self._gui_events()
+        if events is None:
+            return self._poll_modal_ready(timeout)
+
+        ready, latency = events.wait_modal_ready(timeout)
+        if not ready:
+            self.log_step(f"❌ Modal timeout! ({timeout}s) - hazır olayı gelmedi", 0.1)
+            return False
+        self.wait_latency['modal_ready'].record(latency)
+        return True
+
+    def _poll_modal_ready(self, timeout: int = 10) -> bool:
+        """DÜZELTME: Modal'ın hazır olmasını bekle - olay yolu olmayan GUI'ler için polling"""
+        self.log(f"🔍 Modal hazır mı kontrol ediliyor... (timeout: {timeout}s)")
 
         start_time = time.time()
         attempt = 0
@@ -242,7 +527,7 @@ class EnterpriseRPABot:
                     continue
 
                 # Tüm kontroller geçti!
-                print(f"✅ Modal hazır! (deneme {attempt})")
+                self.log(f"✅ Modal hazır! (deneme {attempt})")
                 self.log_step("✅ Modal form hazır", 0.5)
                 return True
 
@@ -251,7 +536,7 @@ class EnterpriseRPABot:
                 time.sleep(0.2)
                 continue
 
-        print(f"❌ Modal timeout! ({timeout}s) - Son hata: {last_error}")
+        self.log_step(f"❌ Modal timeout! ({timeout}s) - Son hata: {last_error}", 0.1)
         return False
 
     def find_modal_form(self):
@@ -330,7 +615,7 @@ class EnterpriseRPABot:
                 rooty = self.gui.notebook.winfo_rooty() + y
                 return self._BBoxWidget(rootx, rooty, w, h)
         except Exception as e:
-            print(f"❌ Tab widget error: {e}")
+            self.log_step(f"❌ Tab widget error: {e}", 0.1)
             return None
         
     def move_mouse_to_widget(self, widget, smooth: bool = True):
@@ -375,38 +660,45 @@ class EnterpriseRPABot:
                 return
 
             # Çok kısa bekleme (gerçekçi)
-            time.sleep(random.uniform(0.05, 0.15) * self.delay_factor)
+            self.pacer.pause(random.uniform(0.05, 0.15), "mouse")
 
         except Exception as e:
             self.log_step(f"⚠️ Mouse hareket genel hatası: {e}", 0.1)
             
     def click_widget_simulation(
-        self, widget_name: str, widget=None, delay: float = 0.5, call_after: bool = True
-    ):
-        """DÜZELTME: Widget tıklama simülasyonu - Gelişmiş hata yönetimi"""
-        self.log_step(f"🖱️ {widget_name} tıklanıyor...", 0.2)
+        self, widget_name: str, widget=None, delay: float = 0.5, call_after: bool = True,
+        follow_up: Optional[List[tuple]] = None
+    ) -> List[GuiCallResult]:
+        """Widget tıklama simülasyonu - fare, vurgu ve ``follow_up`` işlemleri tek GUI turunda
+
+        ``follow_up``: tıklamanın ardından aynı turda çalışacak ``(func, *args)``
+        işlemleri; yalnızca bunların sonuçları döndürülür.
+        """
+        batch = self.gui_batch()
+        self._queue_click_simulation(batch, widget_name, widget, call_after)
+        simulation_ops = len(batch)
+        for func, *args in follow_up or ():
+            batch.add(func, *args)
+
+        results = batch.run()
+
+        self.pacer.pause(random.uniform(0.1, 0.3), "click")
+        self.log_step(f"✅ {widget_name} başarıyla tıklandı", delay)
+        return results[simulation_ops:]
 
+    def _queue_click_simulation(self, batch: GuiCallBatch, widget_name: str, widget=None,
+                                call_after: bool = True):
+        """Tıklama simülasyonu adımlarını (fare, vurgu, tıklama sonrası) verilen toplu çağrıya ekle"""
+        self.log_step(f"🖱️ {widget_name} tıklanıyor...", 0.2)
         if widget and self.mouse_simulation:
             try:
                 widget.winfo_exists()
+                batch.add(self.move_mouse_to_widget, widget, True, label="mouse")
+                batch.add(self.highlight_widget, widget, label="highlight")
             except (tk.TclError, AttributeError):
                 self.log_step(f"⚠️ Widget {widget_name} mevcut değil", 0.1)
-                return
-
-            try:
-                self.call_in_gui_thread(self.move_mouse_to_widget, widget, True)
-                self.call_in_gui_thread(self.highlight_widget, widget)
-            except Exception as e:
-                self.log_step(f"⚠️ Mouse/highlight hatası: {e}", 0.1)
-
-        time.sleep(random.uniform(0.1, 0.3) * self.delay_factor)
-        self.log_step(f"✅ {widget_name} başarıyla tıklandı", delay)
-
         if call_after:
-            try:
-                self.call_in_gui_thread(self.after_mouse_click)
-            except Exception as e:
-                self.log_step(f"⚠️ After mouse click hatası: {e}", 0.1)
+            batch.add(self.after_mouse_click, label="after_click")
 
     def _find_save_button(self):
         """DÜZELTME: Save butonunu güvenli şekilde bul"""
@@ -455,27 +747,27 @@ class EnterpriseRPABot:
         
     def execute_step1_source_selection(self):
         """Adım 1: USER INPUT BEKLE"""
-        print("🔵 Adım 1 başlıyor...")
+        self.log("🔵 Adım 1 başlıyor...")
 
         user_confirmed = self.call_in_gui_thread(self.gui.step1_select_source, timeout=None)
         self.wait_for_popup_close()
 
-        print("✅ Adım 1 USER TARAFINDAN tamamlandı")
+        self.log("✅ Adım 1 USER TARAFINDAN tamamlandı")
         return bool(user_confirmed)
         
     def execute_step2_record_filtering(self):
         """Adım 2: YES/NO BEKLE"""
-        print("🔵 Adım 2 başlıyor...")
+        self.log("🔵 Adım 2 başlıyor...")
 
         result = self.call_in_gui_thread(self.gui.step2_filter_records, timeout=None)
         self.wait_for_popup_close()
 
-        print("✅ Adım 2 USER TARAFINDAN tamamlandı")
+        self.log("✅ Adım 2 USER TARAFINDAN tamamlandı")
         return bool(result)
         
     def execute_step3_data_preview(self):
         """Adım 3: Veri önizleme - TEMİZ"""
-        print("🔵 Adım 3 başlıyor...")
+        self.log("🔵 Adım 3 başlıyor...")
 
         # Önizleme için ilk Excel dosyasındaki kayıtları hazırla
         preview_records = self.prepare_preview_records()
@@ -485,10 +777,10 @@ class EnterpriseRPABot:
 
         self.call_in_gui_thread(self.gui.step3_preview_data, timeout=None)
         self.wait_for_popup_close()
-        print("✅ Adım 3 tamamlandı")
+        self.log("✅ Adım 3 tamamlandı")
         return True
 
-    def prepare_preview_records(self) -> List[Dict]:
+    def prepare_preview_records(self) -> Sequence[Transaction]:
         """İlk Excel dosyasından kayıtları önizleme için hazırla"""
         if not self.excel_files:
             self.log_step("⚠️ Önizleme için Excel dosyası bulunamadı", 0.5)
@@ -497,22 +789,10 @@ class EnterpriseRPABot:
         excel_path = self.excel_files[0]
         try:
             self.log_step(f"📂 Önizleme dosyası okunuyor: {excel_path.name}", 0.5)
-            raw_data = pd.read_excel(excel_path, header=23)
-            pattern = r'^POSH.*\/\d{15}$'
-            aciklama_cols = [col for col in raw_data.columns if 'açıklama' in str(col).lower()]
-            aciklama_col = aciklama_cols[0] if aciklama_cols else raw_data.columns[2]
-
-            filtered_data = raw_data[raw_data[aciklama_col].astype(str).str.match(pattern, na=False)]
-
-            processed_records = []
-            for _, row in filtered_data.iterrows():
-                record = {
-                    'tarih': str(row.iloc[0]) if len(row) > 0 else datetime.now().strftime('%d.%m.%Y'),
-                    'aciklama': str(row[aciklama_col]) if pd.notna(row[aciklama_col]) else "",
-                    'tutar': str(row.iloc[3]) if len(row) > 3 else "0",
-                    'dosya': excel_path.name
-                }
-                processed_records.append(record)
+            processed_records = self.load_file_records(excel_path)
+            processed_records, duplicates = self.filter_duplicate_references(processed_records)
+            if duplicates:
+                self.log_step(f"🗂️ Önizlemeden {len(duplicates)} mükerrer kayıt çıkarıldı", 0.3)
 
             self.log_step(f"🔍 Önizleme için {len(processed_records)} kayıt hazırlandı", 0.5)
             return processed_records
@@ -523,10 +803,10 @@ class EnterpriseRPABot:
         
     def execute_step4_parameters(self):
         """Adım 4: İşlem parametreleri - TEMİZ"""
-        print("🔵 Adım 4 başlıyor...")
+        self.log("🔵 Adım 4 başlıyor...")
         self.call_in_gui_thread(self.gui.step4_set_parameters, timeout=None)
         self.wait_for_popup_close()
-        print("✅ Adım 4 tamamlandı")
+        self.log("✅ Adım 4 tamamlandı")
         return True
         
     def execute_step5_data_entry(self):
@@ -584,24 +864,18 @@ class EnterpriseRPABot:
         self.log_step("🪟 Modal açılıyor...", 0.5)
         self.call_in_gui_thread(self.gui.open_advanced_data_entry, timeout=None)
 
-        timeout = 120
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            time.sleep(1)
-            if self.wait_for_modal_ready(5):
-                self.log_step("✅ Modal açıldı", 0.5)
-                break
+        if self.wait_for_modal_ready(120):
+            self.log_step("✅ Modal açıldı", 0.5)
 
         # Adım 5 sonunda modal açık bırakılır
         return True
         
     def execute_step6_batch_confirm(self, file_count: int = None, record_count: int = None):
         """Adım 6: Toplu onay"""
-        print("🔵 Adım 6 başlıyor...")
+        self.log("🔵 Adım 6 başlıyor...")
         self.call_in_gui_thread(self.gui.step6_batch_confirm, file_count, record_count, timeout=None)
         self.wait_for_popup_close()
-        print("✅ Adım 6 tamamlandı")
+        self.log("✅ Adım 6 tamamlandı")
         return True
         
     # === PHASE 3: ÇOKLU EXCEL İŞLEME ===
@@ -617,23 +891,36 @@ class EnterpriseRPABot:
         total_files = len(self.excel_files)
         self.log_step(f"📊 Toplam {total_files} Excel dosyası işlenecek", 1.0)
         
-        # Her dosyayı sırayla işle
-        for file_index, excel_path in enumerate(self.excel_files, 1):
-            self.current_file_index = file_index - 1
-            self.log_step(f"📄 Dosya {file_index}/{total_files}: {excel_path.name}", 1.0)
-            
-            # Dosyayı yükle ve işle
-            success = self.process_single_excel_file(excel_path)
-            
-            if success:
-                self.log_step(f"✅ Dosya {file_index} başarıyla tamamlandı", 1.0)
-            else:
-                self.log_step(f"❌ Dosya {file_index} işlenirken hata oluştu", 1.0)
+        # Sonraki dosyalar GUI veri girişi sürerken arka planda ayrıştırılır
+        # (akış modunda tablo tutulmadığı için ön-okuma kapalı)
+        with StatementPrefetcher(
+            self.statement_cache,
+            workers=0 if self.streaming_mode else self.prefetch_workers,
+            lookahead=self.prefetch_lookahead,
+        ) as prefetcher:
+            if prefetcher.start(self.excel_files):
+                self.log_step(f"🧵 {prefetcher.workers} işçi ile paralel ön-okuma aktif", 0.3)
+                
+            # Her dosyayı sırayla işle
+            for file_index, excel_path in enumerate(self.excel_files, 1):
+                self.current_file_index = file_index - 1
+                self.log_step(f"📄 Dosya {file_index}/{total_files}: {excel_path.name}", 1.0)
                 
-            # Dosyalar arası bekleme
-            if file_index < total_files:
-                self.log_step(f"⏳ Sonraki dosyaya geçiliyor... ({file_index + 1}/{total_files})", 1.5)
+                # Ön-okunan dosyayı önbelleğe al, sonrakileri kuyruğa ekle
+                prefetcher.collect(excel_path)
                 
+                # Dosyayı yükle ve işle
+                success = self.process_single_excel_file(excel_path)
+                
+                if success:
+                    self.log_step(f"✅ Dosya {file_index} başarıyla tamamlandı", 1.0)
+                else:
+                    self.log_step(f"❌ Dosya {file_index} işlenirken hata oluştu", 1.0)
+                    
+                # Dosyalar arası bekleme
+                if file_index < total_files:
+                    self.log_step(f"⏳ Sonraki dosyaya geçiliyor... ({file_index + 1}/{total_files})", 1.5)
+                    
         self.log_step("✅ FAZ 3 TAMAMLANDI: Tüm Excel dosyaları işlendi", 2.0)
         
     def process_single_excel_file(self, excel_path: Path) -> bool:
@@ -643,54 +930,56 @@ class EnterpriseRPABot:
             self.failed_records = 0
             self.log_step(f"📂 Excel dosyası okunuyor: {excel_path.name}", 0.8)
             
-            # Excel'i oku
-            raw_data = pd.read_excel(excel_path, header=23)  # 23. satırdan başla
-            
-            # POSH pattern filtresi
-            pattern = r'^POSH.*\/\d{15}$'
-            aciklama_cols = [col for col in raw_data.columns if 'açıklama' in str(col).lower()]
-            
-            if not aciklama_cols:
-                self.log_step("⚠️ Açıklama sütunu bulunamadı, varsayılan sütun kullanılıyor", 0.5)
-                aciklama_col = raw_data.columns[2]
-            else:
-                aciklama_col = aciklama_cols[0]
-                
-            # Filtreleme
-            filtered_data = raw_data[raw_data[aciklama_col].astype(str).str.match(pattern, na=False)]
-            
-            # Veriyi işlenebilir formata çevir
-            processed_records = []
-            for _, row in filtered_data.iterrows():
-                record = {
-                    'tarih': str(row.iloc[0]) if len(row) > 0 else datetime.now().strftime('%d.%m.%Y'),
-                    'aciklama': str(row[aciklama_col]) if pd.notna(row[aciklama_col]) else "",
-                    'tutar': str(row.iloc[3]) if len(row) > 3 else "0",
-                    'dosya': excel_path.name
-                }
-                processed_records.append(record)
+            # Excel'i oku ve POSH pattern filtresi uygula (önizlemede okunduysa önbellekten)
+            processed_records = self.load_file_records(excel_path)
                 
             # Dosya bazında veriyi sakla
             self.all_excel_data[excel_path.name] = processed_records
             
             self.log_step(f"🔍 {len(processed_records)} geçerli kayıt bulundu", 0.8)
             
+            # Kontrol noktası: dosya içerik özetiyle daha önce kaydedilenler bulunur
+            file_hash = self.checkpoint.file_hash(excel_path) if self.checkpoint else None
+            resumed_before = self.resumed_records
+            duplicates_before = self.duplicate_records
+            processed_before = self.total_records_processed
+            committed = self.find_committed_records(processed_records, file_hash, excel_path.name)
+            if committed:
+                self.log_step(f"⏯️ {len(committed)} kayıt önceki çalıştırmada kaydedilmiş, atlanıyor", 0.5)
+
+            # Filtre aşaması: referans dizinindeki kayıtlar önizlemeye ve girişe ulaşmaz.
+            # Sıra numaraları dosyadaki konumdur (kontrol noktası bunlara göre yazılır).
+            visible_records, duplicates = self.filter_duplicate_references(processed_records, committed)
+            if duplicates:
+                self.duplicate_records += len(duplicates)
+                self.log_step(f"🗂️ {len(duplicates)} mükerrer kayıt (referans dizininde var) çıkarıldı", 0.5)
+            
             # Kayıtları GUI'ye aktar
             if self.gui:
-                self.call_in_gui_thread(self.gui.set_current_records, processed_records)
-                
-            # Her kayıt için veri girişi yap
-            self.process_records_from_file(processed_records, excel_path.name)
+                self.call_in_gui_thread(self.gui.set_current_records, visible_records)
 
-            # Dosya sonucu kaydet - başarısız kayıtlar dosyaya özel hesaplanır
+            # Her kayıt için veri girişi yap (doğrudan modda toplu yazım)
+            if self.direct_commit:
+                self.commit_records_direct(processed_records, excel_path.name, file_hash,
+                                           committed=committed, duplicates=duplicates)
+            else:
+                self.process_records_from_file(processed_records, excel_path.name, file_hash,
+                                               committed=committed, duplicates=duplicates)
+
+            # Dosya sonucu kaydet - yalnızca bu çalıştırmada kaydedilenler başarılı sayılır
             file_errors = self.failed_records
-            success_count = len(processed_records) - file_errors
+            success_count = self.total_records_processed - processed_before
+            cache_stats = self.statement_cache.file_stats(excel_path.name)
             self.results.append({
                 'file': excel_path.name,
                 'records': len(processed_records),
                 'success': success_count,
                 'errors': file_errors,
-                'processing_time': time.time() - self.start_time if self.start_time else 0
+                'processing_time': time.time() - self.start_time if self.start_time else 0,
+                'cache_hits': cache_stats['hits'],
+                'cache_misses': cache_stats['misses'],
+                'resumed': self.resumed_records - resumed_before,
+                'duplicates': self.duplicate_records - duplicates_before
             })
             
             return True
@@ -699,39 +988,180 @@ class EnterpriseRPABot:
             self.log_step(f"❌ Excel işleme hatası: {e}", 1.0)
             
             # Hata sonucu kaydet
+            cache_stats = self.statement_cache.file_stats(excel_path.name)
             self.results.append({
                 'file': excel_path.name,
                 'records': 0,
                 'success': 0,
                 'errors': 1,
-                'error_message': str(e)
+                'error_message': str(e),
+                'cache_hits': cache_stats['hits'],
+                'cache_misses': cache_stats['misses']
             })
             return False
             
-    def process_records_from_file(self, records: List[Dict], file_name: str):
-        """Dosyadan gelen kayıtları tek tek işle"""
+    def _record_outcome(self, record: Transaction, index: int, status: str) -> Dict[str, Any]:
+        """Sonuç dosyasına yazılacak kayıt satırı"""
+        return {
+            'run_id': self.run_id,
+            'zaman': timestamp(),
+            'dosya': record.dosya,
+            'sira': index,
+            'tarih': record.tarih_text(),
+            'aciklama': record.aciklama,
+            'tutar': record.tutar_text(),
+            'durum': status,
+        }
+
+    def append_outcomes(self, outcomes: List[Dict[str, Any]]):
+        """Kayıt sonuçlarını bekletmeden sonuç dosyasına ekle"""
+        if self.results_sink is not None and outcomes:
+            self.results_sink.extend(outcomes)
+
+    def export_results_xlsx(self, xlsx_path: Optional[Path] = None) -> Optional[Path]:
+        """Kayıt sonuçlarından istenildiğinde XLSX raporu üret"""
+        if self.results_sink is None:
+            return None
+        xlsx_path = xlsx_path or self.results_sink.path.with_suffix('.xlsx')
+        count = self.results_sink.to_xlsx(xlsx_path, numeric_columns=('tutar',))
+        if not count:
+            return None
+        self.log_step(f"📑 {count} kayıt sonucu XLSX'e aktarıldı: {xlsx_path}", 0.3)
+        return xlsx_path
+
+    def process_records_from_file(self, records: Sequence[Union[Transaction, Dict]], file_name: str,
+                                  file_hash: Optional[str] = None, committed: Optional[set] = None,
+                                  duplicates: Optional[set] = None):
+        """Dosyadan gelen kayıtları tek tek işle (Transaction veya eski dict)"""
         total_records = len(records)
         self.log_step(f"📝 {file_name} dosyasından {total_records} kayıt işlenecek", 1.0)
+        if committed is None:
+            committed = self.find_committed_records(records, file_hash, file_name)
+            if committed:
+                self.log_step(f"⏯️ {len(committed)} kayıt önceki çalıştırmada kaydedilmiş, atlanıyor", 0.5)
+        if duplicates is None:
+            duplicates = self.find_duplicate_references(records, committed)
+            if duplicates:
+                self.duplicate_records += len(duplicates)
+                self.log_step(f"🗂️ {len(duplicates)} mükerrer kayıt (referans dizininde var) atlanıyor", 0.5)
         
         for record_index, record in enumerate(records, 1):
-            self.log_step(f"📋 Kayıt {record_index}/{total_records}: {record['aciklama'][:50]}...", 0.3)
+            if record_index in committed:
+                self.resumed_records += 1
+                continue
+            if record_index in duplicates:
+                continue
+            record = as_transaction(record)
+            self.log_step(f"📋 Kayıt {record_index}/{total_records}: {record.aciklama[:50]}...", 0.3)
             
             # Tek kaydı işle
             success = self.process_single_record(record, record_index, total_records)
             
             if success:
                 self.total_records_processed += 1
+                # Kaydetme onaylandıktan hemen sonra kontrol noktası yazılır
+                if file_hash is not None:
+                    self.checkpoint.mark(file_hash, [record_index], file_name)
+                self.remember_references([record], file_name)
             else:
                 self.failed_records += 1
+            self.append_outcomes([
+                self._record_outcome(record, record_index, "BAŞARILI" if success else "HATA")
+            ])
                 
             # Kayıtlar arası kısa bekleme
-            time.sleep(random.uniform(0.2, 0.5) * self.delay_factor)
+            self.pacer.pause(random.uniform(0.2, 0.5), "record")
             
         self.log_step(f"✅ {file_name} dosyasının tüm kayıtları işlendi", 1.0)
         
-    def process_single_record(self, record: Dict, record_num: int, total: int) -> bool:
+    def validate_for_commit(self, record: Transaction) -> Optional[str]:
+        """Kaydı form kurallarıyla doğrula; hata varsa açıklamasını döndür"""
+        if record.tarih is None or record.tarih == "":
+            return "tarih boş"
+        if not record.aciklama:
+            return "açıklama boş"
+        if record.tutar_kurus is None:
+            return "tutar geçersiz"
+        if not record.dosya:
+            return "dosya adı boş"
+        return None
+        
+    def commit_records_direct(self, records: Sequence[Union[Transaction, Dict]], file_name: str,
+                              file_hash: Optional[str] = None, committed: Optional[set] = None,
+                              duplicates: Optional[set] = None):
+        """Kayıtları widget simülasyonu olmadan doğrula ve GUI modeline toplu yaz"""
+        total_records = len(records)
+        self.log_step(f"⚡ {file_name}: {total_records} kayıt doğrudan yazılıyor", 0)
+        started = time.perf_counter()
+        already_committed = committed
+        committed = 0
+        failed = 0
+        if already_committed is None:
+            already_committed = self.find_committed_records(records, file_hash, file_name)
+            if already_committed:
+                self.log_step(f"⏯️ {len(already_committed)} kayıt önceki çalıştırmada kaydedilmiş, atlanıyor", 0)
+        self.resumed_records += len(already_committed)
+        if duplicates is None:
+            duplicates = self.find_duplicate_references(records, already_committed)
+            if duplicates:
+                self.duplicate_records += len(duplicates)
+                self.log_step(f"🗂️ {len(duplicates)} mükerrer kayıt (referans dizininde var) atlanıyor", 0)
+        skip = already_committed | duplicates
+        
+        for start in range(0, total_records, self.direct_commit_chunk):
+            rows = []
+            valid = []
+            outcomes = []
+            for offset, record in enumerate(records[start:start + self.direct_commit_chunk]):
+                index = start + offset + 1
+                if index in skip:
+                    continue
+                record = as_transaction(record)
+                error = self.validate_for_commit(record)
+                if error:
+                    failed += 1
+                    outcomes.append(self._record_outcome(record, index, f"HATA: {error}"))
+                    self.log_step(f"⚠️ Kayıt atlandı ({error}): {record.aciklama[:40]}", 0)
+                    continue
+                valid.append((record, index))
+                # GUI sınırı: form yolundaki save_advanced_record ile aynı değerler
+                aciklama = record.aciklama
+                rows.append((
+                    record.tarih_text(),
+                    record.dosya,
+                    aciklama[:80] + "..." if len(aciklama) > 80 else aciklama,
+                    float(record.tutar),
+                ))
+            if rows:
+                # Her parça tek GUI çağrısı; ekran dosya sonunda bir kez yenilenir
+                result = self.call_in_gui_thread(self.gui.append_records_bulk, rows, False)
+                if result is None:
+                    failed += len(rows)
+                else:
+                    committed += result
+                status = "BAŞARILI" if result is not None else "HATA: GUI yazımı"
+                outcomes.extend(self._record_outcome(record, index, status) for record, index in valid)
+                if result is not None:
+                    if file_hash is not None:
+                        self.checkpoint.mark(file_hash, [index for _, index in valid], file_name)
+                    self.remember_references([record for record, _ in valid], file_name)
+            # Parçanın sonuçları kayıt sırasıyla tek yazımla eklenir
+            self.append_outcomes(sorted(outcomes, key=lambda row: row['sira']))
+                
+        self.call_in_gui_thread(self.gui.refresh_after_bulk_commit)
+        
+        self.total_records_processed += committed
+        self.failed_records += failed
+        self.total_failed_records += failed
+        elapsed = time.perf_counter() - started
+        rate = committed / elapsed if elapsed > 0 else 0
+        self.log_step(f"✅ {file_name}: {committed} kayıt yazıldı, {failed} hata ({rate:.0f} kayıt/sn)", 0)
+        
+    def process_single_record(self, record: Union[Transaction, Dict], record_num: int, total: int) -> bool:
         """DÜZELTME: Tek kayıt işleme - Gelişmiş hata yönetimi"""
         try:
+            record = as_transaction(record)
+
             if not self.wait_for_modal_ready(5):
                 self.log_step("⚠️ Modal form hazır değil, kayıt atlanıyor", 0.5)
                 self.total_failed_records += 1
@@ -745,50 +1175,45 @@ class EnterpriseRPABot:
 
             entries = modal_entries
 
+            # GUI sınırı: tarih ve tutar yalnızca forma yazılırken metne çevrilir
+            aciklama = record.aciklama
             field_operations = [
-                ('date_entry', record['tarih'], "📅 Tarih"),
-                ('desc_entry', record['aciklama'][:80] + "..." if len(record['aciklama']) > 80 else record['aciklama'], "📝 Açıklama"),
-                ('amount_entry', record['tutar'], "💰 Tutar"),
-                ('file_entry', record['dosya'], "📁 Dosya")
+                ('date_entry', record.tarih_text(), "📅 Tarih"),
+                ('desc_entry', aciklama[:80] + "..." if len(aciklama) > 80 else aciklama, "📝 Açıklama"),
+                ('amount_entry', record.tutar_text(), "💰 Tutar"),
+                ('file_entry', record.dosya, "📁 Dosya")
             ]
 
+            # Tüm alanlar ve kaydetme tek GUI turunda çalışır; fare simülasyonunda her
+            # alanın fare + vurgu adımları da doldurmadan hemen önce aynı tura eklenir
+            batch = self.gui_batch()
+            fill_indices = []
             for field_key, field_value, field_desc in field_operations:
-                try:
-                    if field_key not in entries:
-                        self.log_step(f"⚠️ {field_key} alanı bulunamadı", 0.2)
-                        continue
-
-                    self.log_step(f"{field_desc} giriliyor: {str(field_value)[:30]}...", 0.3)
-                    try:
-                        entries[field_key].winfo_exists()
-                    except tk.TclError:
-                        self.log_step(f"⚠️ {field_key} widget'ı mevcut değil", 0.2)
-                        continue
-
-                    self.click_widget_simulation(f"{field_desc} alanı", entries.get(field_key), delay=0.3)
-                    result = self.call_in_gui_thread(self.fill_entry_field, entries[field_key], str(field_value))
-                    if result is False:
-                        self.log_step(f"⚠️ {field_key} doldurma başarısız", 0.2)
-
-                except Exception as e:
-                    self.log_step(f"⚠️ {field_key} işleme hatası: {e}", 0.2)
+                if field_key not in entries:
+                    self.log_step(f"⚠️ {field_key} alanı bulunamadı", 0.2)
                     continue
 
-            self.log_step("💾 Kayıt kaydediliyor...", 0.5)
-
-            try:
-                save_button = self._find_save_button()
-                if save_button:
-                    self.click_widget_simulation("Kaydet butonu", save_button, delay=0.5)
+                self.log_step(f"{field_desc} giriliyor: {str(field_value)[:30]}...", 0.3)
+                if self.mouse_simulation:
+                    self._queue_click_simulation(batch, f"{field_desc} alanı", entries[field_key])
+                index = batch.add(self.fill_entry_field, entries[field_key], str(field_value), label=field_key)
+                fill_indices.append((field_key, index))
 
-                result = self.call_in_gui_thread(self.gui.save_advanced_record)
-                if result is False:
-                    self.log_step("⚠️ Kaydetme işlemi başarısız", 0.3)
-                    self.total_failed_records += 1
-                    return False
+            self.log_step("💾 Kayıt kaydediliyor...", 0.5)
 
-            except Exception as e:
-                self.log_step(f"⚠️ Kaydetme hatası: {e}", 0.3)
+            save_button = self._find_save_button() if self.mouse_simulation else None
+            if save_button:
+                self._queue_click_simulation(batch, "Kaydet butonu", save_button)
+            save_index = batch.add(self.gui.save_advanced_record, label="save")
+            results = batch.run()
+            for field_key, index in fill_indices:
+                self._report_fill_result(field_key, results[index:index + 1])
+            if self.mouse_simulation:
+                self.pacer.pause(random.uniform(0.1, 0.3), "click")
+
+            save_result = results[save_index] if len(results) > save_index else None
+            if save_result is None or not save_result.ok or save_result.value is False:
+                self.log_step("⚠️ Kaydetme işlemi başarısız", 0.3)
                 self.total_failed_records += 1
                 return False
 
@@ -800,6 +1225,11 @@ class EnterpriseRPABot:
             self.total_failed_records += 1
             return False
             
+    def _report_fill_result(self, field_key: str, results: List[GuiCallResult]):
+        """Toplu turdan dönen alan doldurma sonucunu raporla"""
+        if not results or not results[0].ok or results[0].value is False:
+            self.log_step(f"⚠️ {field_key} doldurma başarısız", 0.2)
+            
     def fill_entry_field(self, entry_widget, value: str) -> bool:
         """Entry alanını güvenli şekilde doldur."""
         try:
@@ -820,17 +1250,23 @@ class EnterpriseRPABot:
             self.log_step("⚠️ Henüz hiç Excel işlenmedi - FAZ 4 erken!", 1.0)
             return
 
-        processed_files = len([r for r in self.results if r.get('success', 0) > 0])
+        # Bu çalıştırmada kaydedilen, önceki çalıştırmada kaydedilmiş veya mükerrer
+        # olarak atlanan kaydı olan dosya işlenmiş sayılır (tekrar çalıştırmada success 0 olabilir)
+        processed_files = len([
+            r for r in self.results
+            if r.get('success', 0) + r.get('resumed', 0) + r.get('duplicates', 0) > 0
+        ])
         if processed_files == 0:
             self.log_step("⚠️ Hiç dosya başarıyla işlenmedi - FAZ 4 erken!", 1.0)
             return
 
         self.log_step("✅ Gerçekten tüm işlemler bitti - FAZ 4 başlıyor", 1.0)
 
-        self.log_step("✅ Adım 6: Toplu onay işlemi gerçekleştiriliyor...", 1.0)
         total_files = len(self.excel_files)
         total_records = self.total_records_processed
-        self.execute_step6_batch_confirm(total_files, total_records)
+        if not self.direct_commit:
+            self.log_step("✅ Adım 6: Toplu onay işlemi gerçekleştiriliyor...", 1.0)
+            self.execute_step6_batch_confirm(total_files, total_records)
 
         # Sonuç istatistikleri
         total_attempted = self.total_records_processed + self.total_failed_records
@@ -845,7 +1281,37 @@ class EnterpriseRPABot:
         self.log_step(f"   ✅ Başarılı İşlemler: {total_records}", 0.3)
         self.log_step(f"   ❌ Başarısız İşlemler: {self.total_failed_records}", 0.3)
         self.log_step(f"   📈 Başarı Oranı: %{success_rate:.1f}", 0.3)
+        if self.resumed_records:
+            self.log_step(f"   ⏯️ Önceki Çalıştırmadan Atlanan: {self.resumed_records}", 0.3)
+        if self.reference_index is not None:
+            dup_stats = self.get_duplicate_stats()
+            self.log_step(
+                f"   🗂️ Mükerrer Atlanan: {dup_stats['skipped']} "
+                f"(dizin {dup_stats['size']} kayıt, Bloom eledi {dup_stats['bloom_rejected']}/"
+                f"{dup_stats['checked']}, DB sorgusu {dup_stats['db_lookups']})",
+                0.3
+            )
         self.log_step(f"   ⏱️ Toplam Süre: {processing_time:.1f} saniye", 0.3)
+        cache_stats = self.statement_cache.stats()
+        self.log_step(
+            f"   🗃️ Ekstre Önbelleği: {cache_stats['hits']} isabet / {cache_stats['misses']} okuma",
+            0.3
+        )
+        self.log_step(f"   🔁 GUI çağrı turu: {self.gui_round_trips}", 0.3)
+        self.log_step(f"   🐢 Bekleme/iş dağılımı: {self.pacer.format_stats()}", 0.3)
+        if self.results_sink is not None:
+            self.log_step(
+                f"   🧾 Kayıt sonuçları: {self.results_sink.path} ({self.results_sink.appended} satır)", 0.3
+            )
+        status_stats = self.status_channel.stats()
+        self.log_step(
+            f"   💬 Durum mesajı: {status_stats['posted']} gönderildi, "
+            f"{status_stats['coalesced']} birleştirildi, {status_stats['dropped']} düşürüldü",
+            0.3
+        )
+        for histogram in self.wait_latency.values():
+            if histogram.count:
+                self.log_step(f"   ⏳ Bekleme gecikmesi {histogram.format()}", 0.3)
 
         self.show_final_completion_dialog(total_records, total_files, success_rate)
 
@@ -862,13 +1328,14 @@ class EnterpriseRPABot:
             f"📈 Başarı Oranı: %{success_rate:.1f}"
         )
 
-        # Bilgi kutusunu GUI thread'inde göster
-        self.call_in_gui_thread(
-            messagebox.showinfo,
-            "Tamamlandı",
-            stats_text,
-            parent=self.gui.root,
-        )
+        # Bilgi kutusunu GUI thread'inde göster (doğrudan modda onay bekleyen yok)
+        if not self.direct_commit:
+            self.call_in_gui_thread(
+                messagebox.showinfo,
+                "Tamamlandı",
+                stats_text,
+                parent=self.gui.root,
+            )
 
         # Kullanıcı onayladıktan sonra modal'ı kapat ve GUI'yi sonlandır
         if getattr(self.gui, "data_entry_window", None):
@@ -882,18 +1349,38 @@ class EnterpriseRPABot:
         """Tam otomasyon sekansı - 4 fazlı süreç"""
         try:
             self.start_time = time.time()
+            self.run_id = start_run()
+            self.results_sink = ResultsSink(self.results_dir / f"kayit_sonuclari_{self.run_id}.jsonl")
+            self.pacer.reset()
             self.total_failed_records = 0
+            self.resumed_records = 0
+            self.duplicate_records = 0
+            self.set_gui_automation_active(True)
             self.log_step("🚀 KARMAŞIK RPA SİSTEMİ BAŞLATILUYOR...", 2.0)
             self.log_step("🎯 Enterprise seviye otomasyon - 4 fazlı süreç", 1.0)
+            self.log(f"🆔 Çalıştırma kimliği: {self.run_id}")
             
-            # FAZ 2: 6 Adımlı Süreç
-            self.phase2_execute_6_step_process()
+            # FAZ 2: 6 Adımlı Süreç (doğrudan kayıt modunda kullanıcı adımları atlanır)
+            if self.direct_commit:
+                self.log_step("⚡ Doğrudan kayıt modu: FAZ 2 etkileşimli adımları atlandı", 0)
+            else:
+                self.phase2_execute_6_step_process()
             
             # FAZ 3: Çoklu Excel İşleme
             self.phase3_process_multiple_excel_files()
             
             # FAZ 4: Sonlandırma
             self.phase4_finalization_and_reports()
+
+            # Hatasız biten çalıştırmanın kontrol noktası silinir; hatalı kayıtlar
+            # bir sonraki çalıştırmada yeniden denenir
+            if self.checkpoint is not None:
+                if self.total_failed_records == 0:
+                    self.checkpoint.clear()
+                else:
+                    self.log_step(
+                        f"⏯️ {self.total_failed_records} hatalı kayıt için kontrol noktası korunuyor", 0.3
+                    )
             
             # Genel başarı mesajı
             self.log_step("🎉 KARMAŞIK RPA SİSTEMİ BAŞARIYLA TAMAMLANDI!", 2.0)
@@ -903,6 +1390,9 @@ class EnterpriseRPABot:
             self.log_step(f"❌ KRITIK RPA SISTEMI HATASI: {e}", 2.0)
         finally:
             self.is_running = False
+            self.set_gui_automation_active(False)
+            if self.results_sink is not None:
+                self.results_sink.close()
             
     def run(self, excel_files: List[Path] = None, progress_callback: Callable = None):
         """DÜZELTME: RPA'yi direkt çalıştır - thread yok"""
@@ -918,7 +1408,7 @@ class EnterpriseRPABot:
 
         # DÜZELTME: Thread kullanma, direkt çalıştır
         try:
-            print("🚀 RPA direkt başlatılıyor...")
+            self.log("🚀 RPA direkt başlatılıyor...")
             self.run_complete_automation_sequence()
 
             # Progress callback ile sonucu bildir
@@ -934,17 +1424,26 @@ class EnterpriseRPABot:
             self.is_running = False
         
     def get_results(self) -> List[Dict[str, Any]]:
-        """İşlem sonuçlarını döndür"""
+        """İşlem sonuçlarını döndür (dosya bazında cache_hits / cache_misses dahil)"""
         return self.results
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Ekstre önbelleği sayaçlarını döndür"""
+        return self.statement_cache.stats()
+
+    def get_wait_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """Modal/popup bekleme gecikmesi özetleri (count, p50, p95, max - ms)"""
+        return {kind: histogram.summary() for kind, histogram in self.wait_latency.items()}
         
     def stop(self):
         """RPA'yi durdur"""
         self.is_running = False
-        print("🛑 RPA sistemi durduruldu")
+        self.log("🛑 RPA sistemi durduruldu")
+        self.status_channel.stop()
 
 # Test fonksiyonu
 if __name__ == "__main__":
-    print("🤖 Karmaşık RPA Motoru - Test Modu")
     bot = EnterpriseRPABot()
+    bot.log("🤖 Karmaşık RPA Motoru - Test Modu")
     bot.set_processing_speed("fast")
-    print("✅ RPA motoru hazır")
+    bot.log("✅ RPA motoru hazır")
@@ -1,10 +1,111 @@
 """Utilities for reading and processing Excel files."""
 
+import re
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import List
+from typing import Any, Iterator, List, Optional, Tuple
+
+from .posh_parser import POSH_PATTERN, POSH_RE
+from .transaction import StatementRecords, Transaction, dates_from_column, kurus_from_column, kurus_or_invalid, parse_date
+
+
+# Banka ekstresinde gerçek başlıkların bulunduğu satır
+HEADER_ROW = 23
 
 
 def read_excel_files(files: List[Path]):
     """Placeholder Excel processing."""
     return [pd.read_excel(f) for f in files]
+
+
+def find_description_column(raw_data: pd.DataFrame):
+    """Return the 'Açıklama' column, falling back to the third column."""
+    aciklama_cols = [col for col in raw_data.columns if 'açıklama' in str(col).lower()]
+    return aciklama_cols[0] if aciklama_cols else raw_data.columns[2]
+
+
+def filter_posh_frame(raw_data: pd.DataFrame, pattern: str = POSH_PATTERN) -> Tuple[pd.DataFrame, object]:
+    """Keep only POSH rows and return them with the description column name."""
+    aciklama_col = find_description_column(raw_data)
+    mask = raw_data[aciklama_col].astype(str).str.match(pattern, na=False)
+    return raw_data[mask], aciklama_col
+
+
+def _column_as_text(column: pd.Series) -> List[str]:
+    """Convert a whole column to ``str`` values exactly like ``str(value)``."""
+    # object'e çevirip numpy ile dönüştürmek iterrows + str() ile aynı sonucu
+    # verir (NaN -> 'nan', Timestamp -> '2025-07-23 00:00:00')
+    return np.asarray(column.astype(object)).astype(str).tolist()
+
+
+def extract_records(filtered_data: pd.DataFrame, aciklama_col, file_name: Optional[str] = None) -> StatementRecords:
+    """Build typed records from an already filtered frame using whole-column operations."""
+    row_count = len(filtered_data)
+    column_count = len(filtered_data.columns)
+
+    if column_count > 0:
+        tarih = dates_from_column(filtered_data.iloc[:, 0])
+    else:
+        tarih = [None] * row_count
+
+    aciklama_values = filtered_data[aciklama_col]
+    aciklama = _column_as_text(aciklama_values.where(aciklama_values.notna(), ""))
+
+    if column_count > 3:
+        tutar = kurus_from_column(filtered_data.iloc[:, 3])
+    else:
+        tutar = np.zeros(row_count, dtype=np.int64)
+
+    return StatementRecords(tarih, aciklama, tutar, file_name or "")
+
+
+def iter_posh_rows(excel_path: Path, header_row: int = HEADER_ROW,
+                   pattern: str = POSH_PATTERN) -> Iterator[Tuple[Any, str, Any]]:
+    """Stream raw ``(tarih, aciklama, tutar)`` cells of POSH rows without loading the sheet.
+
+    The workbook is opened in openpyxl read-only mode, the preamble rows
+    before ``header_row`` are skipped and the pattern is applied row by row,
+    so memory grows with the number of matches instead of the file size.
+    """
+    from openpyxl import load_workbook
+
+    matcher = POSH_RE if pattern == POSH_PATTERN else re.compile(pattern)
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(min_row=header_row + 1, values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        aciklama_idx = next(
+            (i for i, col in enumerate(header) if 'açıklama' in str(col).lower()), 2
+        )
+        for row in rows:
+            # Read-only modda boş hücreyle biten satırlar kısa gelebilir
+            if len(row) <= aciklama_idx:
+                continue
+            aciklama = row[aciklama_idx]
+            if aciklama is None or not matcher.match(str(aciklama)):
+                continue
+            yield row[0], str(aciklama), row[3] if len(row) > 3 else None
+    finally:
+        workbook.close()
+
+
+def iter_posh_records(excel_path: Path, header_row: int = HEADER_ROW,
+                      pattern: str = POSH_PATTERN) -> Iterator[Transaction]:
+    """Generator of :class:`Transaction` records from :func:`iter_posh_rows`."""
+    dosya = Path(excel_path).name
+    for tarih, aciklama, tutar in iter_posh_rows(excel_path, header_row, pattern):
+        yield Transaction.from_values(tarih, aciklama, tutar, dosya)
+
+
+def stream_posh_records(excel_path: Path, header_row: int = HEADER_ROW,
+                        pattern: str = POSH_PATTERN) -> StatementRecords:
+    """Collect streamed POSH rows into compact typed columns."""
+    tarih, aciklama, tutar = [], [], []
+    for tarih_value, aciklama_value, tutar_value in iter_posh_rows(excel_path, header_row, pattern):
+        tarih.append(parse_date(tarih_value))
+        aciklama.append(aciklama_value)
+        tutar.append(kurus_or_invalid(tutar_value))
+    return StatementRecords(tarih, aciklama, np.array(tutar, dtype=np.int64), Path(excel_path).name)
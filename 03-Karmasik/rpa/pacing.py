@@ -0,0 +1,83 @@
+"""
+Tempo Zamanlayıcı - otomasyon adımları arasındaki bilinçli beklemeler
+Tek bir factor tüm beklemeleri ölçekler (0: kapalı); bekleme süresi işten ayrı sayılır
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class PacingScheduler:
+    """Adım başına bekleme bütçesi, bekleme/iş süresi ayrımıyla"""
+
+    def __init__(self, factor: float = 1.0, budgets: Optional[Dict[str, float]] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        self._factor = max(0.0, factor)
+        # İşlem adı -> varsayılan bekleme (saniye, factor uygulanmadan önce)
+        self.budgets: Dict[str, float] = dict(budgets or {})
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def factor(self) -> float:
+        return self._factor
+
+    @property
+    def enabled(self) -> bool:
+        return self._factor > 0
+
+    def set_factor(self, factor: float) -> None:
+        """Tüm beklemeleri factor ile ölçekle; 0 kapatır"""
+        self._factor = max(0.0, factor)
+
+    def set_budget(self, action: str, seconds: float) -> None:
+        self.budgets[action] = max(0.0, seconds)
+
+    def reset(self) -> None:
+        """Yeni çalıştırma: sayaçları sıfırla, duvar saatini yeniden başlat"""
+        with self._lock:
+            self._started = time.perf_counter()
+            self._paced = 0.0
+            self._pauses = 0
+            self._skipped = 0
+            self._by_action: Dict[str, float] = {}
+
+    def pause(self, delay: Optional[float] = None, action: str = "step") -> float:
+        """delay (veya adımın bütçesi) x factor kadar bekle; beklenen saniyeyi döndürür"""
+        base = self.budgets.get(action, 0.0) if delay is None else delay
+        seconds = base * self._factor
+        if seconds <= 0:
+            with self._lock:
+                self._skipped += 1
+            return 0.0
+
+        started = time.perf_counter()
+        self._sleep(seconds)
+        slept = time.perf_counter() - started
+        with self._lock:
+            self._paced += slept
+            self._pauses += 1
+            self._by_action[action] = self._by_action.get(action, 0.0) + slept
+        return slept
+
+    def stats(self) -> Dict[str, object]:
+        """wall_s, pacing_s, work_s, pauses, skipped ve by_action"""
+        with self._lock:
+            wall = time.perf_counter() - self._started
+            paced = self._paced
+            return {
+                'wall_s': wall,
+                'pacing_s': paced,
+                'work_s': max(0.0, wall - paced),
+                'pauses': self._pauses,
+                'skipped': self._skipped,
+                'by_action': dict(self._by_action),
+            }
+
+    def format_stats(self) -> str:
+        s = self.stats()
+        share = s['pacing_s'] / s['wall_s'] * 100 if s['wall_s'] > 0 else 0.0
+        return (f"toplam {s['wall_s']:.1f}s = bekleme {s['pacing_s']:.1f}s "
+                f"(%{share:.0f}, {s['pauses']} duraklama) + iş {s['work_s']:.1f}s")
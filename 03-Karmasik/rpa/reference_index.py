@@ -0,0 +1,131 @@
+"""
+Referans Dizini - daha önce girilmiş POSH referansları
+Anahtarlar SQLite'ta; toplu kontrolde önce Bloom filtresi, yalnızca olası eşleşmeler sorgulanır
+"""
+
+import hashlib
+import math
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+
+class BloomFilter:
+    """str anahtarlar için sabit boyutlu Bloom filtresi (BLAKE2b çift hash)"""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class ReferenceIndex:
+    """Önünde Bloom filtresi olan SQLite referans anahtarı kümesi"""
+
+    DEFAULT_CAPACITY = 100_000
+    # SQLite parametre sınırının altında kalan sorgu parçası
+    QUERY_CHUNK = 500
+
+    def __init__(self, path: Union[str, Path], capacity: int = DEFAULT_CAPACITY):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS refs ("
+            "key TEXT PRIMARY KEY, dosya TEXT, eklenme TEXT) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+        count = self._conn.execute("SELECT COUNT(*) FROM refs").fetchone()[0]
+        # Filtre dolarsa yanlış pozitif oranı artar; mevcut kayıtların iki katına göre boyutlanır
+        self._bloom = BloomFilter(max(capacity, count * 2))
+        for (key,) in self._conn.execute("SELECT key FROM refs"):
+            self._bloom.add(key)
+        self._count = count
+
+        self.checked = 0
+        self.bloom_rejected = 0
+        self.db_lookups = 0
+        self.duplicates = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: str) -> bool:
+        return self.known_mask([key])[0]
+
+    def known_mask(self, keys: Sequence[Optional[str]]) -> List[bool]:
+        """Dizinde zaten olan her anahtar için True (None anahtarlar bilinmez sayılır)"""
+        result = [False] * len(keys)
+        candidates = [i for i, key in enumerate(keys) if key and key in self._bloom]
+        found = set()
+        with self._lock:
+            for start in range(0, len(candidates), self.QUERY_CHUNK):
+                chunk = list({keys[i] for i in candidates[start:start + self.QUERY_CHUNK]})
+                placeholders = ",".join("?" * len(chunk))
+                found.update(
+                    key for (key,) in self._conn.execute(
+                        f"SELECT key FROM refs WHERE key IN ({placeholders})", chunk
+                    )
+                )
+            for i in candidates:
+                if keys[i] in found:
+                    result[i] = True
+            valid = sum(1 for key in keys if key)
+            self.checked += valid
+            self.bloom_rejected += valid - len(candidates)
+            self.db_lookups += len(candidates)
+            self.duplicates += sum(result)
+        return result
+
+    def add_many(self, keys: Iterable[Optional[str]], dosya: str = '') -> int:
+        """İşlenmiş anahtarları kaydet; yeni eklenen sayısını döndürür"""
+        keys = [key for key in keys if key]
+        if not keys:
+            return 0
+        added_at = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO refs (key, dosya, eklenme) VALUES (?, ?, ?)",
+                [(key, dosya, added_at) for key in keys],
+            )
+            self._conn.commit()
+            added = self._conn.total_changes - before
+            self._count += added
+            for key in keys:
+                self._bloom.add(key)
+        return added
+
+    def stats(self) -> Dict[str, int]:
+        """size, checked, bloom_rejected, db_lookups ve duplicates"""
+        with self._lock:
+            return {
+                'size': self._count,
+                'checked': self.checked,
+                'bloom_rejected': self.bloom_rejected,
+                'db_lookups': self.db_lookups,
+                'duplicates': self.duplicates,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,126 @@
+"""
+Sonuç Kaydı - kayıt başına kalıcı tek JSONL satırı
+Çökme sonuçları kaybettirmez; XLSX rapor istendiğinde akışla üretilir
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Set, Tuple, Union
+
+
+class ResultsSink:
+    """Kayıt sonuçlarının çökmeye dayanıklı JSONL günlüğü"""
+
+    def __init__(self, path: Union[str, Path], fsync_every: int = 100):
+        self.path = Path(path)
+        self.fsync_every = max(1, fsync_every)
+        self._file = None
+        self._since_sync = 0
+        # Bu oturumda eklenen satır sayısı
+        self.appended = 0
+
+    def _open(self):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        return self._file
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Tek sonucu yaz ve dönmeden önce işletim sistemine teslim et"""
+        self.extend((row,))
+
+    def extend(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Birden çok sonucu tek flush ile yaz; yazılan sayıyı döndürür"""
+        handle = self._open()
+        count = 0
+        for row in rows:
+            handle.write(json.dumps(row, ensure_ascii=False, default=str) + '\n')
+            count += 1
+        if not count:
+            return 0
+        handle.flush()
+        self.appended += count
+        self._since_sync += count
+        if self._since_sync >= self.fsync_every:
+            os.fsync(handle.fileno())
+            self._since_sync = 0
+        return count
+
+    def reset(self) -> None:
+        """Baştan başla: saklanan tüm sonuçları sil"""
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        open(self.path, 'w', encoding='utf-8').close()
+        self.appended = 0
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Saklanan sonuçları geri oku; yarım kalan son satır (çökme) atlanır"""
+        if self._file is not None:
+            self._file.flush()
+        if not self.path.exists():
+            return
+        with open(self.path, encoding='utf-8') as handle:
+            for line in handle:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def committed_keys(self, key_fields: Sequence[str], status_field: Optional[str] = None,
+                       ok_status: Optional[str] = None) -> Set[Tuple[str, ...]]:
+        """Saklanan satırların anahtarları (metin tuple), istenirse yalnızca ok_status olanlar"""
+        keys = set()
+        for row in self.rows():
+            if status_field and row.get(status_field) != ok_status:
+                continue
+            keys.add(tuple(str(row.get(field, '')) for field in key_fields))
+        return keys
+
+    def to_xlsx(self, xlsx_path: Union[str, Path], numeric_columns: Sequence[str] = ()) -> int:
+        """Saklanan sonuçları XLSX dosyasına akıt; satır sayısını döndürür"""
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        header = None
+        count = 0
+        for row in self.rows():
+            if header is None:
+                header = list(row.keys())
+                sheet.append(header)
+            values = []
+            for column in header:
+                value = row.get(column)
+                if column in numeric_columns and value not in (None, ''):
+                    try:
+                        value = float(value)
+                    except (TypeError, ValueError):
+                        pass
+                values.append(value)
+            sheet.append(values)
+            count += 1
+        if count:
+            Path(xlsx_path).parent.mkdir(parents=True, exist_ok=True)
+            workbook.save(xlsx_path)
+        return count
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+            self._since_sync = 0
+
+    def __enter__(self) -> "ResultsSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def timestamp() -> str:
+    """Eski XLSX raporlarının biçiminde zaman damgası"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
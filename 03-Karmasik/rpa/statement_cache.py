@@ -0,0 +1,116 @@
+"""
+Ekstre Önbelleği - ayrıştırılmış ve POSH filtrelenmiş ekstreler (bellek içi)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import pandas as pd
+
+from .excel_cache import read_excel_cached
+from .excel_processor import HEADER_ROW, filter_posh_frame
+
+
+class StatementCache:
+    """Her Excel dosyasını çalıştırma başına bir kez ayrıştır; LRU ile bellek bütçesinde kal"""
+
+    DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        self.memory_budget = memory_budget
+        self._entries: "OrderedDict[Tuple, Tuple[pd.DataFrame, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._file_stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def make_key(excel_path: Path, header_row: int = HEADER_ROW) -> Tuple:
+        """Önbellek anahtarı: çözülmüş yol + mtime + boyut + başlık satırı"""
+        path = Path(excel_path).resolve()
+        stat = os.stat(path)
+        return (str(path), stat.st_mtime_ns, stat.st_size, header_row)
+
+    def get_filtered(self, excel_path: Path, header_row: int = HEADER_ROW) -> Tuple[pd.DataFrame, Any]:
+        """Filtrelenmiş POSH tablosunu ve açıklama sütununu döndür"""
+        key = self.make_key(excel_path, header_row)
+
+        with self._lock:
+            file_stats = self._file_stats.setdefault(Path(excel_path).name, {'hits': 0, 'misses': 0})
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                file_stats['hits'] += 1
+                return entry[0], entry[1]
+
+        # Disk önbelleği openpyxl'den önce kontrol edilir
+        raw_data = read_excel_cached(excel_path, header=header_row)
+        filtered_data, aciklama_col = filter_posh_frame(raw_data)
+        self.put(key, filtered_data, aciklama_col)
+
+        with self._lock:
+            self.misses += 1
+            file_stats['misses'] += 1
+        return filtered_data, aciklama_col
+
+    def contains(self, excel_path: Path, header_row: int = HEADER_ROW) -> bool:
+        """Dosyanın güncel sürümü önbellekte mi (sayaçlar değişmez)"""
+        try:
+            key = self.make_key(excel_path, header_row)
+        except OSError:
+            return False
+        with self._lock:
+            return key in self._entries
+
+    def store_parsed(self, excel_path: Path, filtered_data: pd.DataFrame, aciklama_col,
+                     header_row: int = HEADER_ROW) -> None:
+        """Başka yerde (ör. ön okuma işçisi) ayrıştırılan tabloyu sakla ve okuma say"""
+        self.put(self.make_key(excel_path, header_row), filtered_data, aciklama_col)
+        with self._lock:
+            file_stats = self._file_stats.setdefault(Path(excel_path).name, {'hits': 0, 'misses': 0})
+            self.misses += 1
+            file_stats['misses'] += 1
+
+    def put(self, key: Tuple, filtered_data: pd.DataFrame, aciklama_col) -> None:
+        """Filtrelenmiş tabloyu sakla, bütçeyi aşan LRU kayıtları at"""
+        size = int(filtered_data.memory_usage(deep=True).sum())
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.memory_used -= old[2]
+            self._entries[key] = (filtered_data, aciklama_col, size)
+            self.memory_used += size
+            # En son eklenen girdi bütçeden büyük olsa bile tutulur
+            while self.memory_used > self.memory_budget and len(self._entries) > 1:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self.memory_used -= evicted_size
+                self.evictions += 1
+
+    def file_stats(self, file_name: str) -> Dict[str, int]:
+        """Tek dosyanın isabet/ıska sayaçları"""
+        with self._lock:
+            return dict(self._file_stats.get(file_name, {'hits': 0, 'misses': 0}))
+
+    def stats(self) -> Dict[str, int]:
+        """Genel önbellek sayaçları"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'memory_used': self.memory_used,
+                'memory_budget': self.memory_budget,
+            }
+
+    def clear(self) -> None:
+        """Tüm kayıtları at; sayaçlar korunur"""
+        with self._lock:
+            self._entries.clear()
+            self.memory_used = 0
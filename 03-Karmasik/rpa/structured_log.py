@@ -0,0 +1,167 @@
+"""
+Yapılandırılmış Log - kuyruk tabanlı JSON satırları
+Arka plan dinleyicisi dönen dosyaya toplu yazar; her kayıt çalıştırma kimliğini taşır
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import uuid
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+# Tanımlıysa log klasörünü her zaman bu ortam değişkeni belirler (testler geçici klasöre yönlendirir)
+LOG_DIR_ENV = "RPA_LOG_DIR"
+_run_id = "-"
+_listeners: Dict[str, QueueListener] = {}
+_lock = threading.Lock()
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def start_run(run_id: Optional[str] = None) -> str:
+    """Sonraki tüm kayıtlara eklenecek çalıştırma kimliğini ayarla (veya üret)"""
+    global _run_id
+    _run_id = run_id or new_run_id()
+    return _run_id
+
+
+def current_run_id() -> str:
+    return _run_id
+
+
+class _RunIdFilter(logging.Filter):
+    """Çalıştırma kimliğini kayıt kuyruğa girmeden, çağıran thread'de ekle"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = _run_id
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Kayıt başına bir JSON nesnesi; extra={'fields': {...}} birleştirilir"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'run_id': getattr(record, 'run_id', '-'),
+            'thread': record.threadName,
+            'msg': record.getMessage(),
+        }
+        fields = getattr(record, 'fields', None)
+        if fields:
+            entry.update(fields)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class BatchingRotatingFileHandler(RotatingFileHandler):
+    """Her kayıtta değil batch_size kayıtta bir flush eden RotatingFileHandler"""
+
+    def __init__(self, filename, batch_size: int = 64, **kwargs):
+        super().__init__(filename, encoding='utf-8', **kwargs)
+        self.batch_size = max(1, batch_size)
+        self._pending = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if self._pending >= self.batch_size:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self._pending = 0
+        super().flush()
+
+
+class _FlushOnIdleListener(QueueListener):
+    """Kuyruk boşaldığında toplu yazan handler'ları flush et"""
+
+    def dequeue(self, block: bool):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+
+def get_logger(name: str = "rpa", log_dir: Union[str, Path] = "logs", file_name: Optional[str] = None,
+               console: bool = True, console_format: str = "%(levelname)s - %(message)s",
+               console_formatter: Optional[logging.Formatter] = None,
+               console_level: int = logging.INFO, batch_size: int = 64,
+               max_bytes: int = 5 * 1024 * 1024, backup_count: int = 5) -> logging.Logger:
+    """Kuyruk tabanlı name logger'ını döndür; ilk kullanımda bir kez kurulur
+
+    Dosya RPA_LOG_DIR tanımlıysa oraya, değilse log_dir klasörüne yazılır.
+    """
+    logger = logging.getLogger(name)
+    with _lock:
+        if name in _listeners:
+            return logger
+
+        log_path = Path(os.environ.get(LOG_DIR_ENV) or log_dir)
+        log_path.mkdir(parents=True, exist_ok=True)
+        file_handler = BatchingRotatingFileHandler(
+            log_path / (file_name or f"{name}.jsonl"),
+            batch_size=batch_size, maxBytes=max_bytes, backupCount=backup_count,
+        )
+        file_handler.setFormatter(JsonLinesFormatter())
+        handlers = [file_handler]
+
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(console_level)
+            console_handler.setFormatter(
+                console_formatter or logging.Formatter(console_format, datefmt='%H:%M:%S')
+            )
+            handlers.append(console_handler)
+
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.addFilter(_RunIdFilter())
+
+        # Eski çalıştırmalardan kalan handler'lar çift log üretmesin
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+
+        listener = _FlushOnIdleListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
+    return logger
+
+
+def shutdown_logging() -> None:
+    """Tüm kuyrukları boşalt, dosyaları flush edip kapat (çıkışta da çalışır)"""
+    with _lock:
+        listeners = list(_listeners.items())
+        _listeners.clear()
+    for name, listener in listeners:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        logger = logging.getLogger(name)
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,81 @@
+import sys
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+# Testler proje klasöründen (main.py'nin yanından) çalışıyormuş gibi içe aktarır
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+if str(PROJECT_DIR) not in sys.path:
+    sys.path.insert(0, str(PROJECT_DIR))
+
+SALE = 'POSH/20250723/000000002391280/N042 K P POS Satış                /000001660659421'
+COMMISSION = 'POSH/20250723/000000002391280/N042 K P ÜİY Komisyon            /000001660659421'
+OTHER_SALE = 'POSH/20250724/000000002391280/N042 K P POS Satış                /000001660659999'
+
+
+def write_statement(path, rows):
+    """23 satır banka başlığı, ardından sütun başlıkları ve (tarih, açıklama, tutar) satırları"""
+    workbook = Workbook()
+    sheet = workbook.active
+    for _ in range(23):
+        sheet.append(["banka ekstresi başlığı"])
+    sheet.append(["Tarih", "Saat", "Açıklama", "Tutar"])
+    for tarih, aciklama, tutar in rows:
+        sheet.append([tarih, "10:00", aciklama, tutar])
+    workbook.save(path)
+    return path
+
+
+class FakeRoot:
+    """Tk kökü yerine: after() işi hemen çağıran thread'de çalıştırır"""
+
+    def __init__(self):
+        self.closed = []
+
+    def after(self, delay, func=None, *args):
+        if func is not None:
+            func(*args)
+        return "after#0"
+
+    def winfo_exists(self):
+        return True
+
+    def quit(self):
+        self.closed.append("quit")
+
+    def destroy(self):
+        self.closed.append("destroy")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def log_dir(tmp_path_factory):
+    """Yapılandırılmış logları proje klasörü yerine geçici klasöre yönlendir"""
+    from rpa.structured_log import LOG_DIR_ENV
+
+    path = tmp_path_factory.mktemp("logs")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv(LOG_DIR_ENV, str(path))
+        yield path
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    """Disk önbelleğini proje klasörü yerine geçici klasöre yönlendir"""
+    from rpa import excel_cache
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(excel_cache, "DEFAULT_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    """GUI'siz, beklemesiz ve çıktıları geçici klasöre yazan bot"""
+    monkeypatch.chdir(tmp_path)
+    from rpa.core_engine import EnterpriseRPABot
+
+    instance = EnterpriseRPABot()
+    instance.results_dir = tmp_path / "results"
+    instance.set_pacing(False)
+    return instance
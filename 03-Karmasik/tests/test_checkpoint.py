@@ -0,0 +1,68 @@
+from datetime import date
+
+from rpa.checkpoint import CheckpointJournal, commit_key, record_commit_key
+from rpa.transaction import Transaction
+
+
+def test_committed_indices_survive_restart(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    journal = CheckpointJournal(path)
+    journal.mark("hash-a", [3, 1], "ekstre.xlsx")
+    journal.mark("hash-a", [2])
+    journal.mark("hash-b", [])
+
+    resumed = CheckpointJournal(path)
+    assert resumed.committed("hash-a") == {1, 2, 3}
+    assert resumed.committed("hash-b") == set()
+    assert resumed.pending() == 3
+
+
+def test_torn_last_line_is_skipped(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    CheckpointJournal(path).mark("hash-a", [1])
+    # Yazılırken kesilen satır
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write('{"hash": "hash-a", "indi')
+
+    assert CheckpointJournal(path).committed("hash-a") == {1}
+
+
+def test_clear_forgets_everything(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    journal = CheckpointJournal(path)
+    journal.mark("hash-a", [1, 2])
+    journal.clear()
+
+    assert not path.exists()
+    assert CheckpointJournal(path).pending() == 0
+
+
+def test_file_hash_follows_content_not_name(tmp_path):
+    original = tmp_path / "ekstre.xlsx"
+    renamed = tmp_path / "ekstre_kopya.xlsx"
+    edited = tmp_path / "ekstre_yeni.xlsx"
+    original.write_bytes(b"ayni icerik")
+    renamed.write_bytes(b"ayni icerik")
+    edited.write_bytes(b"farkli icerik")
+    journal = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+
+    assert journal.file_hash(original) == journal.file_hash(renamed)
+    assert journal.file_hash(original) != journal.file_hash(edited)
+
+
+def test_record_commit_key_matches_saved_row():
+    record = Transaction(date(2025, 7, 23), "x" * 100, 67099, "ekstre.xlsx")
+
+    assert record_commit_key(record) == commit_key("23.07.2025", "ekstre.xlsx", "x" * 80 + "...", "670.99")
+
+
+def test_bot_resume_and_fresh_start(bot, tmp_path):
+    journal_path = tmp_path / "checkpoint.jsonl"
+    CheckpointJournal(journal_path).mark("hash-a", [1, 2], "ekstre.xlsx")
+
+    bot.enable_checkpoint(resume=True, journal_path=journal_path)
+    assert bot.find_committed_records([], "hash-a", "ekstre.xlsx") == {1, 2}
+
+    bot.enable_checkpoint(resume=False, journal_path=journal_path)
+    assert bot.find_committed_records([], "hash-a", "ekstre.xlsx") == set()
+    assert not journal_path.exists()
@@ -0,0 +1,16 @@
+from conftest import COMMISSION, SALE
+from gui.dashboard_stats import DashboardStats
+
+
+def test_cards_are_updated_per_record():
+    stats = DashboardStats()
+    today = stats.today_text()
+    stats.add(today, 670.99, "a.xlsx", SALE)
+    stats.add(today, "10.01", "a.xlsx", COMMISSION)
+    stats.add("01.01.2020", 5, "b.xlsx", "Havale")
+
+    assert stats.total == 3
+    assert stats.today == 2
+    assert stats.total_amount == 686.0
+    assert stats.file_count == 2
+    assert dict(stats.count_by_type) == {"POS Satış": 1, "ÜİY Komisyon": 1, "Diğer": 1}
@@ -0,0 +1,67 @@
+from datetime import datetime, time
+
+import numpy as np
+import pandas as pd
+
+from rpa import excel_cache
+from rpa.excel_cache import load_sidecar, read_excel_cached, write_sidecar
+
+
+def _write_statement(path, amounts):
+    pd.DataFrame({
+        "Tarih": [datetime(2025, 7, 23), datetime(2025, 7, 24), datetime(2025, 7, 25)],
+        "Açıklama": ["POSH/1", "POSH/2", None],
+        # Metin ve sayı karışık sütun (object)
+        "Tutar": amounts,
+        "Adet": [1, 2, 3],
+    }).to_excel(path, index=False)
+
+
+def test_round_trip_reads_from_sidecar_without_pickle(tmp_path, monkeypatch):
+    source = tmp_path / "ekstre.xlsx"
+    cache_dir = tmp_path / "cache"
+    _write_statement(source, [670.99, "1.234,56", 12])
+    first = read_excel_cached(source, cache_dir=cache_dir)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("ikinci okuma önbellekten gelmeliydi")
+
+    monkeypatch.setattr(excel_cache.pd, "read_excel", fail)
+    second = read_excel_cached(source, cache_dir=cache_dir)
+
+    pd.testing.assert_frame_equal(first, second)
+    sidecars = list(cache_dir.rglob("*.npy"))
+    assert sidecars
+    for sidecar in sidecars:
+        np.load(sidecar, allow_pickle=False)
+
+
+def test_changed_source_replaces_stale_entry(tmp_path):
+    source = tmp_path / "ekstre.xlsx"
+    cache_dir = tmp_path / "cache"
+    _write_statement(source, [1, 2, 3])
+    read_excel_cached(source, cache_dir=cache_dir)
+    _write_statement(source, [4, 5, 6])
+
+    frame = read_excel_cached(source, cache_dir=cache_dir)
+
+    assert frame["Tutar"].tolist() == [4, 5, 6]
+    assert len(list(cache_dir.glob("*/meta.json"))) == 1
+
+
+def test_time_cells_round_trip(tmp_path):
+    frame = pd.DataFrame({"Saat": [time(10, 0), time(23, 59, 59, 999999), None, "10:05"]})
+    entry_dir = tmp_path / "cache" / "entry"
+
+    assert write_sidecar(entry_dir, frame, tmp_path / "kaynak.xlsx", "hash") is True
+    assert load_sidecar(entry_dir)["Saat"].tolist() == frame["Saat"].tolist()
+
+
+def test_unsupported_cells_are_not_cached(tmp_path, caplog):
+    frame = pd.DataFrame({"a": [[1, 2], "metin"]})
+    entry_dir = tmp_path / "cache" / "entry"
+
+    assert write_sidecar(entry_dir, frame, tmp_path / "kaynak.xlsx", "hash") is False
+    assert not entry_dir.exists()
+    assert list((tmp_path / "cache").iterdir()) == []
+    assert "'a' sütunu: desteklenmeyen hücre türü: list" in caplog.text
@@ -0,0 +1,111 @@
+import tkinter as tk
+
+from gui.frame_scheduler import FrameScheduler
+
+
+class ManualRoot:
+    """after() işlerini biriktirir; test her tick'i elle çalıştırır"""
+
+    def __init__(self):
+        self.scheduled = {}
+        self.window_state = "normal"
+        self._ids = 0
+
+    def after(self, delay, func):
+        self._ids += 1
+        after_id = f"after#{self._ids}"
+        self.scheduled[after_id] = func
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.scheduled.pop(after_id, None)
+
+    def state(self):
+        return self.window_state
+
+    def tick(self):
+        after_id = next(iter(self.scheduled))
+        self.scheduled.pop(after_id)()
+
+
+class Widget:
+    def __init__(self, viewable=True):
+        self.viewable = viewable
+
+    def winfo_viewable(self):
+        return self.viewable
+
+
+def test_one_loop_runs_each_animation_when_due():
+    root = ManualRoot()
+    scheduler = FrameScheduler(root, budget_ms=1000)
+    fast, slow = [], []
+    scheduler.register("hızlı", fast.append, 0)
+    scheduler.register("yavaş", slow.append, 60_000)
+    scheduler.start()
+
+    for _ in range(3):
+        root.tick()
+
+    assert len(root.scheduled) == 1
+    assert (len(fast), len(slow)) == (3, 1)
+    assert scheduler.stats()['animations']["hızlı"]['calls'] == 3
+
+
+def test_hidden_broken_and_failing_animations():
+    root = ManualRoot()
+    scheduler = FrameScheduler(root, budget_ms=1000)
+    hidden = scheduler.register("gizli", lambda now: None, 0, widget=Widget(viewable=False))
+
+    def destroyed(now):
+        raise tk.TclError("invalid command name")
+
+    def failing(now):
+        raise ValueError("efekt hatası")
+
+    scheduler.register("silinmiş", destroyed, 0)
+    failed = scheduler.register("hatalı", failing, 0)
+    scheduler.start()
+    root.tick()
+    root.tick()
+
+    assert hidden.skipped == 2
+    assert failed.errors == 2
+    assert [animation.name for animation in scheduler.animations] == ["gizli", "hatalı"]
+
+
+def test_minimized_window_draws_nothing():
+    root = ManualRoot()
+    scheduler = FrameScheduler(root)
+    calls = []
+    scheduler.register("parçacık", calls.append, 0)
+    root.window_state = "iconic"
+    scheduler.start()
+
+    root.tick()
+
+    assert calls == []
+    assert scheduler.minimized_ticks == 1
+
+
+def test_backoff_grows_over_budget_and_recovers():
+    root = ManualRoot()
+    scheduler = FrameScheduler(root, budget_ms=-1, recover_after=2)
+    scheduler.start()
+    for _ in range(5):
+        root.tick()
+    assert scheduler.backoff == FrameScheduler.MAX_BACKOFF
+
+    scheduler.budget_ms = 1000
+    for _ in range(2):
+        root.tick()
+    assert scheduler.backoff == FrameScheduler.MAX_BACKOFF // 2
+
+
+def test_stop_cancels_the_pending_tick():
+    root = ManualRoot()
+    scheduler = FrameScheduler(root)
+    scheduler.start()
+    scheduler.stop()
+
+    assert root.scheduled == {}
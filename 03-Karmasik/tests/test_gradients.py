@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+from gui import gradients
+from gui.gradients import GradientCache, gradient_ppm
+
+
+class FakePhotoImage:
+    def __init__(self, master=None, data=None, format=None):
+        self.master = master
+        self.data = data
+
+    def zoom(self, x, y=1):
+        return SimpleNamespace(master=self.master, data=self.data, width=x)
+
+
+def test_ppm_column_truncates_like_line_rows():
+    data = gradient_ppm('#000000', '#ffffff', 4)
+
+    assert data == b"P6 1 4 255\n" + bytes([0, 0, 0, 63, 63, 63, 127, 127, 127, 191, 191, 191])
+
+
+def test_cache_keeps_images_per_tk_interpreter(monkeypatch):
+    monkeypatch.setattr(gradients.tk, "PhotoImage", FakePhotoImage)
+    cache = GradientCache()
+    first_root = SimpleNamespace(tk=object())
+    canvas = SimpleNamespace(tk=first_root.tk)
+    second_root = SimpleNamespace(tk=object())
+
+    image = cache.get(first_root, '#181825', '#313244', 1600, 70)
+    assert cache.get(canvas, '#181825', '#313244', 1600, 70) is image
+
+    other = cache.get(second_root, '#181825', '#313244', 1600, 70)
+    assert other is not image and other.master is second_root
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'size': 2}
@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+
+import tkinter as tk
+
+from conftest import SALE, FakeRoot
+from rpa.gui_batch import GuiCallBatch, GuiOperation, run_gui_operations
+from rpa.transaction import Transaction
+
+
+class Widget:
+    def __init__(self, exists=True):
+        self.exists = exists
+
+    def winfo_exists(self):
+        return self.exists
+
+
+def _fail():
+    raise tk.TclError("invalid command name")
+
+
+def test_errors_are_reported_per_operation():
+    calls = []
+    results = run_gui_operations([
+        GuiOperation(calls.append, ("a",), {}, "ilk"),
+        GuiOperation(_fail, (), {}, "tcl"),
+        GuiOperation(calls.append, (Widget(exists=False),), {}, "silinmiş"),
+        GuiOperation(lambda value: value * 2, (21,), {}, "son"),
+    ])
+
+    assert calls == ["a"]
+    assert [result.label for result in results] == ["ilk", "tcl", "silinmiş", "son"]
+    assert results[1].error == "TclError: invalid command name"
+    assert results[2].error == "Widget artık mevcut değil"
+    assert results[3].ok and results[3].value == 42
+
+
+def test_batch_runs_queued_operations_once_on_exit():
+    runs = []
+
+    def runner(operations, timeout=None):
+        runs.append((len(operations), timeout))
+        return run_gui_operations(operations)
+
+    with GuiCallBatch(runner, timeout=5) as batch:
+        assert batch.add(len, "abc") == 0
+        assert batch.add(max, 1, 3, label="en büyük") == 1
+        assert len(batch) == 2
+
+    assert runs == [(2, 5)]
+    assert [(result.label, result.value) for result in batch.results] == [("len", 3), ("en büyük", 3)]
+    assert len(batch) == 0
+    # Boş toplu çağrı GUI thread'ine gitmez
+    assert batch.run() == [] and len(runs) == 1
+
+
+def test_bot_uses_one_round_trip_per_batch(bot):
+    bot.gui = SimpleNamespace(root=FakeRoot())
+
+    with bot.gui_batch() as batch:
+        batch.add(str.upper, "posh")
+        batch.add(_fail)
+
+    assert bot.gui_round_trips == 1
+    assert batch.results[0].value == "POSH"
+    assert not batch.results[1].ok
+
+
+def test_bot_without_gui_fails_every_operation(bot):
+    results = bot.call_in_gui_thread_batch([GuiOperation(len, ("a",), {}, "len")])
+
+    assert results[0].error == "GUI referansı mevcut değil"
+    assert bot.gui_round_trips == 0
+
+
+class Entry(Widget):
+    def __init__(self):
+        super().__init__()
+        self.text = ""
+
+    def delete(self, first, last=None):
+        self.text = ""
+
+    def insert(self, index, value):
+        self.text = value
+
+
+def test_simulated_record_fills_and_saves_in_one_round_trip(bot, monkeypatch):
+    entries = {key: Entry() for key in ("date_entry", "desc_entry", "amount_entry", "file_entry")}
+    saved = []
+    bot.gui = SimpleNamespace(root=FakeRoot(), save_advanced_record=lambda: saved.append(
+        {key: entry.text for key, entry in entries.items()}) or True)
+    clicks = []
+    monkeypatch.setattr(bot, "wait_for_modal_ready", lambda timeout=10: True)
+    monkeypatch.setattr(bot, "find_modal_form", lambda: entries)
+    monkeypatch.setattr(bot, "_find_save_button", lambda: Widget())
+    monkeypatch.setattr(bot, "move_mouse_to_widget", lambda widget, smooth=True: clicks.append("mouse"))
+    monkeypatch.setattr(bot, "highlight_widget", lambda widget: clicks.append("highlight"))
+    bot.mouse_simulation = True
+
+    record = Transaction.from_values("23.07.2025", SALE, "670.99", "a.xlsx")
+    assert bot.process_single_record(record, 1, 1)
+
+    assert bot.gui_round_trips == 1
+    assert clicks.count("mouse") == 5
+    assert saved == [{"date_entry": "23.07.2025", "desc_entry": SALE[:80],
+                      "amount_entry": "670.99", "file_entry": "a.xlsx"}]
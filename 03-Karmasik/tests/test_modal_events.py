@@ -0,0 +1,56 @@
+import threading
+from types import SimpleNamespace
+
+from gui.modal_system import ModalEvents
+
+
+def _later(action, delay=0.05):
+    timer = threading.Timer(delay, action)
+    timer.start()
+    return timer
+
+
+def test_waiter_wakes_on_modal_ready():
+    events = ModalEvents()
+    timer = _later(lambda: events.set_modal_ready(True))
+
+    ready, latency = events.wait_modal_ready(timeout=5)
+    timer.join()
+
+    assert ready and events.modal_ready
+    assert 0.0 <= latency < 5
+    # Durum zaten sağlanmışsa beklemeden döner
+    assert events.wait_modal_ready(timeout=0) == (True, 0.0)
+
+
+def test_wait_times_out_without_event():
+    events = ModalEvents()
+
+    assert events.wait_modal_ready(timeout=0.05) == (False, 0.0)
+    assert events.wait_modal_closed(timeout=0) == (True, 0.0)
+
+
+def test_popup_count_never_goes_negative():
+    events = ModalEvents()
+    with events.popup():
+        with events.popup():
+            assert events.open_popups == 2
+        assert events.wait_popups_closed(timeout=0.01) == (False, 0.0)
+    events.popup_closed()
+
+    assert events.open_popups == 0
+    assert events.wait_popups_closed(timeout=0)[0]
+
+
+def test_bot_waits_on_gui_events(bot):
+    events = ModalEvents()
+    bot.gui = SimpleNamespace(events=events)
+    timer = _later(lambda: events.set_modal_ready(True))
+
+    assert bot.wait_for_modal_ready(timeout=5)
+    timer.join()
+    assert bot.wait_latency['modal_ready'].count == 1
+
+    events.popup_opened()
+    assert not bot.wait_for_popup_close(timeout=0.05)
+    assert bot.wait_latency['popup_close'].count == 0
@@ -0,0 +1,68 @@
+import pytest
+
+from rpa.pacing import PacingScheduler
+
+
+@pytest.fixture
+def slept():
+    return []
+
+
+@pytest.fixture
+def pacer(slept):
+    return PacingScheduler(0.5, budgets={"record": 0.4}, sleep=slept.append)
+
+
+def test_factor_scales_delay_and_budgets(pacer, slept):
+    pacer.pause(1.0)
+    pacer.pause(action="record")
+
+    assert slept == [0.5, 0.2]
+    stats = pacer.stats()
+    assert stats['pauses'] == 2
+    assert set(stats['by_action']) == {"step", "record"}
+
+
+def test_zero_factor_skips_without_sleeping(pacer, slept):
+    pacer.set_factor(0)
+
+    assert not pacer.enabled
+    assert pacer.pause(1.0) == 0.0
+    assert pacer.pause(action="bilinmeyen") == 0.0
+    assert slept == []
+    assert pacer.stats()['skipped'] == 2
+
+
+def test_reset_clears_counters(pacer, slept):
+    pacer.pause(1.0)
+    pacer.reset()
+
+    stats = pacer.stats()
+    assert (stats['pauses'], stats['pacing_s'], stats['by_action']) == (0, 0.0, {})
+    assert "0 duraklama" in pacer.format_stats()
+
+
+def test_log_step_does_not_sleep_when_pacing_is_off(bot):
+    before = bot.get_pacing_stats()['skipped']
+
+    bot.log_step("adım", 5.0)
+
+    stats = bot.get_pacing_stats()
+    assert stats['pauses'] == 0
+    assert stats['skipped'] == before + 1
+
+
+def test_direct_commit_mode_restores_previous_pacing(bot):
+    bot.set_pacing(True)
+
+    bot.set_direct_commit_mode(True)
+    bot.set_direct_commit_mode(True)
+    assert not bot.pacer.enabled
+
+    bot.set_direct_commit_mode(False)
+    assert bot.pacer.enabled
+
+    bot.set_pacing(False)
+    bot.set_direct_commit_mode(True)
+    bot.set_direct_commit_mode(False)
+    assert not bot.pacer.enabled
@@ -0,0 +1,31 @@
+import pandas as pd
+
+from conftest import COMMISSION, SALE
+from rpa.posh_parser import (DIGER, POS_SATIS, UIY_KOMISYON, classify, extract_posh_fields, parse_posh,
+                             reference_key, reference_keys)
+
+
+def test_parse_posh_fields():
+    fields = parse_posh(SALE)
+
+    assert fields.tarih == "20250723"
+    assert fields.terminal == "N042"
+    assert fields.islem == "POS Satış"
+    assert fields.referans == "000001660659421"
+    assert fields.tip == POS_SATIS
+    assert parse_posh("EFT/000001660659421") is None
+
+
+def test_classify():
+    assert classify(SALE) == POS_SATIS
+    assert classify(COMMISSION) == UIY_KOMISYON
+    assert classify("Havale") == DIGER
+
+
+def test_vectorized_matches_single_row():
+    column = pd.Series([SALE, COMMISSION, "Havale", None], dtype=object)
+
+    assert extract_posh_fields(column)["tip"].tolist()[:2] == [POS_SATIS, UIY_KOMISYON]
+    keys = reference_keys(column).tolist()
+    assert keys[:2] == [reference_key(SALE), reference_key(COMMISSION)]
+    assert pd.isna(keys[2]) and pd.isna(keys[3])
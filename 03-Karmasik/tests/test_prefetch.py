@@ -0,0 +1,61 @@
+from conftest import COMMISSION, SALE, write_statement
+from rpa.prefetch import StatementPrefetcher, parse_statement
+from rpa.statement_cache import StatementCache
+
+ROWS = [("23.07.2025", SALE, 670.99), ("23.07.2025", "Havale", 10), ("24.07.2025", COMMISSION, 5)]
+
+
+def _files(tmp_path, count):
+    return [write_statement(tmp_path / f"ekstre{n}.xlsx", ROWS) for n in range(count)]
+
+
+def test_parse_statement_keeps_posh_rows(tmp_path, disk_cache):
+    filtered, aciklama_col = parse_statement(str(_files(tmp_path, 1)[0]))
+
+    assert filtered[aciklama_col].tolist() == [SALE, COMMISSION]
+
+
+def test_next_files_are_parsed_in_the_pool(tmp_path, disk_cache):
+    files = _files(tmp_path, 3)
+    cache = StatementCache()
+
+    with StatementPrefetcher(cache, workers=1, lookahead=1) as prefetcher:
+        assert prefetcher.start(files)
+        # Havuz dosyaları sırayla, en fazla lookahead kadar önden hazırlar
+        assert prefetcher.collect(files[0])
+        assert prefetcher.collect(files[1])
+        assert prefetcher.collect(files[2])
+
+    assert prefetcher.prefetched == 3
+    assert not prefetcher.enabled
+    assert all(cache.contains(path) for path in files)
+    assert cache.stats()['misses'] == 3
+
+
+def test_cached_and_broken_files(tmp_path, disk_cache):
+    files = _files(tmp_path, 2)
+    broken = tmp_path / "bozuk.xlsx"
+    broken.write_bytes(b"excel degil")
+    cache = StatementCache()
+    cache.get_filtered(files[1])
+
+    with StatementPrefetcher(cache, workers=1, lookahead=2) as prefetcher:
+        prefetcher.start([files[0], files[1], broken])
+        assert prefetcher.collect(files[0])
+        # Önbellekteki dosya havuza gönderilmez
+        assert not prefetcher.collect(files[1])
+        assert not prefetcher.collect(broken)
+
+    assert prefetcher.prefetched == 1
+    assert prefetcher.failed == 1
+
+
+def test_sequential_fallback(tmp_path, disk_cache):
+    files = _files(tmp_path, 2)
+
+    with StatementPrefetcher(StatementCache(), workers=0) as prefetcher:
+        assert not prefetcher.start(files)
+        assert not prefetcher.collect(files[0])
+    with StatementPrefetcher(StatementCache(), workers=1) as prefetcher:
+        # Tek dosyada havuz açılmaz
+        assert not prefetcher.start(files[:1])
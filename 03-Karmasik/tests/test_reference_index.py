@@ -0,0 +1,115 @@
+import numpy as np
+
+from conftest import COMMISSION, OTHER_SALE, SALE, FakeRoot, write_statement
+from rpa.posh_parser import reference_key
+from rpa.reference_index import BloomFilter, ReferenceIndex
+from rpa.transaction import StatementRecords, Transaction
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000)
+    keys = [f"{number:015d}:POS Satış" for number in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+
+
+def test_index_persists_and_ignores_repeats(tmp_path):
+    path = tmp_path / "referanslar.sqlite"
+    index = ReferenceIndex(path)
+    assert index.add_many(["1:POS Satış", "2:POS Satış", None, "1:POS Satış"], "ekstre.xlsx") == 2
+    assert index.known_mask(["1:POS Satış", "3:POS Satış", None]) == [True, False, False]
+    index.close()
+
+    reopened = ReferenceIndex(path)
+    assert len(reopened) == 2
+    assert "2:POS Satış" in reopened
+    assert reopened.add_many(["2:POS Satış"]) == 0
+    reopened.close()
+
+
+def test_sale_and_commission_are_separate_keys():
+    assert reference_key(SALE) != reference_key(COMMISSION)
+    assert reference_key("POS satış değil") is None
+
+
+def test_filter_drops_known_references_and_keeps_file_positions(bot, tmp_path):
+    bot.enable_reference_index(tmp_path / "referanslar.sqlite")
+    records = [Transaction(None, text, 100) for text in (SALE, COMMISSION, OTHER_SALE)]
+    bot.reference_index.add_many([reference_key(COMMISSION)])
+
+    remaining, duplicates = bot.filter_duplicate_references(records)
+    assert duplicates == {2}
+    assert [record.aciklama for record in remaining] == [SALE, OTHER_SALE]
+
+    # Kontrol noktasından atlananlar mükerrer sayılmaz
+    remaining, duplicates = bot.filter_duplicate_references(records, skip={2})
+    assert duplicates == set()
+    assert len(remaining) == 3
+
+
+def test_filter_accepts_statement_records(bot, tmp_path):
+    bot.enable_reference_index(tmp_path / "referanslar.sqlite")
+    records = StatementRecords([None, None], [SALE, OTHER_SALE], np.array([100, 200], dtype=np.int64), "a.xlsx")
+    bot.reference_index.add_many([reference_key(SALE)])
+
+    remaining, duplicates = bot.filter_duplicate_references(records)
+    assert duplicates == {1}
+    assert isinstance(remaining, StatementRecords)
+    assert remaining.descriptions() == [OTHER_SALE]
+    assert [record.tutar_kurus for record in remaining] == [200]
+
+
+def test_filter_without_index_keeps_everything(bot):
+    records = [Transaction(None, SALE, 100)]
+
+    assert bot.filter_duplicate_references(records) == (records, set())
+
+
+class HeadlessGui:
+    """Doğrudan kayıt modu için en küçük GUI modeli"""
+
+    def __init__(self):
+        self.root = FakeRoot()
+        self.rows = []
+
+    def set_current_records(self, records):
+        pass
+
+    def append_records_bulk(self, rows, refresh=True):
+        self.rows.extend(rows)
+        return len(rows)
+
+    def refresh_after_bulk_commit(self):
+        pass
+
+
+def _headless_run(excel_path, results_dir):
+    from rpa.core_engine import EnterpriseRPABot
+
+    run = EnterpriseRPABot()
+    run.results_dir = results_dir
+    run.set_direct_commit_mode(True)
+    run.set_gui_reference(HeadlessGui())
+    run.set_processing_files([excel_path])
+    run.enable_reference_index()
+    run.run_complete_automation_sequence()
+    return run
+
+
+def test_rerun_with_only_duplicates_still_finalizes(tmp_path, monkeypatch, disk_cache):
+    monkeypatch.chdir(tmp_path)
+    rows = [("23.07.2025", f"{SALE[:-15]}{number:015d}", 10) for number in range(50)]
+    excel_path = write_statement(tmp_path / "ekstre.xlsx", rows)
+
+    first = _headless_run(excel_path, tmp_path / "results")
+    second = _headless_run(excel_path, tmp_path / "results")
+
+    assert first.results[-1]['success'] == 50
+    assert len(first.gui.rows) == 50
+    assert second.results[-1]['success'] == 0
+    assert second.results[-1]['duplicates'] == 50
+    assert second.gui.rows == []
+    # FAZ 4 erken çıkmaz: GUI kapatılır
+    assert second.gui.root.closed == ["quit", "destroy"]
@@ -0,0 +1,44 @@
+from openpyxl import load_workbook
+
+from rpa.results_sink import ResultsSink
+
+
+def test_rows_are_readable_before_close(tmp_path):
+    sink = ResultsSink(tmp_path / "sonuc" / "kayitlar.jsonl", fsync_every=2)
+    sink.append({'sira': 1, 'durum': "BAŞARILI"})
+    assert sink.extend([{'sira': 2, 'durum': "HATA"}, {'sira': 3, 'durum': "BAŞARILI"}]) == 2
+
+    assert [row['sira'] for row in sink.rows()] == [1, 2, 3]
+    assert sink.appended == 3
+    assert sink.extend([]) == 0
+    sink.close()
+
+
+def test_torn_last_line_and_committed_keys(tmp_path):
+    path = tmp_path / "kayitlar.jsonl"
+    with ResultsSink(path) as sink:
+        sink.extend([
+            {'dosya': "a.xlsx", 'sira': 1, 'durum': "BAŞARILI"},
+            {'dosya': "a.xlsx", 'sira': 2, 'durum': "HATA"},
+        ])
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write('{"dosya": "a.xlsx", "si')
+
+    reopened = ResultsSink(path)
+    assert len(list(reopened.rows())) == 2
+    assert reopened.committed_keys(('dosya', 'sira'), 'durum', "BAŞARILI") == {("a.xlsx", "1")}
+
+
+def test_reset_and_xlsx_export(tmp_path):
+    sink = ResultsSink(tmp_path / "kayitlar.jsonl")
+    sink.append({'sira': 1, 'tutar': "0.5"})
+    sink.reset()
+    sink.extend([{'sira': 1, 'tutar': "670.99"}, {'sira': 2, 'tutar': ""}])
+    xlsx_path = tmp_path / "rapor.xlsx"
+
+    assert sink.to_xlsx(xlsx_path, numeric_columns=('tutar',)) == 2
+    sink.close()
+    rows = list(load_workbook(xlsx_path).active.values)
+    assert rows == [('sira', 'tutar'), (1, 670.99), (2, None)]
+    assert ResultsSink(tmp_path / "bos.jsonl").to_xlsx(tmp_path / "bos.xlsx") == 0
+    assert not (tmp_path / "bos.xlsx").exists()
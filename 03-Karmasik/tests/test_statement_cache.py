@@ -0,0 +1,60 @@
+import os
+
+from conftest import COMMISSION, OTHER_SALE, SALE, write_statement
+from rpa.statement_cache import StatementCache
+
+ROWS = [("23.07.2025", SALE, 670.99), ("23.07.2025", "Havale", 10), ("24.07.2025", COMMISSION, 5)]
+
+
+def test_second_read_is_a_hit(tmp_path, disk_cache):
+    path = write_statement(tmp_path / "ekstre.xlsx", ROWS)
+    cache = StatementCache()
+
+    first, aciklama_col = cache.get_filtered(path)
+    second, _ = cache.get_filtered(path)
+
+    assert aciklama_col == "Açıklama"
+    assert first[aciklama_col].tolist() == [SALE, COMMISSION]
+    assert second is first
+    assert cache.file_stats("ekstre.xlsx") == {'hits': 1, 'misses': 1}
+
+
+def test_changed_file_is_read_again(tmp_path, disk_cache):
+    path = write_statement(tmp_path / "ekstre.xlsx", ROWS)
+    cache = StatementCache()
+    cache.get_filtered(path)
+
+    write_statement(path, [("24.07.2025", OTHER_SALE, 1)])
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    filtered, aciklama_col = cache.get_filtered(path)
+
+    assert filtered[aciklama_col].tolist() == [OTHER_SALE]
+    assert cache.stats()['misses'] == 2
+
+
+def test_budget_evicts_least_recently_used(tmp_path, disk_cache):
+    paths = [write_statement(tmp_path / f"ekstre{n}.xlsx", ROWS) for n in range(3)]
+    cache = StatementCache(memory_budget=1)
+    for path in paths:
+        cache.get_filtered(path)
+
+    # Bütçeden büyük olsa da en son girdi tutulur
+    assert cache.stats()['entries'] == 1
+    assert cache.stats()['evictions'] == 2
+    assert cache.contains(paths[2])
+    assert not cache.contains(paths[0])
+
+
+def test_store_parsed_counts_as_a_read(tmp_path, disk_cache):
+    path = write_statement(tmp_path / "ekstre.xlsx", ROWS)
+    reader = StatementCache()
+    filtered, aciklama_col = reader.get_filtered(path)
+    cache = StatementCache()
+
+    cache.store_parsed(path, filtered, aciklama_col)
+
+    assert cache.contains(path)
+    assert cache.get_filtered(path)[0] is filtered
+    assert cache.file_stats("ekstre.xlsx") == {'hits': 1, 'misses': 1}
+    assert not cache.contains(tmp_path / "yok.xlsx")
@@ -0,0 +1,68 @@
+from rpa.status_channel import StatusChannel
+
+
+class ManualRoot:
+    """after() çağrılarını biriktirir; test her kareyi elle çalıştırır"""
+
+    def __init__(self):
+        self.scheduled = []
+        self.closed = False
+
+    def after(self, delay, func):
+        if self.closed:
+            raise RuntimeError("pencere kapandı")
+        self.scheduled.append(func)
+
+    def tick(self):
+        self.scheduled.pop(0)()
+
+
+def test_one_frame_shows_only_the_latest_message():
+    channel = StatusChannel()
+    root, shown = ManualRoot(), []
+    channel.start(root, shown.append)
+    for step in range(5):
+        channel.post(f"adım {step}")
+
+    root.tick()
+    root.tick()
+
+    assert shown == ["adım 4"]
+    assert channel.stats() == {'posted': 5, 'delivered': 1, 'coalesced': 4, 'dropped': 0, 'pending': 0}
+
+
+def test_full_queue_drops_the_oldest():
+    channel = StatusChannel(maxsize=2)
+    for step in range(4):
+        channel.post(f"adım {step}")
+
+    assert channel.stats()['dropped'] == 2
+    assert channel.drain() == "adım 3"
+
+
+def test_closed_window_stops_the_loop():
+    channel = StatusChannel()
+    root = ManualRoot()
+    channel.start(root, lambda message: None)
+    root.closed = True
+
+    root.tick()
+
+    assert not channel.running
+    assert root.scheduled == []
+
+
+def test_failing_sink_does_not_break_the_loop():
+    channel = StatusChannel()
+    root = ManualRoot()
+
+    def sink(message):
+        raise ValueError(message)
+
+    channel.start(root, sink)
+    channel.post("hata")
+    root.tick()
+
+    assert channel.running
+    assert len(root.scheduled) == 1
+    assert channel.stats()['delivered'] == 0
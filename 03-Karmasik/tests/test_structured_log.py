@@ -0,0 +1,13 @@
+import json
+
+from rpa.structured_log import get_logger, shutdown_logging
+
+
+def test_log_dir_env_overrides_project_relative_default(log_dir, tmp_path):
+    logger = get_logger("rpa.test_log_dir", log_dir=tmp_path / "proje" / "logs", console=False)
+    logger.info("kayıt", extra={"fields": {"adet": 1}})
+    shutdown_logging()
+
+    line = json.loads((log_dir / "rpa.test_log_dir.jsonl").read_text(encoding="utf-8").splitlines()[-1])
+    assert (line["msg"], line["adet"]) == ("kayıt", 1)
+    assert not (tmp_path / "proje").exists()
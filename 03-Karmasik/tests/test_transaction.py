@@ -0,0 +1,52 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import SALE
+from rpa.transaction import StatementRecords, Transaction, kurus_from_column, parse_date, parse_kurus
+
+
+def test_parse_kurus_formats():
+    assert parse_kurus("1.234,56") == 123456
+    assert parse_kurus("670.99") == 67099
+    assert parse_kurus(12) == 1200
+    assert parse_kurus(None) == 0
+
+
+@pytest.mark.parametrize("value", ["abc", "tutar yok", "nan", "1,2,3"])
+def test_parse_kurus_rejects_unreadable_amounts(value):
+    with pytest.raises(ValueError):
+        parse_kurus(value)
+
+
+def test_unreadable_amount_marks_record_invalid(bot):
+    column = pd.Series(["abc", 670.99], dtype=object)
+    records = StatementRecords([date(2025, 7, 23)] * 2, [SALE, SALE], kurus_from_column(column), "e.xlsx")
+
+    invalid, valid = list(records)
+    assert invalid.tutar_kurus is None and invalid.tutar_text() == ""
+    assert records[0].tutar_kurus is None
+    assert records.total_kurus() == 67099
+    assert Transaction.from_values("23.07.2025", SALE, "abc", "e.xlsx").tutar_kurus is None
+    assert bot.validate_for_commit(invalid) == "tutar geçersiz"
+    assert bot.validate_for_commit(valid) is None
+
+
+def test_column_parsing_matches_single_values():
+    column = pd.Series([670.99, "1.234,56", None, 5], dtype=object)
+
+    assert kurus_from_column(column).tolist() == [67099, 123456, 0, 500]
+    assert parse_date("23.07.2025") == date(2025, 7, 23)
+
+
+def test_statement_records_slice_and_select():
+    records = StatementRecords(["a", "b", "c"], ["x", "y", "z"], np.array([1, 2, 3], dtype=np.int64), "e.xlsx")
+
+    assert records[1] == Transaction("b", "y", 2, "e.xlsx")
+    assert [record.aciklama for record in records[1:]] == ["y", "z"]
+    selected = records.select([True, False, True])
+    assert [record.tutar_kurus for record in selected] == [1, 3]
+    assert selected.total_kurus() == 4
+    assert records.descriptions() == ["x", "y", "z"]
@@ -0,0 +1,133 @@
+from tkinter import ttk
+
+import pytest
+
+from gui import virtual_table
+from gui.virtual_table import VirtualTable
+
+
+class FakeTree:
+    """Treeview yerine: öğe değerlerini ve görünür sırayı tutar"""
+
+    def __init__(self, parent, **options):
+        self.values = {}
+        self.shown = []
+        self.inserted = 0
+
+    def insert(self, parent, index, values=()):
+        self.inserted += 1
+        item = f"I{self.inserted}"
+        self.values[item] = tuple(values)
+        self.shown.append(item)
+        return item
+
+    def detach(self, item):
+        self.shown.remove(item)
+
+    def move(self, item, parent, index):
+        if item in self.shown:
+            self.shown.remove(item)
+        self.shown.insert(index, item)
+
+    def delete(self, item):
+        self.values.pop(item)
+        if item in self.shown:
+            self.shown.remove(item)
+
+    def item(self, item, values=()):
+        self.values[item] = tuple(values)
+
+    def visible_rows(self):
+        return [self.values[item] for item in self.shown]
+
+    def bbox(self, item):
+        return None
+
+    def bind(self, *args):
+        pass
+
+    def pack(self, **options):
+        pass
+
+
+class FakeScrollbar:
+    def __init__(self, parent, **options):
+        self.position = None
+
+    def set(self, first, last):
+        self.position = (first, last)
+
+    def pack(self, **options):
+        pass
+
+
+@pytest.fixture
+def idle(monkeypatch):
+    """Tk olmadan tablo: after_idle işleri listede bekler"""
+    pending = []
+    monkeypatch.setattr(ttk.Frame, "__init__", lambda self, parent, **kwargs: None)
+    monkeypatch.setattr(virtual_table.ttk, "Treeview", FakeTree)
+    monkeypatch.setattr(virtual_table.ttk, "Scrollbar", FakeScrollbar)
+    monkeypatch.setattr(VirtualTable, "after_idle", lambda self, func: pending.append(func))
+    return pending
+
+
+def _run(pending):
+    while pending:
+        pending.pop(0)()
+
+
+def test_only_visible_rows_are_rendered(idle):
+    rows = list(range(1000))
+    table = VirtualTable(None, ["sayı"], rows, lambda row: (row,), height=3)
+    _run(idle)
+
+    assert table.tree.inserted == 3
+    assert table.tree.visible_rows() == [(997,), (998,), (999,)]
+    assert table.scrollbar.position == (0.997, 1.0)
+
+    table.scroll_to(10)
+    _run(idle)
+    assert table.tree.visible_rows() == [(10,), (11,), (12,)]
+    assert not table.follow
+
+
+def test_refreshes_are_coalesced(idle):
+    rows = [1, 2]
+    table = VirtualTable(None, ["sayı"], rows, lambda row: (row,), height=3)
+    for value in range(3, 10):
+        rows.append(value)
+        table.notify_appended()
+
+    assert len(idle) == 1
+    _run(idle)
+    assert table.render_count == 1
+    assert table.tree.visible_rows() == [(7,), (8,), (9,)]
+
+
+def test_hidden_append_only_moves_the_scrollbar(idle):
+    rows = list(range(20))
+    table = VirtualTable(None, ["sayı"], rows, lambda row: (row,), height=3)
+    table.scroll_to(0)
+    _run(idle)
+    rendered = table.render_count
+
+    rows.append(20)
+    table.notify_appended()
+
+    assert idle == []
+    assert table.render_count == rendered
+    assert table.scrollbar.position == (0.0, 3 / 21)
+
+
+def test_short_list_hides_spare_pool_rows(idle):
+    rows = list(range(5))
+    table = VirtualTable(None, ["sayı"], rows, lambda row: (row,), height=3)
+    _run(idle)
+
+    table.set_rows(["a"])
+    _run(idle)
+
+    assert table.tree.visible_rows() == [("a",)]
+    assert table.scrollbar.position == (0.0, 1.0)
+    assert len(table) == 1
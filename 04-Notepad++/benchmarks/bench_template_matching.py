@@ -0,0 +1,132 @@
+"""
+Şablon eşleştirme benchmark'ı - tam çözünürlük renkli tek ölçek vs gri piramit çok ölçek
+Kayıtlı ekran görüntüleri (`images/*.jpg`) ekran yerine kullanılır; ekran gerekmez.
+Her görüntüden en dokulu birkaç parça şablon olarak kesilir ve diske yazılır.
+Görüntü 1.25/1.5 gibi DPI ölçeklerine büyütülür, her şablon iki yolla aranır:
+
+- Eski: her aramada `cv2.imread`, renkli `TM_CCOEFF_NORMED`, tek ölçek.
+- Yeni: `TemplateRegistry` (bir kez yüklenen gri piramitler, kabadan inceye çok ölçek).
+
+Arama süresi ve doğru konumda bulma oranı raporlanır.
+
+Çalıştırma (04-Notepad++ klasöründen):
+    python benchmarks/bench_template_matching.py --scales 1.0 1.25 1.5 --patches 3
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+
+from template_registry import TemplateRegistry, build_pyramid, to_gray  # noqa: E402
+
+PATCH_SIZE = (96, 28)  # menü öğesi boyutunda (genişlik, yükseklik)
+
+
+def pick_patches(screen, count):
+    """Gri tonlu varyansı en yüksek, çakışmayan parçaların sol üst köşeleri"""
+    gray = to_gray(screen)
+    width, height = PATCH_SIZE
+    candidates = []
+    for y in range(0, gray.shape[0] - height, height):
+        for x in range(0, gray.shape[1] - width, width // 2):
+            candidates.append((float(gray[y:y + height, x:x + width].std()), x, y))
+    candidates.sort(reverse=True)
+    picked = []
+    for _, x, y in candidates:
+        if all(abs(x - px) >= width or abs(y - py) >= height for px, py in picked):
+            picked.append((x, y))
+        if len(picked) == count:
+            break
+    return picked
+
+
+def legacy_locate(screen, template_path, confidence):
+    """Eski locate_on_screen: her çağrıda diskten okuma, renkli tek ölçek"""
+    template = cv2.imread(str(template_path), cv2.IMREAD_COLOR)
+    result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, max_loc = cv2.minMaxLoc(result)
+    return max_loc if max_val >= confidence else None
+
+
+def is_correct(location, expected, scale):
+    if location is None:
+        return False
+    tolerance = 3 * scale
+    return abs(location[0] - expected[0]) <= tolerance and abs(location[1] - expected[1]) <= tolerance
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Şablon eşleştirme eski/yeni ölçümü")
+    parser.add_argument("--screens", default=str(PROJECT_DIR / "images" / "*.jpg"),
+                        help="Ekran görüntüsü deseni")
+    parser.add_argument("--scales", type=float, nargs="*", default=[1.0, 1.25, 1.5])
+    parser.add_argument("--patches", type=int, default=3, help="Görüntü başına şablon sayısı")
+    parser.add_argument("--confidence", type=float, default=0.8)
+    args = parser.parse_args()
+
+    pattern = Path(args.screens)
+    screen_paths = sorted(pattern.parent.glob(pattern.name))
+    if not screen_paths:
+        raise SystemExit(f"Ekran görüntüsü bulunamadı: {args.screens}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = TemplateRegistry(base_dir=tmp)
+        cases = []
+        for screen_path in screen_paths:
+            screen = cv2.imread(str(screen_path), cv2.IMREAD_COLOR)
+            for index, (x, y) in enumerate(pick_patches(screen, args.patches)):
+                name = f"{screen_path.stem}_{index}"
+                width, height = PATCH_SIZE
+                cv2.imwrite(str(Path(tmp) / f"{name}.png"), screen[y:y + height, x:x + width])
+                registry.register(name, f"{name}.png")
+                cases.append((screen, name, (x, y)))
+
+        load_started = time.perf_counter()
+        registry.preload()
+        load_ms = (time.perf_counter() - load_started) * 1000
+        print(f"{len(screen_paths)} ekran görüntüsü, {len(cases)} şablon; "
+              f"piramitler {load_ms:.1f} ms'de bir kez hazırlandı")
+
+        for scale in args.scales:
+            legacy_ms, new_ms = 0.0, 0.0
+            legacy_ok, new_ok = 0, 0
+            scaled_screens = {}
+            for screen, name, expected in cases:
+                key = id(screen)
+                if key not in scaled_screens:
+                    if scale == 1.0:
+                        scaled_screens[key] = screen
+                    else:
+                        size = (round(screen.shape[1] * scale), round(screen.shape[0] * scale))
+                        scaled_screens[key] = cv2.resize(screen, size, interpolation=cv2.INTER_LINEAR)
+                scaled = scaled_screens[key]
+                target = (expected[0] * scale, expected[1] * scale)
+
+                started = time.perf_counter()
+                location = legacy_locate(scaled, registry.paths[name], args.confidence)
+                legacy_ms += (time.perf_counter() - started) * 1000
+                legacy_ok += is_correct(location, target, scale)
+
+                started = time.perf_counter()
+                # Ekran piramidi yakalama başına bir kez kurulur (ScreenFrame.pyramid)
+                levels = build_pyramid(to_gray(scaled), registry.levels)
+                match = registry.find(levels, name, args.confidence)
+                new_ms += (time.perf_counter() - started) * 1000
+                new_ok += is_correct(None if match is None else (match.x, match.y), target, scale)
+
+            count = len(cases)
+            print(f"Ölçek {scale:.2f}:")
+            print(f"  Eski: renkli tek ölçek        : {legacy_ms / count:8.1f} ms/arama  "
+                  f"doğru {legacy_ok}/{count}")
+            print(f"  Yeni: gri piramit çok ölçek   : {new_ms / count:8.1f} ms/arama  "
+                  f"doğru {new_ok}/{count}")
+
+
+if __name__ == "__main__":
+    main()
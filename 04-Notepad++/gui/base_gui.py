@@ -10,23 +10,30 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-import pandas as pd
 from datetime import datetime
 import time
 import math
-import random
 import threading
 from typing import List, Dict, Any, Optional
 
+from .dashboard_stats import DashboardStats
+from .frame_scheduler import FrameScheduler
+from .gradients import paint_gradient
+from .modal_system import ModalEvents
+from .particle_renderer import ParticleRenderer
+from .startup_profiler import StartupProfiler
+from .virtual_table import VirtualTable
+
 class Level3EnterpriseGUI:
     def __init__(self):
+        # Açılış profili: modül kurulum süreleri, ilk kare ve etkileşime hazır olma
+        self.profiler = StartupProfiler()
         self.root = tk.Tk()
         self.root.title("🎭 Enterprise ERP v5.0 - Level 3 Aesthetic")
         self.root.geometry("1600x900")
         self.root.state('zoomed')
         
         # ✨ LEVEL 3 AESTHETIC VARIABLES
-        self.particles = []
         self.animation_running = True
         self.hover_effects = {}
         self.transition_state = "idle"
@@ -36,16 +43,24 @@ class Level3EnterpriseGUI:
         self.main_data = []
         self.current_records = []
         self.processing_files = []
+        # Dashboard kartları için artımlı sayaçlar (main_data taranmaz)
+        self.dashboard_stats = DashboardStats()
         
         # Modal referansları (orijinal)
         self.data_entry_window = None
         self.confirmation_dialog = None
+        # Bot'un polling yerine beklediği modal/popup olayları
+        self.events = ModalEvents()
+        # Tüm efektler tek after() döngüsünden çalışır
+        self.animations = FrameScheduler(self.root)
         
         # 🎨 LEVEL 3 SETUP
-        self.setup_level3_base()
-        self.setup_glassmorphism_styles()
-        self.setup_3d_effects()
-        self.create_particle_system()
+        with self.profiler.module("styles"):
+            self.setup_level3_base()
+            self.setup_glassmorphism_styles()
+            self.setup_3d_effects()
+        with self.profiler.module("particles"):
+            self.create_particle_system()
         self.create_level3_interface()
         self.start_aesthetic_animations()
         
@@ -167,171 +182,62 @@ class Level3EnterpriseGUI:
         # method to move the entire canvas behind other widgets
         tk.Widget.lower(self.particle_canvas)
         
-        # Generate initial particles
-        self.generate_particles()
-        
-    def generate_particles(self):
-        """✨ Parçacık üretimi"""
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-        
-        # Create 50 floating particles
-        for _ in range(50):
-            particle = {
-                'x': random.randint(0, screen_width),
-                'y': random.randint(0, screen_height),
-                'vx': random.uniform(-0.5, 0.5),
-                'vy': random.uniform(-0.5, 0.5),
-                'size': random.randint(2, 6),
-                'color': random.choice(['#89b4fa', '#a6e3a1', '#f9e2af', '#f38ba8', '#cdd6f4']),
-                'alpha': random.uniform(0.3, 0.8),
-                'pulse': random.uniform(0, 2 * math.pi)
-            }
-            self.particles.append(particle)
-
-    def animate_particles(self):
-        """✨ Parçacık animasyonu"""
-        if not self.animation_running:
-            return
-            
-        try:
-            # Clear canvas
-            self.particle_canvas.delete("particle")
-            
-            screen_width = self.root.winfo_width()
-            screen_height = self.root.winfo_height()
-            
-            for particle in self.particles:
-                # Update position
-                particle['x'] += particle['vx']
-                particle['y'] += particle['vy']
-                
-                # Wrap around screen
-                if particle['x'] < 0:
-                    particle['x'] = screen_width
-                elif particle['x'] > screen_width:
-                    particle['x'] = 0
-                    
-                if particle['y'] < 0:
-                    particle['y'] = screen_height
-                elif particle['y'] > screen_height:
-                    particle['y'] = 0
-                
-                # Pulse effect
-                particle['pulse'] += 0.05
-                pulse_alpha = particle['alpha'] + 0.2 * math.sin(particle['pulse'])
-                pulse_size = particle['size'] + 1 * math.sin(particle['pulse'] * 2)
-                
-                # Draw particle with glow effect
-                self.draw_glowing_particle(
-                    particle['x'], particle['y'], 
-                    pulse_size, particle['color'], pulse_alpha
-                )
-                
-        except tk.TclError:
-            # Widget destroyed
-            self.animation_running = False
-            return
-            
-        # Schedule next frame
-        self.root.after(50, self.animate_particles)
-
-    def draw_glowing_particle(self, x, y, size, color, alpha):
-        """✨ Işıldayan parçacık çizimi"""
-        try:
-            # Outer glow
-            glow_size = size * 2
-            self.particle_canvas.create_oval(
-                x - glow_size, y - glow_size,
-                x + glow_size, y + glow_size,
-                fill=color, outline="",
-                stipple="gray25",
-                tags="particle"
-            )
-            
-            # Inner particle
-            self.particle_canvas.create_oval(
-                x - size, y - size,
-                x + size, y + size,
-                fill=color, outline="",
-                tags="particle"
-            )
-        except tk.TclError:
-            pass
+        # Öğeler bir kez oluşturulur, karelerde yalnızca taşınır
+        self.particle_renderer = ParticleRenderer(self.particle_canvas, self.animations)
 
     def start_aesthetic_animations(self):
         """🎬 Estetik animasyonları başlat"""
-        # Particle animation
-        self.animate_particles()
-        
         # Breathing effect for main elements
-        self.start_breathing_effect()
+        self.animations.register('breathing', self.breathe, 100)
         
-        # Floating effect for cards
-        self.start_floating_effect()
+        # Floating effect for cards (yalnızca dashboard sekmesi görünürken)
+        if hasattr(self, 'stats_cards'):
+            self.animations.register('floating', self.float_stats_cards, 150, widget=self.stats_cards[0])
+        
+        # Ana döngü gecikmesi durum çubuğunda
+        self.animations.register('latency_status', self.update_loop_latency, 1000)
+        
+        # Particle animation dahil tek döngü
+        self.animations.start()
 
-    def start_breathing_effect(self):
+    def breathe(self, now: float):
         """🫁 Nefes alma efekti"""
-        def breathe():
-            if not self.animation_running:
-                return
-                
-            try:
-                # Subtle alpha breathing for glassmorphism
-                breath_cycle = time.time() * 0.5
-                alpha_variation = 0.05 * math.sin(breath_cycle)
-                self.glassmorphism_alpha = 0.85 + alpha_variation
-                
-            except:
-                pass
-                
-            self.root.after(100, breathe)
-            
-        breathe()
+        # Subtle alpha breathing for glassmorphism
+        breath_cycle = time.time() * 0.5
+        alpha_variation = 0.05 * math.sin(breath_cycle)
+        self.glassmorphism_alpha = 0.85 + alpha_variation
 
-    def start_floating_effect(self):
+    def float_stats_cards(self, now: float):
         """🎈 Yüzen eleman efekti"""
-        def float_elements():
-            if not self.animation_running:
-                return
-                
-            try:
-                # Subtle floating motion for stats cards
-                float_cycle = time.time() * 0.3
-                float_offset = 2 * math.sin(float_cycle)
-                
-                # Apply to stats cards if they exist
-                if hasattr(self, 'stats_cards'):
-                    for card in self.stats_cards:
-                        try:
-                            current_y = card.winfo_y()
-                            card.place(y=current_y + float_offset)
-                        except:
-                            pass
-                            
-            except:
-                pass
-                
-            self.root.after(150, float_elements)
-            
-        float_elements()
+        # Subtle floating motion for stats cards; yalnızca piksel değişince yeniden yerleşir
+        float_cycle = time.time() * 0.3
+        float_offset = round(2 * math.sin(float_cycle))
+        if float_offset == getattr(self, '_float_offset', None):
+            return
+        self._float_offset = float_offset
+        for card in self.stats_cards:
+            card.pack_configure(pady=(2 + float_offset, 2 - float_offset))
 
     def create_level3_interface(self):
         """🎨 Level 3 arayüz - Tüm efektlerle"""
         # Ana menü sistemi (orijinal fonksiyonellik korunuyor)
-        self.create_comprehensive_menu()
+        with self.profiler.module("menu"):
+            self.create_comprehensive_menu()
         
         # 🌊 GRADIENT TOOLBAR
-        self.create_gradient_toolbar()
+        with self.profiler.module("toolbar"):
+            self.create_gradient_toolbar()
         
         # 🪟 GLASSMORPHISM TABS
-        self.create_glassmorphism_tabs()
+        with self.profiler.module("tabs"):
+            self.create_glassmorphism_tabs()
         
         # 🎴 3D CONTENT MODULES
         self.create_3d_module_contents()
         
         # ✨ GLOWING STATUS BAR
-        self.create_glowing_status_bar()
+        with self.profiler.module("status_bar"):
+            self.create_glowing_status_bar()
 
     def create_gradient_toolbar(self):
         """🌊 Gradient toolbar"""
@@ -368,29 +274,13 @@ class Level3EnterpriseGUI:
         self.create_status_indicators(gradient_canvas)
 
     def create_gradient_background(self, canvas, color1, color2):
-        """🌊 Canvas'ta gradient arka plan"""
-        def hex_to_rgb(hex_color):
-            return tuple(int(hex_color[i:i+2], 16) for i in (1, 3, 5))
-        
-        def rgb_to_hex(rgb):
-            return '#{:02x}{:02x}{:02x}'.format(*rgb)
-        
+        """🌊 Canvas'ta gradient arka plan (önbellekli tek görüntü)"""
         try:
-            rgb1 = hex_to_rgb(color1)
-            rgb2 = hex_to_rgb(color2)
-            
             width = canvas.winfo_reqwidth() or 1600
             height = canvas.winfo_reqheight() or 70
             
-            # Create gradient strips
-            for i in range(height):
-                ratio = i / height
-                r = int(rgb1[0] * (1 - ratio) + rgb2[0] * ratio)
-                g = int(rgb1[1] * (1 - ratio) + rgb2[1] * ratio)
-                b = int(rgb1[2] * (1 - ratio) + rgb2[2] * ratio)
-                
-                color = rgb_to_hex((r, g, b))
-                canvas.create_line(0, i, width, i, fill=color, width=1, tags="gradient")
+            # Tek PhotoImage öğesi; aynı renk/boyut diğer canvas'larda yeniden kullanılır
+            paint_gradient(canvas, color1, color2, width, height)
                 
         except Exception as e:
             # Fallback to solid color
@@ -523,17 +413,13 @@ class Level3EnterpriseGUI:
         
         # Start clock update
         self.update_clock()
+        self.animations.register('clock', self.update_clock, 1000)
 
-    def update_clock(self):
+    def update_clock(self, now: float = None):
         """⏰ Saati güncelle"""
         if hasattr(self, 'clock_label'):
-            try:
-                current_time = datetime.now().strftime('%H:%M:%S')
-                self.clock_label.configure(text=current_time)
-            except:
-                pass
-        
-        self.root.after(1000, self.update_clock)
+            current_time = datetime.now().strftime('%H:%M:%S')
+            self.clock_label.configure(text=current_time)
 
     def create_glassmorphism_tabs(self):
         """🪟 Glassmorphism sekme sistemi"""
@@ -547,6 +433,7 @@ class Level3EnterpriseGUI:
         
         # 6 ana modül sekmesi (orijinal fonksiyonellik korunuyor)
         self.tabs = {}
+        self.tab_keys = {}
         tab_configs = [
             ("📊 Dashboard", "dashboard"),
             ("📚 Muhasebe", "accounting"), 
@@ -561,6 +448,7 @@ class Level3EnterpriseGUI:
             frame = tk.Frame(self.notebook, bg='#0d1117')  # Originally rgba(13,17,23,0.9)
             self.notebook.add(frame, text=tab_name)
             self.tabs[tab_key] = frame
+            self.tab_keys[str(frame)] = tab_key
             
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed_with_effects)
 
@@ -568,6 +456,9 @@ class Level3EnterpriseGUI:
         """🎬 Sekme değişiminde cinematic efektler"""
         selected_tab = self.notebook.tab(self.notebook.select(), "text")
         
+        # İlk seçimde modül içeriği kurulur
+        self.ensure_tab_built(self.tab_keys.get(str(self.notebook.select())))
+        
         # Transition effect
         self.create_tab_transition_effect()
         
@@ -592,16 +483,57 @@ class Level3EnterpriseGUI:
                 pass
 
     def create_3d_module_contents(self):
-        """🎴 3D modül içerikleri"""
-        # Dashboard modülü (3D upgrade)
-        self.create_3d_dashboard_module()
-        
-        # Finans-Tahsilat modülü (3D upgrade)
-        self.create_3d_finance_module()
-        
-        # Diğer modüller (3D basit içerik)
+        """🎴 3D modül içerikleri (ilk sekme hemen, diğerleri ilk açılışta)"""
+        # Dashboard modülü (3D upgrade) - açılışta görünen sekme
+        with self.profiler.module("tab:dashboard"):
+            self.create_3d_dashboard_module()
+        self.built_tabs = {"dashboard"}
+        
+        # Finans-Tahsilat modülü (3D upgrade) ve diğer modüller (3D basit içerik)
+        self.tab_builders = {"finance": self.create_3d_finance_module}
         for module in ["accounting", "inventory", "reports", "system"]:
-            self.create_3d_simple_module(module)
+            self.tab_builders[module] = lambda m=module: self.create_3d_simple_module(m)
+        
+        # Kurulana kadar iskelet yer tutucu gösterilir
+        self.tab_skeletons = {}
+        for key in self.tab_builders:
+            self.tab_skeletons[key] = self.create_tab_skeleton(self.tabs[key])
+
+    def create_tab_skeleton(self, parent) -> tk.Frame:
+        """⏳ Sekme kurulana kadar gösterilen hafif iskelet"""
+        skeleton = tk.Frame(parent, bg='#0d1117')
+        skeleton.pack(fill='both', expand=True, padx=20, pady=20)
+        tk.Frame(skeleton, bg='#1e1e2e', height=80).pack(fill='x', pady=10)
+        for width in (900, 700, 800):
+            tk.Frame(skeleton, bg='#181825', height=24, width=width).pack(anchor='w', pady=8)
+        tk.Label(
+            skeleton,
+            text="⏳ Modül yükleniyor...",
+            font=('Segoe UI', 12),
+            bg='#0d1117',
+            fg='#6c7086'
+        ).pack(pady=20)
+        return skeleton
+
+    def ensure_tab_built(self, key: Optional[str]) -> bool:
+        """🎴 Sekme içeriğini gerekiyorsa şimdi kur; kurulduysa True"""
+        if key is None or key in self.built_tabs:
+            return key is not None
+        builder = self.tab_builders.get(key)
+        if builder is None:
+            return False
+        skeleton = self.tab_skeletons.pop(key, None)
+        if skeleton is not None:
+            skeleton.destroy()
+        with self.profiler.module(f"tab:{key}"):
+            builder()
+        self.built_tabs.add(key)
+        return True
+
+    def build_all_tabs(self):
+        """🎴 Tüm tembel sekmeleri kur (ör. ekran görüntüsü veya test için)"""
+        for key in list(self.tab_builders):
+            self.ensure_tab_built(key)
 
     def create_3d_dashboard_module(self):
         """📊 3D Dashboard modülü"""
@@ -639,7 +571,9 @@ class Level3EnterpriseGUI:
             ("Toplam İşlem", "0", "#a6e3a1", "📊"),
             ("Bugünkü İşlem", "0", "#89b4fa", "📈"),
             ("Aktif Dosya", "0", "#f9e2af", "📁"),
-            ("Başarı Oranı", "%0", "#f38ba8", "🎯")
+            ("Başarı Oranı", "%0", "#f38ba8", "🎯"),
+            ("Toplam Tutar", "0.00 TL", "#cba6f7", "💰"),
+            ("Ortalama Tutar", "0.00 TL", "#94e2d5", "⚖️")
         ]
         
         self.stats_cards = []
@@ -682,6 +616,12 @@ class Level3EnterpriseGUI:
             self.total_transactions_label = value_label
         elif index == 1:
             self.today_transactions_label = value_label
+        elif index == 2:
+            self.active_files_label = value_label
+        elif index == 4:
+            self.total_amount_label = value_label
+        elif index == 5:
+            self.average_amount_label = value_label
         
         # Hover effects
         def on_card_hover(e):
@@ -713,12 +653,13 @@ class Level3EnterpriseGUI:
         )
         glass_container.pack(fill='both', expand=True)
         
-        # Treeview with custom styling
+        # Sanal tablo: yalnızca görünen satırlar çizilir, kaynak main_data listesidir
         columns = ['ID', 'Tarih', 'Dosya', 'Açıklama', 'Tutar', 'Durum', 'Zaman']
-        self.main_tree = ttk.Treeview(
+        self.main_tree = VirtualTable(
             glass_container,
-            columns=columns,
-            show='headings',
+            columns,
+            self.main_data,
+            self.main_row_values,
             height=12
         )
         
@@ -732,16 +673,15 @@ class Level3EnterpriseGUI:
                 anchor='center' if col in ['ID', 'Tarih', 'Tutar', 'Durum', 'Zaman'] else 'w'
             )
         
-        # Scrollbar with style
-        scrollbar = ttk.Scrollbar(
-            glass_container,
-            orient='vertical',
-            command=self.main_tree.yview
-        )
-        self.main_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.main_tree.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
+        self.main_tree.pack(fill='both', expand=True)
+
+    @staticmethod
+    def main_row_values(row: Dict[str, Any]) -> List[Any]:
+        """main_data kaydının tablo sütunları"""
+        return [
+            row['id'], row['date'], row['file'], row['description'],
+            f"{row['amount']:.2f} TL", row['status'], row['time']
+        ]
 
     def create_3d_finance_module(self):
         """💰 3D Finans modülü"""
@@ -783,9 +723,17 @@ class Level3EnterpriseGUI:
         # 🎯 3D DATA OPERATIONS CONTENT
         self.create_3d_data_operations_content()
         
-        # Diğer alt sekmeler için glassmorphism içerik
-        for key in ["collections", "banking", "finance_reports"]:
-            self.create_3d_placeholder_content(self.sub_tabs[key], key)
+        # Diğer alt sekmeler için glassmorphism içerik - alt sekme ilk seçildiğinde
+        self.pending_sub_tabs = {"collections", "banking", "finance_reports"}
+        sub_notebook.bind("<<NotebookTabChanged>>", lambda e: self.on_sub_tab_changed(sub_notebook))
+
+    def on_sub_tab_changed(self, sub_notebook):
+        """🪟 Alt sekme ilk açıldığında yer tutucu içeriği kur"""
+        selected = str(sub_notebook.select())
+        for key in list(self.pending_sub_tabs):
+            if str(self.sub_tabs[key]) == selected:
+                self.pending_sub_tabs.discard(key)
+                self.create_3d_placeholder_content(self.sub_tabs[key], key)
 
     def create_3d_data_operations_content(self):
         """🎯 3D Veri İşlemleri içeriği - 6 ADIMLI SÜREÇ"""
@@ -987,37 +935,30 @@ class Level3EnterpriseGUI:
             )
             self.status_dots.append(dot)
         
-        # Start dot animation
-        self.animate_status_dots(dots_canvas)
+        # Start dot animation (Veri İşlemleri sekmesi gizliyken atlanır)
+        self.status_dots_canvas = dots_canvas
+        self.animations.register('status_dots', self.animate_status_dots, 100, widget=dots_canvas)
 
-    def animate_status_dots(self, canvas):
+    def animate_status_dots(self, now: float):
         """✨ Durum noktası animasyonu"""
-        if not self.animation_running:
-            return
-            
-        try:
-            # Pulse effect on dots
-            pulse_time = time.time() * 2
+        canvas = self.status_dots_canvas
+        
+        # Pulse effect on dots
+        pulse_time = time.time() * 2
+        
+        for i, dot in enumerate(self.status_dots):
+            phase = (pulse_time + i * 0.5) % (2 * math.pi)
+            alpha = 0.3 + 0.7 * (math.sin(phase) + 1) / 2
             
-            for i, dot in enumerate(self.status_dots):
-                phase = (pulse_time + i * 0.5) % (2 * math.pi)
-                alpha = 0.3 + 0.7 * (math.sin(phase) + 1) / 2
-                
-                # Color intensity based on alpha
-                if alpha > 0.8:
-                    color = '#89b4fa'
-                elif alpha > 0.5:
-                    color = '#74c0fc'
-                else:
-                    color = '#4dabf7'
-                
-                canvas.itemconfig(dot, fill=color)
-                
-        except tk.TclError:
-            self.animation_running = False
-            return
+            # Color intensity based on alpha
+            if alpha > 0.8:
+                color = '#89b4fa'
+            elif alpha > 0.5:
+                color = '#74c0fc'
+            else:
+                color = '#4dabf7'
             
-        canvas.after(100, lambda: self.animate_status_dots(canvas))
+            canvas.itemconfig(dot, fill=color)
 
     def create_3d_simple_module(self, module_key):
         """🎴 3D basit modül içeriği"""
@@ -1094,8 +1035,42 @@ class Level3EnterpriseGUI:
             tags="info_text"
         )
         
+        # Ana döngü gecikmesi ve parçacık kare hızı
+        self.latency_text_id = status_canvas.create_text(
+            1120, 20,
+            text="⏱️ Döngü gecikmesi: -",
+            fill='#9399b2',
+            font=('Segoe UI', 9),
+            anchor='e',
+            tags="latency_text"
+        )
+        
         self.status_canvas = status_canvas
 
+    def update_loop_latency(self, now: float = None):
+        """⏱️ Ana döngü gecikmesini durum çubuğuna yaz"""
+        if hasattr(self, 'status_canvas') and hasattr(self, 'latency_text_id'):
+            scheduler = self.animations
+            renderer = self.particle_renderer
+            animation = "⏸️ animasyon durduruldu" if renderer.paused else f"🎞️ {renderer.fps} FPS"
+            self.status_canvas.itemconfig(
+                self.latency_text_id,
+                text=(f"⏱️ Döngü gecikmesi: {scheduler.latency_avg_ms:.0f} ms "
+                      f"(maks {scheduler.latency_max_ms:.0f}) | {animation}"),
+                fill='#f9e2af' if scheduler.latency_avg_ms > scheduler.latency_budget_ms else '#9399b2'
+            )
+
+    def get_animation_stats(self) -> Dict[str, Any]:
+        """Animasyon başına maliyet, geri çekilme katsayısı ve CPU payı"""
+        return self.animations.stats()
+
+    def set_automation_active(self, active: bool):
+        """🤖 Otomasyon sürerken arka plan animasyonunu tamamen duraklat"""
+        if active:
+            self.particle_renderer.pause()
+        else:
+            self.particle_renderer.resume()
+
     def update_status_with_glow(self, message):
         """✨ Glow efekti ile durum güncelleme"""
         if hasattr(self, 'status_canvas') and hasattr(self, 'status_text_id'):
@@ -1123,6 +1098,7 @@ class Level3EnterpriseGUI:
 
         try:
             # Önceki modal'ı temizle
+            self.events.set_modal_ready(False)
             if hasattr(self, 'data_entry_window') and self.data_entry_window:
                 try:
                     self.data_entry_window.destroy()
@@ -1143,6 +1119,7 @@ class Level3EnterpriseGUI:
             self.data_entry_window.attributes('-topmost', True)
             self.data_entry_window.lift()
             self.data_entry_window.focus_set()
+            self._bind_modal_close_event(self.data_entry_window)
 
             print("🎨 Level 3 Modal pencere oluşturuldu, içerik ekleniyor...")
 
@@ -1163,6 +1140,7 @@ class Level3EnterpriseGUI:
                 
                 print("✅ Level 3 Modal entries hazır!")
                 self.update_status_with_glow("✅ Level 3 Modal başarıyla açıldı")
+                self.events.set_modal_ready(True)
                 return True
             else:
                 print("❌ Level 3 Modal entries hazır değil!")
@@ -1172,6 +1150,22 @@ class Level3EnterpriseGUI:
             print(f"❌ Level 3 Modal açma hatası: {e}")
             return False
 
+    def _bind_modal_close_event(self, window):
+        """Modal hangi yoldan kapanırsa kapansın 'hazır' durumunu düşür"""
+        def on_destroy(event):
+            if str(event.widget) == str(window):
+                self.events.set_modal_ready(False)
+        window.bind('<Destroy>', on_destroy, add='+')
+
+    def _track_popup(self, popup):
+        """Popup açık kaldığı sürece olay yolunda say"""
+        self.events.popup_opened()
+
+        def on_destroy(event):
+            if str(event.widget) == str(popup):
+                self.events.popup_closed()
+        popup.bind('<Destroy>', on_destroy, add='+')
+
     def create_level3_modal_content(self):
         """🎨 Level 3 modal içeriği"""
         modal = self.data_entry_window
@@ -1328,8 +1322,8 @@ class Level3EnterpriseGUI:
 
     # === LEVEL 3 ENHANCED ORIGINAL FUNCTIONS ===
     
-    def save_advanced_record(self):
-        """💾 Level 3 gelişmiş kayıt kaydetme"""
+    def save_advanced_record(self) -> bool:
+        """💾 Level 3 gelişmiş kayıt kaydetme (kaydedildiyse True)"""
         # Form verilerini al (orijinal fonksiyonellik)
         data = {}
         for key, entry in self.modal_entries.items():
@@ -1337,18 +1331,19 @@ class Level3EnterpriseGUI:
             
         if not all(data.values()):
             self.show_level3_modal_warning("Uyarı", "Lütfen tüm alanları doldurun!")
-            return
+            return False
             
         try:
             amount_val = float(data['amount_entry'].replace(',', '.'))
         except ValueError:
             self.show_level3_modal_error("Hata", "Geçersiz tutar formatı!")
-            return
+            return False
             
         # Ana tabloya ekle (orijinal fonksiyonellik korunuyor)
         record_id = len(self.main_data) + 1
         timestamp = datetime.now().strftime('%H:%M:%S')
         
+        self.dashboard_stats.add(data['date_entry'], amount_val, data['file_entry'], data['desc_entry'])
         self.main_data.append({
             'id': record_id,
             'date': data['date_entry'],
@@ -1359,12 +1354,8 @@ class Level3EnterpriseGUI:
             'time': timestamp
         })
         
-        # Ana tabloyu güncelle (orijinal)
-        self.main_tree.insert('', 'end', values=[
-            record_id, data['date_entry'], data['file_entry'],
-            data['desc_entry'], f"{amount_val:.2f} TL",
-            'Kaydedildi', timestamp
-        ])
+        # Ana tabloyu güncelle: yalnızca görünen satırlar yeniden çizilir
+        self.main_tree.notify_appended()
         
         # 🎨 LEVEL 3 ENHANCEMENTS
         self.update_3d_dashboard_stats()
@@ -1386,9 +1377,45 @@ class Level3EnterpriseGUI:
         self.clear_advanced_form()
         
         # Ana tabloya scroll
-        children = self.main_tree.get_children()
-        if children:
-            self.main_tree.see(children[-1])
+        self.main_tree.see_end()
+        return True
+
+    def append_records_bulk(self, rows, refresh: bool = True) -> int:
+        """⚡ Doğrulanmış kayıtları forma yazmadan ana tabloya toplu ekle
+
+        ``rows``: (tarih, dosya, açıklama, tutar) demetleri. Kayıt yapısı
+        save_advanced_record ile aynıdır; ekran yalnızca ``refresh`` ile yenilenir.
+        """
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        record_id = len(self.main_data)
+        for date_text, file_name, description, amount_val in rows:
+            record_id += 1
+            self.dashboard_stats.add(date_text, amount_val, file_name, description)
+            self.main_data.append({
+                'id': record_id,
+                'date': date_text,
+                'file': file_name,
+                'description': description,
+                'amount': amount_val,
+                'status': 'Kaydedildi',
+                'time': timestamp
+            })
+        self.main_tree.notify_appended(len(rows))
+        if refresh:
+            self.refresh_after_bulk_commit()
+        return len(rows)
+
+    def refresh_after_bulk_commit(self):
+        """📊 Toplu kayıttan sonra dashboard, ilerleme ve tabloyu bir kez güncelle"""
+        self.update_3d_dashboard_stats()
+        if getattr(self, 'modal_progress', None) is not None and self.current_records:
+            progress_percent = min(100, len(self.main_data) / len(self.current_records) * 100)
+            try:
+                self.modal_progress['value'] = progress_percent
+            except tk.TclError:
+                pass
+        self.main_tree.see_end()
+        self.update_status_with_glow(f"⚡ Toplu kayıt: {len(self.main_data)} kayıt tabloda")
 
     def create_save_success_animation(self):
         """✨ Kaydetme başarı animasyonu"""
@@ -1404,16 +1431,18 @@ class Level3EnterpriseGUI:
     def update_3d_dashboard_stats(self):
         """📊 3D dashboard istatistik güncelleme"""
         if hasattr(self, 'total_transactions_label'):
-            total = len(self.main_data)
-            today = len([
-                r for r in self.main_data
-                if r['date'] == datetime.now().strftime('%d.%m.%Y')
-            ])
+            stats = self.dashboard_stats
 
             # Level 3 güncelleme - glow effect ile
-            self.total_transactions_label.config(text=str(total), fg='#a6e3a1')
+            self.total_transactions_label.config(text=str(stats.total), fg='#a6e3a1')
             if hasattr(self, 'today_transactions_label'):
-                self.today_transactions_label.config(text=str(today), fg='#89b4fa')
+                self.today_transactions_label.config(text=str(stats.today), fg='#89b4fa')
+            if hasattr(self, 'active_files_label'):
+                self.active_files_label.config(text=str(stats.file_count))
+            if hasattr(self, 'total_amount_label'):
+                self.total_amount_label.config(text=f"{stats.total_amount:,.2f} TL")
+            if hasattr(self, 'average_amount_label'):
+                self.average_amount_label.config(text=f"{stats.average_amount:,.2f} TL")
             
             # Glow effect - fade back
             self.root.after(1500, lambda: self.total_transactions_label.config(fg='#a6e3a1'))
@@ -1434,6 +1463,7 @@ class Level3EnterpriseGUI:
         popup.transient(self.data_entry_window)
         popup.attributes('-topmost', True)
         popup.grab_set()
+        self._track_popup(popup)
 
         tk.Label(popup, text="⚠️", font=('Segoe UI Emoji', 24),
                  bg='#1e1e2e', fg='#f9e2af').pack(pady=10)
@@ -1461,6 +1491,7 @@ class Level3EnterpriseGUI:
         popup.transient(self.data_entry_window)
         popup.attributes('-topmost', True)
         popup.grab_set()
+        self._track_popup(popup)
 
         tk.Label(popup, text="❌", font=('Segoe UI Emoji', 24),
                  bg='#1e1e2e', fg='#f38ba8').pack(pady=10)
@@ -1489,6 +1520,7 @@ class Level3EnterpriseGUI:
 
     def close_modal(self):
         """❌ Level 3 modal kapatma"""
+        self.events.set_modal_ready(False)
         if self.data_entry_window:
             # Level 3 closing animation
             try:
@@ -1505,11 +1537,13 @@ class Level3EnterpriseGUI:
 
     def _show_info_left(self, title: str, message: str) -> None:
         """Sol tarafta bilgi mesajı göster"""
-        messagebox.showinfo(title, message, parent=self.root)
+        with self.events.popup():
+            messagebox.showinfo(title, message, parent=self.root)
 
     def _ask_yes_no_left(self, title: str, message: str) -> bool:
         """Sol tarafta evet/hayır sorusu"""
-        return messagebox.askyesno(title, message, parent=self.root)
+        with self.events.popup():
+            return messagebox.askyesno(title, message, parent=self.root)
 
     # === ORIGINAL FUNCTIONALITY PRESERVED ===
     
@@ -1534,13 +1568,22 @@ class Level3EnterpriseGUI:
         
         for module_name, sub_menus in modules.items():
             module_menu = tk.Menu(menubar, tearoff=0)
+            # Alt menü komutları menü ilk açıldığında eklenir
+            module_menu.configure(
+                postcommand=lambda menu=module_menu, m=module_name, items=sub_menus:
+                    self.populate_module_menu(menu, m, items)
+            )
             menubar.add_cascade(label=module_name, menu=module_menu)
-            
-            for sub_menu in sub_menus:
-                module_menu.add_command(
-                    label=sub_menu,
-                    command=lambda m=module_name, s=sub_menu: self.menu_selected(m, s)
-                )
+
+    def populate_module_menu(self, module_menu, module_name, sub_menus):
+        """📋 Modül menüsünü ilk açılışta doldur"""
+        if module_menu.index('end') is not None:
+            return
+        for sub_menu in sub_menus:
+            module_menu.add_command(
+                label=sub_menu,
+                command=lambda m=module_name, s=sub_menu: self.menu_selected(m, s)
+            )
 
     # Step functions (orijinal fonksiyonellik korunuyor)
     def step1_select_source(self):
@@ -1674,15 +1717,16 @@ class Level3EnterpriseGUI:
         # Veri tablosu
         if self.current_records:
             columns = list(self.current_records[0].keys())
-            tree = ttk.Treeview(preview, columns=columns, show="headings", height=25)
+            # Sanal tablo: kayıtlar Treeview'a kopyalanmaz, görünen satırlar okunur
+            tree = VirtualTable(
+                preview, columns, self.current_records,
+                lambda rec: [rec.get(col, "") for col in columns], height=25, follow=False
+            )
             
             for col in columns:
                 tree.heading(col, text=f"✨ {col.title()}")
                 tree.column(col, width=150, anchor="w")
                 
-            for rec in self.current_records:
-                tree.insert("", "end", values=[rec.get(col, "") for col in columns])
-                
             tree.pack(fill="both", expand=True, padx=20, pady=20)
             
         # Level 3 close button
@@ -1699,9 +1743,26 @@ class Level3EnterpriseGUI:
     def get_main_data(self):
         """Ana veri listesini döndür"""
         return self.main_data
+
+    def report_startup_profile(self):
+        """⏱️ Açılış profilini konsola yaz"""
+        print("⏱️ Level 3 açılış profili:\n" + self.profiler.format())
+
+    @property
+    def interactive(self) -> threading.Event:
+        """Olay döngüsü girdiye açıldığında set edilen olay (bot bunu bekler)"""
+        return self.profiler.interactive
+
+    def get_startup_profile(self) -> Dict[str, Any]:
+        """İlk kare, etkileşime hazır olma ve modül bazında kurulum süreleri"""
+        return self.profiler.report()
+
+    def get_dashboard_stats(self) -> Dict[str, Any]:
+        """Dashboard sayaçları: toplam, bugün, tutarlar, dosya ve işlem tipi dağılımı"""
+        return self.dashboard_stats.snapshot()
         
     def set_current_records(self, records):
-        """Mevcut kayıtları ayarla"""
+        """Mevcut kayıtları ayarla (Transaction dizisi veya dict listesi)"""
         self.current_records = records
         
     def set_processing_files(self, file_list):
@@ -1711,11 +1772,13 @@ class Level3EnterpriseGUI:
     def run(self):
         """🎨 Level 3 Uygulamayı çalıştır"""
         self.update_status_with_glow("🎨 Level 3 Enterprise ERP Sistemi hazır - Karmaşık navigasyon aktif")
+        self.profiler.watch(self.root, on_interactive=self.report_startup_profile)
         try:
             self.root.mainloop()
         finally:
             # Cleanup animations
             self.animation_running = False
+            self.animations.stop()
 
 
 # Level 3 GUI'yi EnterpriseGUI olarak alias et (backward compatibility)
@@ -0,0 +1,187 @@
+"""
+Kare Zamanlayıcı - tüm Seviye 3 animasyonlarını süren tek after() döngüsü
+Gizli widget'ların animasyonları atlanır; adım bütçeyi aşınca aralıklar uzatılır
+"""
+
+import time
+import tkinter as tk
+from typing import Callable, Dict, List, Optional
+
+
+class Animation:
+    """Kayıtlı efekt; interval_ms ve paused her an değişebilir"""
+
+    __slots__ = ('name', 'callback', 'interval_ms', 'widget', 'paused', 'next_due',
+                 'calls', 'skipped', 'deferred', 'errors', 'total_ms', 'max_ms')
+
+    def __init__(self, name: str, callback: Callable[[float], None], interval_ms: int,
+                 widget: Optional[tk.Misc] = None):
+        self.name = name
+        self.callback = callback
+        self.interval_ms = interval_ms
+        self.widget = widget
+        self.paused = False
+        self.next_due = 0.0
+        self.calls = 0
+        self.skipped = 0
+        self.deferred = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            'interval_ms': self.interval_ms,
+            'calls': self.calls,
+            'skipped': self.skipped,
+            'deferred': self.deferred,
+            'errors': self.errors,
+            'total_ms': round(self.total_ms, 2),
+            'avg_ms': round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            'max_ms': round(self.max_ms, 2),
+            'paused': self.paused,
+        }
+
+
+class FrameScheduler:
+    """Görünürlük kontrolü, adım bütçesi ve geri çekilmeli tek callback zamanlayıcı"""
+
+    MAX_BACKOFF = 8
+
+    def __init__(self, root: tk.Misc, base_ms: int = 50, budget_ms: float = 8.0,
+                 latency_budget_ms: float = 30.0, recover_after: int = 40):
+        self.root = root
+        self.base_ms = base_ms
+        self.budget_ms = budget_ms
+        self.latency_budget_ms = latency_budget_ms
+        self.recover_after = recover_after
+        self.backoff = 1
+        self.animations: List[Animation] = []
+        self.ticks = 0
+        self.minimized_ticks = 0
+        self.work_ms = 0.0
+        # Ana döngü gecikmesi: tick'in planlanandan ne kadar geç çalıştığı
+        self.latency_ms = 0.0
+        self.latency_avg_ms = 0.0
+        self.latency_max_ms = 0.0
+        self._cheap_ticks = 0
+        self._expected = 0.0
+        self._started_at = 0.0
+        self._after_id = None
+        self._running = False
+
+    def register(self, name: str, callback: Callable[[float], None], interval_ms: int,
+                 widget: Optional[tk.Misc] = None) -> Animation:
+        """callback(now)'u her interval_ms'de çalıştır; widget gizliyken atlanır"""
+        animation = Animation(name, callback, interval_ms, widget)
+        self.animations.append(animation)
+        return animation
+
+    def unregister(self, name: str) -> None:
+        self.animations = [animation for animation in self.animations if animation.name != name]
+
+    def start(self) -> None:
+        if not self._running:
+            self._running = True
+            self._started_at = time.perf_counter()
+            self._schedule()
+
+    def stop(self) -> None:
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _schedule(self) -> None:
+        self._expected = time.perf_counter() + self.base_ms / 1000
+        try:
+            self._after_id = self.root.after(self.base_ms, self._tick)
+        except tk.TclError:
+            self._running = False
+
+    def _minimized(self) -> bool:
+        try:
+            return self.root.state() in ('iconic', 'withdrawn')
+        except tk.TclError:
+            return True
+
+    def _tick(self) -> None:
+        self._after_id = None
+        if not self._running:
+            return
+        started = time.perf_counter()
+        late = max(0.0, (started - self._expected) * 1000)
+        self.latency_ms = late
+        self.latency_avg_ms = late if not self.ticks else 0.8 * self.latency_avg_ms + 0.2 * late
+        self.latency_max_ms = max(self.latency_max_ms, late)
+        self.ticks += 1
+
+        if self._minimized():
+            # Simge durumundaki pencerede hiçbir efekt çizilmez
+            self.minimized_ticks += 1
+        else:
+            self._run_due(started)
+
+        spent = (time.perf_counter() - started) * 1000
+        self.work_ms += spent
+        self._adapt(spent)
+        self._schedule()
+
+    def _run_due(self, now: float) -> None:
+        deadline = now + self.budget_ms / 1000
+        for animation in list(self.animations):
+            if animation.paused or now < animation.next_due:
+                continue
+            animation.next_due = now + animation.interval_ms * self.backoff / 1000
+            if time.perf_counter() > deadline:
+                # Bütçe doldu: sıradaki tick'e bırakılır
+                animation.next_due = now
+                animation.deferred += 1
+                continue
+            try:
+                if animation.widget is not None and not animation.widget.winfo_viewable():
+                    animation.skipped += 1
+                    continue
+                call_started = time.perf_counter()
+                animation.callback(now)
+            except tk.TclError:
+                # Widget yok edildi; animasyon listeden çıkar
+                self.unregister(animation.name)
+                continue
+            except Exception:
+                animation.errors += 1
+                continue
+            cost = (time.perf_counter() - call_started) * 1000
+            animation.calls += 1
+            animation.total_ms += cost
+            animation.max_ms = max(animation.max_ms, cost)
+
+    def _adapt(self, spent_ms: float) -> None:
+        if spent_ms > self.budget_ms or self.latency_avg_ms > self.latency_budget_ms:
+            self._cheap_ticks = 0
+            self.backoff = min(self.MAX_BACKOFF, self.backoff * 2)
+        else:
+            self._cheap_ticks += 1
+            if self.backoff > 1 and self._cheap_ticks >= self.recover_after:
+                self.backoff //= 2
+                self._cheap_ticks = 0
+
+    def cpu_share(self) -> float:
+        """Başlangıçtan beri animasyon callback'lerinde geçen süre oranı"""
+        elapsed = (time.perf_counter() - self._started_at) * 1000 if self._started_at else 0.0
+        return self.work_ms / elapsed if elapsed else 0.0
+
+    def stats(self) -> Dict[str, object]:
+        """Zamanlayıcı toplamları ve animasyon başına maliyet (animations)"""
+        return {
+            'ticks': self.ticks,
+            'minimized_ticks': self.minimized_ticks,
+            'backoff': self.backoff,
+            'cpu_share': round(self.cpu_share(), 4),
+            'latency_avg_ms': round(self.latency_avg_ms, 1),
+            'latency_max_ms': round(self.latency_max_ms, 1),
+            'animations': {animation.name: animation.stats() for animation in self.animations},
+        }
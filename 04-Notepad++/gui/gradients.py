@@ -0,0 +1,92 @@
+"""
+Gradyanlar - tüm canvas'ların paylaştığı önceden çizilmiş dikey gradyanlar
+Tek piksel genişlikte PPM üretilir, Tk genişliğe yayar; Tk yorumlayıcısı başına LRU önbellekte tutulur
+"""
+
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import tkinter as tk
+
+
+def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    return tuple(int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def gradient_rows(color1: str, color2: str, height: int) -> bytes:
+    """color1'den (üst) color2'ye geçen satır renkleri, satır başına 3 bayt RGB"""
+    (r1, g1, b1), (r2, g2, b2) = hex_to_rgb(color1), hex_to_rgb(color2)
+    rows = []
+    for i in range(height):
+        ratio = i / height
+        keep = 1 - ratio
+        # Eski satır satır çizimle aynı değerler: int() kesmesi
+        rows += (int(r1 * keep + r2 * ratio), int(g1 * keep + g2 * ratio), int(b1 * keep + b2 * ratio))
+    return bytes(rows)
+
+
+def gradient_ppm(color1: str, color2: str, height: int) -> bytes:
+    """Tek piksel genişlikteki gradyan sütununun ikili PPM'i (P6)"""
+    header = f"P6 1 {height} 255\n".encode('ascii')
+    return header + gradient_rows(color1, color2, height)
+
+
+class GradientCache:
+    """Gradyan PhotoImage nesnelerinin LRU önbelleği
+
+    PhotoImage onu oluşturan Tk yorumlayıcısına bağlıdır; anahtar ``master.tk``
+    içerdiğinden yeni bir kök pencere eskisinin görüntülerini almaz.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._images: "OrderedDict[Tuple, tk.PhotoImage]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, master, color1: str, color2: str, width: int, height: int) -> tk.PhotoImage:
+        key = (master.tk, color1.lower(), color2.lower(), int(width), int(height))
+        image = self._images.get(key)
+        if image is not None:
+            self.hits += 1
+            self._images.move_to_end(key)
+            return image
+        self.misses += 1
+        column = tk.PhotoImage(master=master, data=gradient_ppm(key[1], key[2], key[4]), format='PPM')
+        # Genişliğe yayma Tk tarafında (C) yapılır
+        image = column.zoom(key[3], 1)
+        self._images[key] = image
+        if len(self._images) > self.maxsize:
+            # Atılan görüntüyü kullanan canvas kendi referansını tutar
+            self._images.popitem(last=False)
+        return image
+
+    def clear(self) -> None:
+        self._images.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """hits, misses ve size"""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._images)}
+
+
+_default_cache = GradientCache()
+
+
+def gradient_image(master, color1: str, color2: str, width: int, height: int) -> tk.PhotoImage:
+    """Süreç geneli önbellekten gradyan görüntüsü"""
+    return _default_cache.get(master, color1, color2, width, height)
+
+
+def gradient_cache_stats() -> Dict[str, int]:
+    return _default_cache.stats()
+
+
+def paint_gradient(canvas: tk.Canvas, color1: str, color2: str, width: int, height: int) -> int:
+    """Canvas'ın "gradient" öğelerini tek önbellekli görüntüyle değiştir; id döndürür"""
+    image = gradient_image(canvas, color1, color2, width, height)
+    canvas.delete("gradient")
+    # Canvas referans tutmazsa PhotoImage LRU'dan düşünce görüntü kaybolur
+    canvas.gradient_image = image
+    item = canvas.create_image(0, 0, image=image, anchor='nw', tags="gradient")
+    canvas.tag_lower(item)
+    return item
@@ -1,5 +1,84 @@
 """Modal windows for data entry and dialogs."""
 
+import threading
+import time
+from contextlib import contextmanager
+from typing import Tuple
+
+
 class ModalSystem:
     """Placeholder mixin for modal dialogs."""
     pass
+
+
+class ModalEvents:
+    """Modal/popup state published by the GUI thread for the bot to wait on.
+
+    The GUI calls ``set_modal_ready`` / ``popup_opened`` / ``popup_closed``
+    when windows appear or go away; the bot blocks in ``wait_*`` on a
+    condition variable instead of polling ``winfo_children()``. Each wait
+    also returns how long after the state change the waiter woke up.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._modal_ready = False
+        self._open_popups = 0
+        self._changed_at = time.perf_counter()
+
+    def _publish(self) -> None:
+        self._changed_at = time.perf_counter()
+        self._cond.notify_all()
+
+    @property
+    def modal_ready(self) -> bool:
+        return self._modal_ready
+
+    @property
+    def open_popups(self) -> int:
+        return self._open_popups
+
+    def set_modal_ready(self, ready: bool) -> None:
+        with self._cond:
+            if self._modal_ready != ready:
+                self._modal_ready = ready
+                self._publish()
+
+    def popup_opened(self) -> None:
+        with self._cond:
+            self._open_popups += 1
+            self._publish()
+
+    def popup_closed(self) -> None:
+        with self._cond:
+            self._open_popups = max(0, self._open_popups - 1)
+            self._publish()
+
+    @contextmanager
+    def popup(self):
+        """Mark a blocking dialog (e.g. ``messagebox``) as open while it runs."""
+        self.popup_opened()
+        try:
+            yield
+        finally:
+            self.popup_closed()
+
+    def _wait(self, predicate, timeout) -> Tuple[bool, float]:
+        with self._cond:
+            if predicate():
+                return True, 0.0
+            if not self._cond.wait_for(predicate, timeout):
+                return False, 0.0
+            return True, time.perf_counter() - self._changed_at
+
+    def wait_modal_ready(self, timeout=None) -> Tuple[bool, float]:
+        """Block until the data entry modal is ready: ``(ok, wake_latency_s)``."""
+        return self._wait(lambda: self._modal_ready, timeout)
+
+    def wait_modal_closed(self, timeout=None) -> Tuple[bool, float]:
+        """Block until the data entry modal is gone: ``(ok, wake_latency_s)``."""
+        return self._wait(lambda: not self._modal_ready, timeout)
+
+    def wait_popups_closed(self, timeout=None) -> Tuple[bool, float]:
+        """Block until no dialog is open: ``(ok, wake_latency_s)``."""
+        return self._wait(lambda: self._open_popups == 0, timeout)
@@ -0,0 +1,128 @@
+"""
+Parçacık Çizici - arka plan parçacıkları
+Öğeler bir kez oluşturulur, coords() ile taşınır; kare bütçesi aşılınca kare hızı düşer
+"""
+
+import math
+import random
+import time
+import tkinter as tk
+from typing import Dict, List
+
+from .frame_scheduler import FrameScheduler
+
+
+PARTICLE_COLORS = ['#89b4fa', '#a6e3a1', '#f9e2af', '#f38ba8', '#cdd6f4']
+
+
+class ParticleRenderer:
+    """Sabit canvas öğelerini kare bütçesi içinde coords() ile taşır"""
+
+    # Adım adım düşülen kare hızları
+    FPS_LEVELS = (20, 10, 5)
+
+    def __init__(self, canvas: tk.Canvas, scheduler: FrameScheduler, count: int = 50,
+                 frame_budget_ms: float = 8.0, latency_budget_ms: float = 30.0,
+                 upshift_after: int = 40):
+        self.canvas = canvas
+        self.scheduler = scheduler
+        self.count = count
+        self.frame_budget_ms = frame_budget_ms
+        self.latency_budget_ms = latency_budget_ms
+        self.upshift_after = upshift_after
+        self.level = 0
+        self.frames = 0
+        self.downshifts = 0
+        self.last_frame_ms = 0.0
+        self._cheap_frames = 0
+        self.particles: List[Dict] = []
+        self._create_items()
+        self.animation = scheduler.register('particles', self._frame, 1000 // self.fps, widget=canvas)
+
+    @property
+    def fps(self) -> int:
+        return self.FPS_LEVELS[self.level]
+
+    def _create_items(self) -> None:
+        width = max(1, self.canvas.winfo_screenwidth())
+        height = max(1, self.canvas.winfo_screenheight())
+        for _ in range(self.count):
+            color = random.choice(PARTICLE_COLORS)
+            particle = {
+                'x': random.uniform(0, width),
+                'y': random.uniform(0, height),
+                'vx': random.uniform(-0.5, 0.5),
+                'vy': random.uniform(-0.5, 0.5),
+                'size': random.randint(2, 6),
+                'pulse': random.uniform(0, 2 * math.pi),
+            }
+            # Öğeler bir kez oluşturulur; karelerde yalnızca coords() çağrılır
+            particle['glow'] = self.canvas.create_oval(
+                0, 0, 0, 0, fill=color, outline="", stipple="gray25", tags="particle"
+            )
+            particle['core'] = self.canvas.create_oval(
+                0, 0, 0, 0, fill=color, outline="", tags="particle"
+            )
+            self.particles.append(particle)
+        self._draw(speed=0.0)
+
+    @property
+    def paused(self) -> bool:
+        return self.animation.paused
+
+    def pause(self) -> None:
+        """Kare çizmeyi durdur (otomasyon çalışıyor); öğeler yerinde kalır"""
+        self.animation.paused = True
+
+    def resume(self) -> None:
+        self.animation.paused = False
+
+    def _frame(self, now: float) -> None:
+        started = time.perf_counter()
+        # Düşük kare hızında parçacıklar aynı hızla ilerlesin
+        self._draw(speed=self.FPS_LEVELS[0] / self.fps)
+        self.last_frame_ms = (time.perf_counter() - started) * 1000
+        self.frames += 1
+        self._adapt()
+
+    def _draw(self, speed: float) -> None:
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width < 2 or height < 2:
+            # Pencere henüz yerleşmedi
+            return
+        coords = self.canvas.coords
+        for particle in self.particles:
+            particle['x'] = (particle['x'] + particle['vx'] * speed) % width
+            particle['y'] = (particle['y'] + particle['vy'] * speed) % height
+            particle['pulse'] += 0.05 * speed
+            size = particle['size'] + math.sin(particle['pulse'] * 2)
+            glow = size * 2
+            x, y = particle['x'], particle['y']
+            coords(particle['glow'], x - glow, y - glow, x + glow, y + glow)
+            coords(particle['core'], x - size, y - size, x + size, y + size)
+
+    def _adapt(self) -> None:
+        loop_late = self.scheduler.latency_avg_ms
+        over_budget = self.last_frame_ms > self.frame_budget_ms or loop_late > self.latency_budget_ms
+        if over_budget:
+            self._cheap_frames = 0
+            if self.level < len(self.FPS_LEVELS) - 1:
+                self.level += 1
+                self.downshifts += 1
+        else:
+            self._cheap_frames += 1
+            if self.level and self._cheap_frames >= self.upshift_after:
+                self.level -= 1
+                self._cheap_frames = 0
+        self.animation.interval_ms = 1000 // self.fps
+
+    def stats(self) -> Dict[str, float]:
+        """fps, frames, downshifts, last_frame_ms ve paused"""
+        return {
+            'fps': self.fps,
+            'frames': self.frames,
+            'downshifts': self.downshifts,
+            'last_frame_ms': round(self.last_frame_ms, 2),
+            'paused': self.paused,
+        }
@@ -0,0 +1,78 @@
+"""
+Açılış Profili - Seviye 3 penceresinin açılış süreleri
+Modül başına kurulum, ilk kare ve etkileşime hazır anı; interactive bir threading.Event'tir
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+class StartupProfiler:
+    """Modül başına kurulum süreleri, ilk kare ve etkileşim kilometre taşları"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.modules: Dict[str, Dict[str, float]] = {}
+        self.first_frame_s: Optional[float] = None
+        self.interactive_s: Optional[float] = None
+        self.interactive = threading.Event()
+        self._root = None
+        self._on_interactive_callback: Optional[Callable[[], None]] = None
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @contextmanager
+    def module(self, name: str) -> Iterator[None]:
+        """name modülünün kurulumunu ölç"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            finished = time.perf_counter()
+            self.modules[name] = {
+                'build_ms': round((finished - started) * 1000, 2),
+                'ready_s': round(finished - self.started, 3),
+                # İlk kareden sonra kurulan modül tembel (sekme ilk açıldığında)
+                'lazy': self.first_frame_s is not None,
+            }
+
+    def watch(self, root, on_interactive: Optional[Callable[[], None]] = None) -> None:
+        """İlk kare / etkileşim yoklamalarını kaydet; mainloop'tan hemen önce çağrılır"""
+        self._root = root
+        self._on_interactive_callback = on_interactive
+        root.after_idle(self._on_first_frame)
+
+    def _on_first_frame(self) -> None:
+        self.first_frame_s = self.elapsed()
+        # Bir sonraki zamanlayıcı turu: olay döngüsü girdiye açık
+        self._root.after(1, self._on_interactive)
+
+    def _on_interactive(self) -> None:
+        self.interactive_s = self.elapsed()
+        self.interactive.set()
+        if self._on_interactive_callback is not None:
+            self._on_interactive_callback()
+
+    def report(self) -> Dict[str, object]:
+        """first_frame_s, interactive_s ve modules (build_ms, ready_s, lazy)"""
+        return {
+            'first_frame_s': None if self.first_frame_s is None else round(self.first_frame_s, 3),
+            'interactive_s': None if self.interactive_s is None else round(self.interactive_s, 3),
+            'modules': dict(self.modules),
+        }
+
+    def format(self) -> str:
+        lines: List[str] = []
+        if self.first_frame_s is not None:
+            lines.append(f"İlk kare: {self.first_frame_s * 1000:.0f} ms")
+        if self.interactive_s is not None:
+            lines.append(f"Etkileşime hazır: {self.interactive_s * 1000:.0f} ms")
+        for name, entry in self.modules.items():
+            kind = "tembel" if entry['lazy'] else "açılış"
+            lines.append(
+                f"  {name:<24} {entry['build_ms']:8.1f} ms  hazır @ {entry['ready_s'] * 1000:.0f} ms ({kind})"
+            )
+        return "\n".join(lines)
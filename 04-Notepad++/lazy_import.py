@@ -0,0 +1,58 @@
+"""
+Tembel İçe Aktarma - ağır isteğe bağlı kütüphaneler
+Gerçek içe aktarma ilk öznitelik erişiminde yapılır (ör. gui modu pyautogui yüklemez)
+"""
+
+import importlib
+import sys
+import threading
+import types
+from typing import Callable, Optional
+
+
+class LazyModule(types.ModuleType):
+    """İlk öznitelik erişiminde name modülünü içe aktaran vekil"""
+
+    def __init__(self, name: str, on_import: Optional[Callable[[types.ModuleType], None]] = None):
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+        self.__dict__['_lazy_on_import'] = on_import
+        self.__dict__['_lazy_lock'] = threading.Lock()
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is not None:
+            return module
+        with self.__dict__['_lazy_lock']:
+            module = self.__dict__['_lazy_module']
+            if module is None:
+                module = importlib.import_module(self.__name__)
+                # Modül düzeyi ayarlar (ör. pyautogui.FAILSAFE) ilk yüklemede uygulanır
+                on_import = self.__dict__['_lazy_on_import']
+                if on_import is not None:
+                    on_import(module)
+                self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value) -> None:
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__['_lazy_module'] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str, on_import: Optional[Callable[[types.ModuleType], None]] = None) -> LazyModule:
+    """name için vekil döndür; on_import(module) gerçek içe aktarmadan sonra bir kez çalışır"""
+    return LazyModule(name, on_import)
+
+
+def is_loaded(name: str) -> bool:
+    """name bu süreçte gerçekten içe aktarıldıysa True"""
+    return name in sys.modules
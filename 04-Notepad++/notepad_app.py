@@ -67,3 +67,6 @@ if start_hotkey or start_mouse:
             bot.save_file_mouse(save_path)
             bot.close_mouse()
         st.success(f"Metin Notepad++ ile kaydedildi: {save_path}")
+        if start_mouse:
+            st.caption("Şablon arama süreleri")
+            st.code(bot.locate_latency())
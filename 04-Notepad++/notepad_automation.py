@@ -10,7 +10,8 @@ import pyautogui
 import pyperclip
 
 from ocr_utils import ocr_screen
-from vision_utils import locate_on_screen
+from template_registry import TemplateRegistry
+from vision_utils import ScreenLocator
 
 
 # Windows sistemlerde Notepad++ uygulamasının varsayılan kurulum yolu.
@@ -36,6 +37,17 @@ class NotepadPPAutomation:
         self.executable = executable
         # Allow overriding of template filenames
         self.templates = {**self.DEFAULT_TEMPLATES, **(templates or {})}
+        # Templates are read once and matched in grayscale at several scales
+        self.registry = TemplateRegistry(base_dir="images", templates=self.templates)
+        # Shares one screen capture between lookups until the next click
+        self.locator = ScreenLocator(window_title="Notepad++", registry=self.registry)
+
+    def _template(self, name: str, image_dir: str) -> str:
+        """Registry key for template ``name`` inside ``image_dir``."""
+        path = Path(image_dir) / self.templates[name]
+        if self.registry.paths.get(name) != path:
+            self.registry.register(name, path)
+        return name
 
     def _focus_editor(self) -> None:
         """Ensure the main editor window is focused.
@@ -58,6 +70,7 @@ class NotepadPPAutomation:
         center_x = win.left + win.width // 2
         center_y = win.top + win.height // 2
         pyautogui.click(center_x, center_y)
+        self.locator.invalidate()
         time.sleep(0.2)
 
     def launch(self) -> None:
@@ -135,8 +148,8 @@ class NotepadPPAutomation:
         # advanced search panel before using image-based clicks.
         self._focus_editor()
 
-        file_menu = Path(image_dir) / self.templates["file_menu"]
-        new_file = Path(image_dir) / self.templates["new_file"]
+        file_menu = self._template("file_menu", image_dir)
+        new_file = self._template("new_file", image_dir)
         self.click_menu(file_menu, confidence)
         time.sleep(0.2)
         self.click_menu(new_file, confidence)
@@ -162,8 +175,8 @@ class NotepadPPAutomation:
         # keystrokes.
         self._focus_editor()
 
-        file_menu = Path(image_dir) / self.templates["file_menu"]
-        save_file = Path(image_dir) / self.templates["save_file"]
+        file_menu = self._template("file_menu", image_dir)
+        save_file = self._template("save_file", image_dir)
         self.click_menu(file_menu, confidence)
         time.sleep(0.2)
         self.click_menu(save_file, confidence)
@@ -185,7 +198,7 @@ class NotepadPPAutomation:
         # pop-ups before attempting to click the close button.
         self._focus_editor()
 
-        close_button = Path(image_dir) / self.templates["close_button"]
+        close_button = self._template("close_button", image_dir)
         self.click_menu(close_button, confidence)
         time.sleep(0.5)
 
@@ -195,19 +208,27 @@ class NotepadPPAutomation:
         Parameters
         ----------
         image_path: str
-            Path to the screenshot template to match.
+            Registered template name (a key of ``templates``) or path to
+            the screenshot template to match.
         confidence: float, optional
             Matching threshold used by image recognition. Increasing the
-            value can reduce false positives when screen colours or
-            resolutions differ.
+            value can reduce false positives when screen colours differ;
+            scale changes (DPI) are handled by the template registry.
         """
-        location = locate_on_screen(image_path, confidence)
+        location = self.locator.locate(image_path, confidence)
         if location:
             x, y = location
             pyautogui.click(x + 5, y + 5)
+            # Every menu click opens or closes a menu, so the captured frame
+            # is stale; only lookups without a click in between share it
+            self.locator.invalidate()
             return True
         return False
 
+    def locate_latency(self) -> str:
+        """Per-template locate latency and search path (ROI vs. full screen)."""
+        return self.locator.format_latency()
+
     def read_editor_text(self, region: Optional[Tuple[int, int, int, int]] = None) -> str:
         """Read text from the editor area using OCR."""
         return ocr_screen(region)
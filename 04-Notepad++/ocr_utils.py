@@ -1,10 +1,16 @@
 """OCR utilities for screen text extraction using pytesseract and Pillow."""
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from PIL import Image, ImageGrab
-import pytesseract
+from lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Pillow ve Tesseract yalnızca OCR çağrıldığında yüklenir (kısayol yolu ödemez)
+ImageGrab = lazy_import("PIL.ImageGrab")
+pytesseract = lazy_import("pytesseract")
 
 def capture_region(region: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
     """Capture a screenshot of the given region.
@@ -0,0 +1,88 @@
+"""
+GUI Toplu Çağrı - birden çok GUI işlemini tek Tk döngü adımında çalıştırma
+"""
+
+import tkinter as tk
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+
+class GuiOperation(NamedTuple):
+    """Kuyruktaki tek çağrı: label adıyla raporlanan func(*args, **kwargs)"""
+
+    func: Callable
+    args: Tuple
+    kwargs: dict
+    label: str
+
+
+class GuiCallResult(NamedTuple):
+    """Tek işlemin sonucu; başarılıysa error None"""
+
+    label: str
+    value: Any = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _stale_widget(args: Tuple) -> bool:
+    """Widget argümanlarından biri adım çalışmadan yok edildi mi"""
+    for arg in args:
+        if hasattr(arg, 'winfo_exists'):
+            try:
+                if not arg.winfo_exists():
+                    return True
+            except (tk.TclError, AttributeError):
+                return True
+    return False
+
+
+def run_gui_operations(operations: List[GuiOperation]) -> List[GuiCallResult]:
+    """İşlemleri sırayla çağıran (Tk) thread'de çalıştır; hata diğerlerini durdurmaz"""
+    results = []
+    for op in operations:
+        if _stale_widget(op.args):
+            results.append(GuiCallResult(op.label, error="Widget artık mevcut değil"))
+            continue
+        try:
+            results.append(GuiCallResult(op.label, op.func(*op.args, **op.kwargs)))
+        except tk.TclError as e:
+            results.append(GuiCallResult(op.label, error=f"TclError: {e}"))
+        except Exception as e:
+            results.append(GuiCallResult(op.label, error=f"Genel Hata: {e}"))
+    return results
+
+
+class GuiCallBatch:
+    """GUI işlemlerini biriktirip tek thread geçişiyle çalıştıran bağlam yöneticisi"""
+
+    def __init__(self, runner: Callable[..., List[GuiCallResult]], timeout: Optional[float] = None):
+        self._runner = runner
+        self._operations: List[GuiOperation] = []
+        self.timeout = timeout
+        self.results: List[GuiCallResult] = []
+
+    def add(self, func: Callable, *args, label: Optional[str] = None, **kwargs) -> int:
+        """func(*args, **kwargs) çağrısını kuyruğa ekle; sonuçlardaki sırasını döndürür"""
+        self._operations.append(
+            GuiOperation(func, args, kwargs, label or getattr(func, '__name__', 'op'))
+        )
+        return len(self._operations) - 1
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def run(self) -> List[GuiCallResult]:
+        """Kuyruktakileri tek adımda çalıştır ve kuyruğu sıfırla"""
+        operations, self._operations = self._operations, []
+        self.results = self._runner(operations, timeout=self.timeout) if operations else []
+        return self.results
+
+    def __enter__(self) -> "GuiCallBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.run()
@@ -0,0 +1,68 @@
+"""
+Gecikme Histogramı - bekleme/gidiş-dönüş ölçümleri için sabit kovalı
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Optional
+
+
+# Kova üst sınırları (milisaniye); son kova sınırsız
+DEFAULT_BUCKETS_MS = (0.1, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class LatencyHistogram:
+    """Saniye cinsinden sürelerin thread-safe histogramı"""
+
+    def __init__(self, name: str, buckets_ms=DEFAULT_BUCKETS_MS):
+        self.name = name
+        self.buckets_ms = tuple(buckets_ms)
+        self._counts = [0] * (len(self.buckets_ms) + 1)
+        self._samples: List[float] = []
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000.0
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets_ms, ms)] += 1
+            self._samples.append(ms)
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Milisaniye cinsinden yüzdelik (en yakın sıra); boşsa None"""
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, float]:
+        """count, p50, p95 ve max (ms)"""
+        with self._lock:
+            samples = list(self._samples)
+        if not samples:
+            return {'count': 0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+        return {
+            'count': len(samples),
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': max(samples),
+        }
+
+    def buckets(self) -> Dict[str, int]:
+        """Üst sınırıyla etiketlenmiş kova sayıları"""
+        with self._lock:
+            counts = list(self._counts)
+        labels = [f"<={b:g}ms" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]:g}ms"]
+        return dict(zip(labels, counts))
+
+    def format(self) -> str:
+        """Tek satır özet ve boş olmayan kovalar"""
+        s = self.summary()
+        filled = ", ".join(f"{label}: {n}" for label, n in self.buckets().items() if n)
+        return (f"{self.name}: n={s['count']} p50={s['p50']:.2f}ms "
+                f"p95={s['p95']:.2f}ms max={s['max']:.2f}ms [{filled}]")
@@ -0,0 +1,110 @@
+"""
+Ön Okuma - sıradaki Excel dosyalarını paralel ayrıştırma
+"""
+
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .excel_cache import read_excel_cached
+from .excel_processor import HEADER_ROW, filter_posh_frame
+from .statement_cache import StatementCache
+
+
+def parse_statement(excel_path: str, header_row: int = HEADER_ROW) -> Tuple[pd.DataFrame, Any]:
+    """İşçi giriş noktası: tek ekstreyi oku, yalnızca POSH satırlarını tut"""
+    raw_data = read_excel_cached(excel_path, header=header_row)
+    return filter_posh_frame(raw_data)
+
+
+def default_worker_count() -> int:
+    """CPU'ların yarısı (en az 1, en çok 4); kalanı GUI thread'ine kalır"""
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+class StatementPrefetcher:
+    """Mevcut dosya girilirken sonraki lookahead dosyayı süreç havuzunda ayrıştır"""
+
+    def __init__(self, cache: StatementCache, workers: Optional[int] = None,
+                 lookahead: int = 2, header_row: int = HEADER_ROW):
+        self.cache = cache
+        self.workers = default_worker_count() if workers is None else workers
+        self.lookahead = max(1, lookahead)
+        self.header_row = header_row
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: "OrderedDict[Path, Future]" = OrderedDict()
+        self._queue: List[Path] = []
+        self.prefetched = 0
+        self.failed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._executor is not None
+
+    def start(self, excel_files: Sequence[Path]) -> bool:
+        """Dosyaları kuyruğa al ve havuzu başlat; False sıralı okumaya dönüş demektir"""
+        self._queue = [Path(f) for f in excel_files]
+        if self.workers <= 0 or len(self._queue) < 2:
+            return False
+        try:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        except (OSError, NotImplementedError, ValueError):
+            self._executor = None
+            return False
+        self._fill()
+        return True
+
+    def _fill(self) -> None:
+        """Önbellekte olmayan en fazla lookahead dosyayı gönderilmiş tut"""
+        while self._queue and len(self._pending) < self.lookahead:
+            excel_path = self._queue.pop(0)
+            if excel_path in self._pending or self.cache.contains(excel_path, self.header_row):
+                continue
+            try:
+                self._pending[excel_path] = self._executor.submit(
+                    parse_statement, str(excel_path), self.header_row
+                )
+            except RuntimeError:
+                # Havuz kapandıysa kalan dosyalar sırayla okunur
+                self._queue.clear()
+                break
+
+    def collect(self, excel_path: Path) -> bool:
+        """Ön okunduysa excel_path'i bekle ve önbelleğe koy; hatalar yutulur, True önbellekte demektir"""
+        excel_path = Path(excel_path)
+        if excel_path in self._queue:
+            # Sırası gelmeden istenen dosya kuyruktan çıkarılır, çağıran okur
+            self._queue.remove(excel_path)
+        future = self._pending.pop(excel_path, None)
+        stored = False
+        if future is not None:
+            try:
+                filtered_data, aciklama_col = future.result()
+                self.cache.store_parsed(excel_path, filtered_data, aciklama_col, self.header_row)
+                self.prefetched += 1
+                stored = True
+            except Exception:
+                self.failed += 1
+        if self._executor is not None:
+            self._fill()
+        return stored
+
+    def shutdown(self) -> None:
+        """Bekleyen işleri iptal et ve havuzu durdur"""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._queue.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "StatementPrefetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown()
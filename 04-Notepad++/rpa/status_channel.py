@@ -0,0 +1,103 @@
+"""
+Durum Kanalı - bot thread'inden Tk thread'ine engellemeyen durum satırı
+"""
+
+import queue
+import threading
+from typing import Callable, Dict, Optional
+
+
+class StatusChannel:
+    """Tek after() döngüsüyle boşaltılan sınırlı kuyruk; adım başına yalnızca en yeni mesaj gösterilir"""
+
+    def __init__(self, maxsize: int = 256, interval_ms: int = 50):
+        self._queue: "queue.Queue[str]" = queue.Queue(maxsize=maxsize)
+        self.interval_ms = interval_ms
+        self._root = None
+        self._sink: Optional[Callable[[str], None]] = None
+        self._running = False
+        self._lock = threading.Lock()
+        self.posted = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def post(self, message: str) -> None:
+        """Mesajı engellemeden kuyruğa ekle (işçi thread'i); doluysa en eskisi düşer"""
+        with self._lock:
+            self.posted += 1
+        try:
+            self._queue.put_nowait(message)
+            return
+        except queue.Full:
+            pass
+        # Kuyruk dolu: en eski mesaj atılır, en yenisi her zaman görünür
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            self.dropped += 1
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def drain(self) -> Optional[str]:
+        """Kuyruktakilerin hepsini al, en yenisini döndür (boşsa None)"""
+        latest = None
+        taken = 0
+        while True:
+            try:
+                latest = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            taken += 1
+        if taken > 1:
+            with self._lock:
+                self.coalesced += taken - 1
+        return latest
+
+    def start(self, root, sink: Callable[[str], None]) -> None:
+        """Tüketici döngüsünü başlat; Tk thread'inde çağrılmalı"""
+        self._root = root
+        self._sink = sink
+        if not self._running:
+            self._running = True
+            self._tick()
+
+    def stop(self) -> None:
+        self._running = False
+
+    def _tick(self) -> None:
+        if not self._running:
+            return
+        message = self.drain()
+        if message is not None:
+            try:
+                self._sink(message)
+                self.delivered += 1
+            except Exception:
+                # Durum satırı hatası otomasyonu etkilememeli
+                pass
+        try:
+            self._root.after(self.interval_ms, self._tick)
+        except Exception:
+            # Pencere kapandı, tüketici sonlanır
+            self._running = False
+
+    def stats(self) -> Dict[str, int]:
+        """posted, delivered, coalesced, dropped ve pending sayıları"""
+        with self._lock:
+            return {
+                'posted': self.posted,
+                'delivered': self.delivered,
+                'coalesced': self.coalesced,
+                'dropped': self.dropped,
+                'pending': self._queue.qsize(),
+            }
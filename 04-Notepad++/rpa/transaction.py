@@ -0,0 +1,262 @@
+"""
+Tipli Ekstre Kaydı - tarih date, tutar tam sayı kuruş
+Metin yalnızca GUI sınırında üretilir; eski dict arayüzü biçimlenmiş metin döndürür
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Iterator, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+DATE_FORMAT = '%d.%m.%Y'
+# Ekstrelerde görülen diğer tarih biçimleri (Excel hücresi metin olarak gelirse)
+_DATE_FORMATS = (DATE_FORMAT, '%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y%m%d')
+
+# Eski dict anahtarları ve seviye 1'in büyük harfli sütun adları
+_FIELD_ALIASES = {
+    'tarih': 'tarih', 'Tarih': 'tarih',
+    'aciklama': 'aciklama', 'Açıklama': 'aciklama',
+    'tutar': 'tutar', 'Tutar': 'tutar',
+    'dosya': 'dosya', 'Dosya': 'dosya',
+}
+
+DateValue = Union[date, str]
+
+# int64 tutar sütunlarında okunamayan tutarı işaretleyen değer (Transaction'da None)
+INVALID_KURUS = int(np.iinfo(np.int64).min)
+
+
+def parse_date(value: Any) -> Optional[DateValue]:
+    """Hücre değerini date'e çevir; çözülemeyen metin olduğu gibi kalır"""
+    if value is None or value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return text
+
+
+def parse_kurus(value: Any) -> int:
+    """Tutarı (sayı veya '1.234,56' / '670.99' metni) kuruşa çevir; okunamazsa ValueError"""
+    if value is None:
+        return 0
+    if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+        return int(value) * 100
+    text = str(value).strip()
+    if ',' in text:
+        # Türkçe biçim: binlik ayırıcı nokta, ondalık virgül
+        text = text.replace('.', '').replace(',', '.')
+    try:
+        amount = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Geçersiz tutar: {value!r}") from None
+    if not amount.is_finite():
+        raise ValueError(f"Geçersiz tutar: {value!r}")
+    return int((amount * 100).to_integral_value())
+
+
+def kurus_or_invalid(value: Any) -> int:
+    """parse_kurus; okunamayan tutar için INVALID_KURUS"""
+    try:
+        return parse_kurus(value)
+    except ValueError:
+        return INVALID_KURUS
+
+
+def format_kurus(kurus: Optional[int]) -> str:
+    """67099 -> '670.99' (giriş formlarının kabul ettiği biçim); geçersiz tutar boş kalır"""
+    if kurus is None:
+        return ''
+    sign = '-' if kurus < 0 else ''
+    lira, kurus_part = divmod(abs(kurus), 100)
+    return f"{sign}{lira}.{kurus_part:02d}"
+
+
+def format_date(value: Optional[DateValue]) -> str:
+    """date -> '23.07.2025'; metin ve None olduğu gibi geçer"""
+    if value is None:
+        return ''
+    if isinstance(value, date):
+        return value.strftime(DATE_FORMAT)
+    return str(value)
+
+
+def dates_from_column(column: pd.Series) -> list:
+    """Bütün sütun için parse_date"""
+    if pd.api.types.is_datetime64_any_dtype(column):
+        parsed = column
+    else:
+        parsed = pd.to_datetime(column, format=DATE_FORMAT, errors='coerce')
+    values = np.array(parsed.dt.date, dtype=object)
+    missing = pd.isna(parsed).to_numpy()
+    if missing.any():
+        # Ana biçime uymayan değerler tek tek denenir
+        raw = column.to_numpy(dtype=object)
+        for index in np.flatnonzero(missing):
+            values[index] = parse_date(raw[index])
+    return values.tolist()
+
+
+def kurus_from_column(column: pd.Series) -> np.ndarray:
+    """Bütün sütun için parse_kurus (int64 dizi, okunamayanlar INVALID_KURUS)"""
+    numeric = pd.to_numeric(column, errors='coerce')
+    values = numeric.to_numpy(dtype='float64', na_value=np.nan)
+    kurus = np.zeros(len(values), dtype=np.int64)
+    valid = np.isfinite(values)
+    kurus[valid] = np.round(values[valid] * 100).astype(np.int64)
+    invalid = ~valid & column.notna().to_numpy()
+    if invalid.any():
+        # Virgüllü metin tutarlar sayıya çevrilemez, tek tek ayrıştırılır
+        raw = column.to_numpy(dtype=object)
+        for index in np.flatnonzero(invalid):
+            kurus[index] = kurus_or_invalid(raw[index])
+    return kurus
+
+
+class Transaction:
+    """Tipli tarih ve kuruş tutarlı tek POSH ekstre satırı"""
+
+    __slots__ = ('tarih', 'aciklama', 'tutar_kurus', 'dosya')
+
+    def __init__(self, tarih: Optional[DateValue], aciklama: str, tutar_kurus: Optional[int],
+                 dosya: str = '') -> None:
+        self.tarih = tarih
+        self.aciklama = aciklama
+        self.tutar_kurus = tutar_kurus
+        self.dosya = dosya
+
+    @classmethod
+    def from_values(cls, tarih: Any, aciklama: Any, tutar: Any, dosya: str = '') -> 'Transaction':
+        """Ham hücre veya metin değerlerinden oluştur"""
+        kurus = kurus_or_invalid(tutar)
+        return cls(parse_date(tarih), '' if aciklama is None else str(aciklama),
+                   None if kurus == INVALID_KURUS else kurus, dosya)
+
+    @property
+    def tutar(self) -> Optional[Decimal]:
+        """Lira cinsinden tam Decimal tutar (okunamadıysa None)"""
+        if self.tutar_kurus is None:
+            return None
+        return Decimal(self.tutar_kurus).scaleb(-2)
+
+    def tarih_text(self) -> str:
+        return format_date(self.tarih)
+
+    def tutar_text(self) -> str:
+        return format_kurus(self.tutar_kurus)
+
+    # --- GUI sınırı: eski dict arayüzü biçimlenmiş metin döndürür ---
+
+    def keys(self) -> tuple:
+        return ('tarih', 'aciklama', 'tutar', 'dosya') if self.dosya else ('tarih', 'aciklama', 'tutar')
+
+    def __getitem__(self, key: str) -> str:
+        field = _FIELD_ALIASES.get(key)
+        if field == 'tarih':
+            return self.tarih_text()
+        if field == 'tutar':
+            return self.tutar_text()
+        if field is not None:
+            return getattr(self, field)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def to_display(self) -> dict:
+        """Tablo ve dışa aktarım için biçimlenmiş dict"""
+        return {key: self[key] for key in self.keys()}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Transaction):
+            return NotImplemented
+        return (self.tarih, self.aciklama, self.tutar_kurus, self.dosya) == (
+            other.tarih, other.aciklama, other.tutar_kurus, other.dosya)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"Transaction({self.tarih_text()!r}, {self.aciklama[:40]!r}, "
+                f"{self.tutar_text()} TL, dosya={self.dosya!r})")
+
+
+class StatementRecords(Sequence):
+    """Sütun bazlı tutulan, erişildiğinde Transaction üreten kayıtlar"""
+
+    __slots__ = ('_tarih', '_aciklama', '_tutar', '_dosya')
+
+    def __init__(self, tarih: list, aciklama: list, tutar_kurus: np.ndarray, dosya: str = '') -> None:
+        self._tarih = tarih
+        self._aciklama = aciklama
+        self._tutar = tutar_kurus
+        self._dosya = dosya
+
+    def __len__(self) -> int:
+        return len(self._aciklama)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return StatementRecords(
+                self._tarih[index], self._aciklama[index], self._tutar[index], self._dosya
+            )
+        kurus = int(self._tutar[index])
+        return Transaction(self._tarih[index], self._aciklama[index],
+                           None if kurus == INVALID_KURUS else kurus, self._dosya)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        dosya = self._dosya
+        for tarih, aciklama, kurus in zip(self._tarih, self._aciklama, self._tutar.tolist()):
+            yield Transaction(tarih, aciklama, None if kurus == INVALID_KURUS else kurus, dosya)
+
+    def descriptions(self) -> list:
+        """Kayıt oluşturmadan tüm açıklamalar"""
+        return self._aciklama
+
+    def total_kurus(self) -> int:
+        """Kayıt oluşturmadan toplam tutar (kuruş, okunamayan tutarlar hariç)"""
+        tutar = self._tutar
+        return int(tutar[tutar != INVALID_KURUS].sum())
+
+    def select(self, keep) -> StatementRecords:
+        """Maskesi True olan kayıtlardan yeni bir StatementRecords"""
+        keep = np.asarray(keep, dtype=bool)
+        indices = np.flatnonzero(keep).tolist()
+        return StatementRecords(
+            [self._tarih[i] for i in indices], [self._aciklama[i] for i in indices],
+            self._tutar[keep], self._dosya,
+        )
+
+    def __repr__(self) -> str:
+        return f"StatementRecords({len(self)} kayıt, dosya={self._dosya!r})"
+
+
+def as_transaction(record: Any) -> Transaction:
+    """Transaction veya eski tarih/aciklama/tutar dict'ini kabul et"""
+    if isinstance(record, Transaction):
+        return record
+    get = record.get
+    return Transaction.from_values(
+        get('tarih', get('Tarih')),
+        get('aciklama', get('Açıklama')),
+        get('tutar', get('Tutar')),
+        get('dosya', get('Dosya')) or '',
+    )
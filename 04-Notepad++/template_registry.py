@@ -0,0 +1,180 @@
+"""
+Şablon Kayıt Defteri - önceden hesaplanmış gri piramitlerle çok ölçekli eşleştirme
+Şablon diskten bir kez okunur; arama kabadan inceye, son eşleşen ölçek önce denenir
+"""
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+from lazy_import import lazy_import
+
+# OpenCV/NumPy yalnızca şablon ilk kullanıldığında yüklenir
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+
+
+class Match(NamedTuple):
+    """Mutlak ekran koordinatlarında doğrulanmış eşleşme"""
+
+    x: int
+    y: int
+    width: int
+    height: int
+    scale: float
+    score: float
+
+
+def build_pyramid(gray, levels: int) -> List:
+    """[gray, gray/2, gray/4, ...] en fazla levels küçültmeyle"""
+    pyramid = [gray]
+    for _ in range(levels):
+        height, width = pyramid[-1].shape[:2]
+        if height < 2 or width < 2:
+            break
+        pyramid.append(cv2.pyrDown(pyramid[-1]))
+    return pyramid
+
+
+def to_gray(image):
+    """BGR görüntünün gri kopyası (gri giriş olduğu gibi döner)"""
+    if image.ndim == 2:
+        return image
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+class TemplatePyramid:
+    """Tek şablon: kayıtlı her ölçek için gri piramitler"""
+
+    def __init__(self, name: str, path: Path, image, scales: Sequence[float], levels: int):
+        self.name = name
+        self.path = path
+        gray = to_gray(image)
+        self.size = gray.shape[1], gray.shape[0]
+        self.pyramids: Dict[float, List] = {}
+        for scale in scales:
+            if scale == 1.0:
+                scaled = gray
+            else:
+                width = max(1, round(gray.shape[1] * scale))
+                height = max(1, round(gray.shape[0] * scale))
+                interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+                scaled = cv2.resize(gray, (width, height), interpolation=interpolation)
+            self.pyramids[scale] = build_pyramid(scaled, levels)
+        # Son eşleşen ölçek önce denenir
+        self.last_scale = 1.0 if 1.0 in self.pyramids else scales[0]
+
+    def scale_order(self) -> List[float]:
+        return sorted(self.pyramids, key=lambda scale: (abs(scale - self.last_scale), scale))
+
+
+class TemplateRegistry:
+    """Şablonları bir kez yükler, kayıtlı her ölçekte kabadan inceye bulur"""
+
+    DEFAULT_SCALES = (0.75, 0.9, 1.0, 1.1, 1.25, 1.5)
+
+    def __init__(self, base_dir: Union[str, Path, None] = None,
+                 templates: Optional[Dict[str, str]] = None,
+                 scales: Sequence[float] = DEFAULT_SCALES, levels: int = 2,
+                 min_size: int = 12, coarse_slack: float = 0.2, accept_score: float = 0.95):
+        self.base_dir = Path(base_dir) if base_dir is not None else None
+        self.scales = tuple(scales)
+        self.levels = levels
+        self.min_size = min_size
+        self.coarse_slack = coarse_slack
+        self.accept_score = accept_score
+        self.paths: Dict[str, Path] = {}
+        self.loaded: Dict[str, TemplatePyramid] = {}
+        self.load_ms = 0.0
+        for name, filename in (templates or {}).items():
+            self.register(name, filename)
+
+    def register(self, name: str, filename: Union[str, Path]) -> None:
+        """name'i bir görüntü dosyasına bağla; ilk kullanımda okunur"""
+        path = Path(filename)
+        if self.base_dir is not None and not path.is_absolute() and not path.exists():
+            path = self.base_dir / path
+        self.paths[name] = path
+        self.loaded.pop(name, None)
+
+    def get(self, key: Union[str, Path]) -> TemplatePyramid:
+        """Kayıtlı ad veya dosya yoluyla şablon (yol anında kaydedilir)"""
+        key = str(key)
+        template = self.loaded.get(key)
+        if template is not None:
+            return template
+        if key not in self.paths:
+            self.register(key, key)
+        path = self.paths[key]
+        started = time.perf_counter()
+        image = cv2.imread(str(path), cv2.IMREAD_COLOR)
+        if image is None:
+            raise FileNotFoundError(f"Template not found: {path}")
+        template = TemplatePyramid(key, path, image, self.scales, self.levels)
+        self.load_ms += (time.perf_counter() - started) * 1000
+        self.loaded[key] = template
+        return template
+
+    def preload(self) -> None:
+        """Kayıtlı tüm şablonları ilk aramayı beklemeden şimdi oku"""
+        for name in list(self.paths):
+            self.get(name)
+
+    def _coarse_level(self, template_levels: List, screen_levels: List) -> Optional[int]:
+        """Şablonun tanınabilir kaldığı ve ekrana sığdığı en derin seviye"""
+        for level in range(min(len(template_levels), len(screen_levels)) - 1, -1, -1):
+            template_height, template_width = template_levels[level].shape[:2]
+            screen_height, screen_width = screen_levels[level].shape[:2]
+            if (min(template_height, template_width) >= self.min_size or level == 0) \
+                    and template_height <= screen_height and template_width <= screen_width:
+                return level
+        return None
+
+    def find(self, screen_levels: List, key: Union[str, Path], confidence: float = 0.8,
+             left: int = 0, top: int = 0) -> Optional[Match]:
+        """Sol üstü (left, top) olan gri ekran piramidinde key'in en iyi eşleşmesi"""
+        template = self.get(key)
+        screen = screen_levels[0]
+        best: Optional[Match] = None
+        for scale in template.scale_order():
+            levels = template.pyramids[scale]
+            level = self._coarse_level(levels, screen_levels)
+            if level is None:
+                continue
+            result = cv2.matchTemplate(screen_levels[level], levels[level], cv2.TM_CCOEFF_NORMED)
+            _, score, _, location = cv2.minMaxLoc(result)
+            template_height, template_width = levels[0].shape[:2]
+            if level == 0:
+                x0, y0 = 0, 0
+            else:
+                if score < confidence - self.coarse_slack:
+                    continue
+                # Tam çözünürlükte yalnızca kaba eşleşmenin çevresi aranır
+                factor = 2 ** level
+                x0 = max(0, location[0] * factor - 2 * factor)
+                y0 = max(0, location[1] * factor - 2 * factor)
+                x1 = min(screen.shape[1], location[0] * factor + template_width + 2 * factor)
+                y1 = min(screen.shape[0], location[1] * factor + template_height + 2 * factor)
+                window = screen[y0:y1, x0:x1]
+                if window.shape[0] < template_height or window.shape[1] < template_width:
+                    continue
+                result = cv2.matchTemplate(window, levels[0], cv2.TM_CCOEFF_NORMED)
+                _, score, _, location = cv2.minMaxLoc(result)
+            if score >= confidence and (best is None or score > best.score):
+                best = Match(int(left + x0 + location[0]), int(top + y0 + location[1]),
+                             template_width, template_height, scale, float(score))
+                if score >= self.accept_score:
+                    break
+        if best is not None:
+            template.last_scale = best.scale
+        return best
+
+    def stats(self) -> Dict[str, object]:
+        """registered, loaded, load_ms ve her şablonun last_scale değeri"""
+        return {
+            'registered': len(self.paths),
+            'loaded': len(self.loaded),
+            'load_ms': round(self.load_ms, 2),
+            'last_scale': {name: template.last_scale for name, template in self.loaded.items()},
+        }
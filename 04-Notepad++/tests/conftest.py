@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Testler proje klasöründen (main.py'nin yanından) çalışıyormuş gibi içe aktarır
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+if str(PROJECT_DIR) not in sys.path:
+    sys.path.insert(0, str(PROJECT_DIR))
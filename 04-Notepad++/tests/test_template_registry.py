@@ -0,0 +1,59 @@
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from template_registry import TemplateRegistry, build_pyramid, to_gray  # noqa: E402
+
+TEMPLATE_BOX = (130, 70, 64, 32)  # x, y, genişlik, yükseklik
+
+
+def _screen(seed=7, size=(240, 360)):
+    """Bulanıklaştırılmış gürültü: her bölgesi ayırt edilebilir bir 'ekran'"""
+    noise = np.random.default_rng(seed).integers(0, 256, size=(*size, 3), dtype=np.uint8)
+    return cv2.GaussianBlur(noise, (5, 5), 0)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    x, y, width, height = TEMPLATE_BOX
+    cv2.imwrite(str(tmp_path / "buton.png"), _screen()[y:y + height, x:x + width])
+    return TemplateRegistry(base_dir=tmp_path, templates={"buton": "buton.png"})
+
+
+def _levels(image, registry):
+    return build_pyramid(to_gray(image), registry.levels)
+
+
+def test_find_at_native_scale_with_offset(registry):
+    match = registry.find(_levels(_screen(), registry), "buton", 0.8, left=500, top=300)
+
+    assert (match.x, match.y) == (500 + TEMPLATE_BOX[0], 300 + TEMPLATE_BOX[1])
+    assert (match.width, match.height) == TEMPLATE_BOX[2:]
+    assert match.scale == 1.0
+
+
+def test_find_at_dpi_scale_and_remember_it(registry):
+    screen = _screen()
+    scaled = cv2.resize(screen, (round(screen.shape[1] * 1.25), round(screen.shape[0] * 1.25)),
+                        interpolation=cv2.INTER_LINEAR)
+
+    match = registry.find(_levels(scaled, registry), "buton", 0.8)
+
+    assert match is not None and match.scale == 1.25
+    assert abs(match.x - TEMPLATE_BOX[0] * 1.25) <= 2
+    assert abs(match.y - TEMPLATE_BOX[1] * 1.25) <= 2
+    assert registry.get("buton").scale_order()[0] == 1.25
+
+
+def test_no_match_on_other_screen(registry):
+    assert registry.find(_levels(_screen(seed=99), registry), "buton", 0.8) is None
+
+
+def test_template_read_once_and_missing_file(registry):
+    first = registry.get("buton")
+
+    assert registry.get("buton") is first
+    assert registry.stats()["loaded"] == 1
+    with pytest.raises(FileNotFoundError):
+        registry.get("yok.png")
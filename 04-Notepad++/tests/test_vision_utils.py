@@ -0,0 +1,128 @@
+import time
+
+import numpy as np
+import pytest
+
+import vision_utils
+from vision_utils import ScreenFrame, ScreenLocator
+
+SCREEN = (0, 0, 1920, 1080)
+
+
+@pytest.fixture
+def captures(monkeypatch):
+    """Ekran yerine boş kareler döndürür ve yakalanan bölgeleri kaydeder"""
+    regions = []
+
+    def capture(region=None):
+        regions.append(region)
+        left, top, width, height = region or SCREEN
+        return ScreenFrame(np.zeros((height, width, 3), dtype=np.uint8), left, top)
+
+    monkeypatch.setattr(vision_utils, "capture_screen", capture)
+    return regions
+
+
+@pytest.fixture
+def locator(monkeypatch):
+    instance = ScreenLocator(window_title=None, margin=80)
+    monkeypatch.setattr(instance, "_screen_region", lambda: SCREEN)
+    return instance
+
+
+def test_clip_to_screen(locator):
+    assert locator._clip((-50, -20, 200, 100)) == (0, 0, 150, 80)
+    assert locator._clip((1900, 1000, 100, 100)) == (1900, 1000, 20, 80)
+    assert locator._clip((2000, 0, 50, 50)) is None
+
+
+def test_candidate_regions_last_hit_then_window(locator, monkeypatch):
+    assert locator.candidate_regions("menu") == []
+
+    locator.last_hits["menu"] = (40, 30, 100, 20)
+    monkeypatch.setattr(locator, "window_region", lambda: (0, 0, 800, 600))
+
+    assert locator.candidate_regions("menu") == [(0, 0, 220, 130), (0, 0, 800, 600)]
+
+
+def test_window_region_not_repeated(locator, monkeypatch):
+    locator.last_hits["menu"] = (100, 100, 600, 400)
+    monkeypatch.setattr(locator, "window_region", lambda: (20, 20, 760, 560))
+
+    assert locator.candidate_regions("menu") == [(20, 20, 760, 560)]
+
+
+def test_region_frames_are_reused_until_invalidated(locator, captures):
+    window = locator._frame_for((100, 100, 400, 300))
+    inner = locator._frame_for((150, 120, 50, 40))
+
+    assert captures == [(100, 100, 400, 300)]
+    assert inner.region == (150, 120, 50, 40)
+    assert locator._frame_for((150, 120, 50, 40)) is inner
+    assert locator._frame_for((100, 100, 400, 300)) is window
+
+    locator.invalidate()
+    locator._frame_for((150, 120, 50, 40))
+    assert len(captures) == 2
+
+
+def test_full_frame_serves_every_region(locator, captures):
+    full = locator._frame_for(None)
+    crop = locator._frame_for((10, 10, 20, 20))
+
+    assert captures == [None]
+    assert crop.region == (10, 10, 20, 20)
+    assert locator._frame_for(None) is full
+
+
+def test_old_frame_is_captured_again(locator, captures):
+    locator._frame_for(None)
+    locator._frame_time = time.perf_counter() - locator.max_frame_age - 1
+
+    locator._frame_for(None)
+
+    assert captures == [None, None]
+
+
+def test_locate_searches_last_hit_area_before_full_screen(tmp_path, monkeypatch):
+    cv2 = pytest.importorskip("cv2")
+    rng = np.random.default_rng(3)
+    screen = cv2.GaussianBlur(rng.integers(0, 256, size=(600, 800, 3), dtype=np.uint8), (5, 5), 0)
+    cv2.imwrite(str(tmp_path / "kaydet.png"), screen[200:232, 300:364])
+    regions = []
+
+    def capture(region=None):
+        regions.append(region)
+        left, top, width, height = region or (0, 0, 800, 600)
+        return ScreenFrame(screen[top:top + height, left:left + width], left, top)
+
+    monkeypatch.setattr(vision_utils, "capture_screen", capture)
+    locator = ScreenLocator(window_title=None, margin=40,
+                            registry=vision_utils.TemplateRegistry(base_dir=tmp_path, scales=(1.0,)))
+    monkeypatch.setattr(locator, "_screen_region", lambda: (0, 0, 800, 600))
+
+    with locator.step():
+        assert locator.locate("kaydet.png") == (300, 200)
+    with locator.step():
+        assert locator.locate("kaydet.png") == (300, 200)
+
+    stats = locator.latency_report()["templates"]["kaydet.png"]
+    assert (stats["hits"], stats["roi_hits"], stats["full_scans"]) == (2, 1, 1)
+    assert regions == [None, (260, 160, 144, 112)]
+
+
+def test_crop_pyramid_is_built_once_per_region(monkeypatch):
+    pytest.importorskip("cv2")
+    built = []
+    build_pyramid = vision_utils.build_pyramid
+
+    def counting(gray, levels):
+        built.append(gray.shape)
+        return build_pyramid(gray, levels)
+
+    monkeypatch.setattr(vision_utils, "build_pyramid", counting)
+    frame = ScreenFrame(np.zeros((100, 200, 3), dtype=np.uint8))
+    for _ in range(3):
+        frame.crop((10, 10, 50, 40)).pyramid(2)
+
+    assert built == [(40, 50)]
@@ -1,11 +1,260 @@
 """Utility functions for locating images on the screen using OpenCV."""
 from __future__ import annotations
 
-from typing import Optional, Tuple
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 
-import cv2
-import numpy as np
-import pyautogui
+from lazy_import import lazy_import
+from template_registry import TemplateRegistry, build_pyramid, to_gray
+
+# OpenCV/NumPy/PyAutoGUI yalnızca görüntü eşleştirme yolunda yüklenir
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+pyautogui = lazy_import("pyautogui")
+
+# (left, top, width, height) in absolute screen pixels
+Region = Tuple[int, int, int, int]
+
+
+class ScreenFrame:
+    """Yakalanmış BGR ekran alanı ve mutlak konumu"""
+
+    def __init__(self, image, left: int = 0, top: int = 0):
+        self.image = image
+        self.left = left
+        self.top = top
+        self._pyramid: Optional[List] = None
+        # Aynı bölge tekrar istendiğinde alt kare (ve piramidi) yeniden kurulmaz
+        self._crops: Dict[Region, "ScreenFrame"] = {}
+
+    def pyramid(self, levels: int) -> List:
+        """Karenin gri piramidi; bir kez kurulur, tüm şablonlar paylaşır"""
+        if self._pyramid is None or len(self._pyramid) < levels + 1:
+            self._pyramid = build_pyramid(to_gray(self.image), levels)
+        return self._pyramid
+
+    @property
+    def region(self) -> Region:
+        height, width = self.image.shape[:2]
+        return self.left, self.top, width, height
+
+    def covers(self, region: Region) -> bool:
+        left, top, width, height = region
+        own_left, own_top, own_width, own_height = self.region
+        return (own_left <= left and own_top <= top
+                and left + width <= own_left + own_width
+                and top + height <= own_top + own_height)
+
+    def crop(self, region: Region) -> "ScreenFrame":
+        """region için alt kare (bölge başına bir kez kesilir); çağıran önce covers ile kontrol eder"""
+        if region == self.region:
+            return self
+        frame = self._crops.get(region)
+        if frame is None:
+            left, top, width, height = region
+            x, y = left - self.left, top - self.top
+            frame = ScreenFrame(self.image[y:y + height, x:x + width], left, top)
+            self._crops[region] = frame
+        return frame
+
+
+def capture_screen(region: Optional[Region] = None) -> ScreenFrame:
+    """region'ın (veya tüm ekranın) BGR kare olarak ekran görüntüsü"""
+    screenshot = pyautogui.screenshot(region=region)
+    image = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+    left, top = (region[0], region[1]) if region else (0, 0)
+    return ScreenFrame(image, left, top)
+
+
+class LocateStats:
+    """Tek şablonun gecikme ve arama yolu sayaçları"""
+
+    __slots__ = ('calls', 'hits', 'roi_hits', 'full_scans', 'total_ms', 'last_ms', 'max_ms',
+                 'last_scale')
+
+    def __init__(self):
+        self.calls = 0
+        self.hits = 0
+        self.roi_hits = 0
+        self.full_scans = 0
+        self.total_ms = 0.0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+        self.last_scale = None
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'calls': self.calls,
+            'hits': self.hits,
+            'roi_hits': self.roi_hits,
+            'full_scans': self.full_scans,
+            'last_ms': round(self.last_ms, 2),
+            'avg_ms': round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            'max_ms': round(self.max_ms, 2),
+            'last_scale': self.last_scale,
+        }
+
+
+class ScreenLocator:
+    """Ekran yakalamasını arada tıklama olmayan aramalar arasında paylaşan şablon aramaları"""
+
+    def __init__(self, window_title: Optional[str] = "Notepad++", margin: int = 80,
+                 max_frame_age: float = 1.0, registry: Optional[TemplateRegistry] = None):
+        self.window_title = window_title
+        self.registry = registry if registry is not None else TemplateRegistry()
+        self.margin = margin
+        self.max_frame_age = max_frame_age
+        self.frames: List[ScreenFrame] = []
+        self.full_frame: Optional[ScreenFrame] = None
+        self.captures = 0
+        self.capture_ms = 0.0
+        self.last_hits: Dict[str, Region] = {}
+        self.stats: Dict[str, LocateStats] = {}
+        self._frame_time = 0.0
+        self._window: Optional[Region] = None
+
+    # --- frame reuse ----------------------------------------------
+    def invalidate(self) -> None:
+        """Paylaşılan kareyi bırak; sonraki arama ekranı yeniden yakalar"""
+        self.frames = []
+        self.full_frame = None
+        self._window = None
+
+    @contextmanager
+    def step(self) -> Iterator["ScreenLocator"]:
+        """Tek etkileşim adımı: içerideki aramalar kareyi paylaşır, sonra kare bırakılır"""
+        self.invalidate()
+        try:
+            yield self
+        finally:
+            self.invalidate()
+
+    def _frame_for(self, region: Optional[Region]) -> ScreenFrame:
+        """region için paylaşılan kare (None: tüm ekran); yalnızca eksik olan yakalanır"""
+        if (self.frames or self.full_frame) and time.perf_counter() - self._frame_time > self.max_frame_age:
+            # Eski kare ekranı artık yansıtmıyor olabilir
+            self.invalidate()
+        if self.full_frame is not None:
+            return self.full_frame if region is None else self.full_frame.crop(region)
+        if region is not None:
+            for frame in self.frames:
+                if frame.covers(region):
+                    return frame.crop(region)
+        started = time.perf_counter()
+        frame = capture_screen(region)
+        self.capture_ms += (time.perf_counter() - started) * 1000
+        self.captures += 1
+        if not self.frames and self.full_frame is None:
+            self._frame_time = time.perf_counter()
+        if region is None:
+            self.full_frame = frame
+        else:
+            self.frames.append(frame)
+        return frame
+
+    def _screen_region(self) -> Region:
+        width, height = pyautogui.size()
+        return 0, 0, width, height
+
+    # --- regions of interest --------------------------------------
+    def _clip(self, region: Region) -> Optional[Region]:
+        _, _, screen_width, screen_height = self._screen_region()
+        left, top, width, height = region
+        right, bottom = min(screen_width, left + width), min(screen_height, top + height)
+        left, top = max(0, left), max(0, top)
+        if right <= left or bottom <= top:
+            return None
+        return left, top, right - left, bottom - top
+
+    def window_region(self) -> Optional[Region]:
+        """Hedef pencerenin sınırları; bulunamazsa None"""
+        if self.window_title is None:
+            return None
+        if self._window is None:
+            try:
+                windows = pyautogui.getWindowsWithTitle(self.window_title)
+            except Exception:
+                # Pencere API'si yalnızca Windows'ta var
+                return None
+            if not windows:
+                return None
+            win = windows[0]
+            self._window = self._clip((win.left, win.top, win.width, win.height))
+        return self._window
+
+    def candidate_regions(self, key: str) -> List[Region]:
+        """Tüm ekrandan önce aranan bölgeler: son isabet çevresi, sonra pencere"""
+        regions = []
+        last = self.last_hits.get(key)
+        if last is not None:
+            left, top, width, height = last
+            around = self._clip((left - self.margin, top - self.margin,
+                                 width + 2 * self.margin, height + 2 * self.margin))
+            if around is not None:
+                regions.append(around)
+        window = self.window_region()
+        if window is not None and window not in regions:
+            regions.append(window)
+        return regions
+
+    # --- lookup ----------------------------------------------------
+    def _match(self, frame: ScreenFrame, key: str, confidence: float):
+        levels = frame.pyramid(self.registry.levels)
+        return self.registry.find(levels, key, confidence, frame.left, frame.top)
+
+    def locate(self, template_path: str, confidence: float = 0.8) -> Optional[Tuple[int, int]]:
+        """template_path'i bul; önce ROI, yalnızca ıskada tüm ekran. Sol üst koordinat veya None"""
+        key = str(template_path)
+        stats = self.stats.setdefault(key, LocateStats())
+        started = time.perf_counter()
+        # Şablon ilk kullanımda bir kez okunur (eksikse FileNotFoundError)
+        self.registry.get(key)
+
+        match = None
+        for region in self.candidate_regions(key):
+            match = self._match(self._frame_for(region), key, confidence)
+            if match is not None:
+                stats.roi_hits += 1
+                break
+        if match is None:
+            stats.full_scans += 1
+            match = self._match(self._frame_for(None), key, confidence)
+
+        location = None
+        if match is not None:
+            stats.hits += 1
+            stats.last_scale = match.scale
+            location = match.x, match.y
+            self.last_hits[key] = (match.x, match.y, match.width, match.height)
+        elapsed = (time.perf_counter() - started) * 1000
+        stats.calls += 1
+        stats.total_ms += elapsed
+        stats.last_ms = elapsed
+        stats.max_ms = max(stats.max_ms, elapsed)
+        return location
+
+    def latency_report(self) -> Dict[str, object]:
+        """Şablon başına gecikme (templates) ve yakalama toplamları"""
+        return {
+            'captures': self.captures,
+            'capture_ms': round(self.capture_ms, 2),
+            'templates': {key: stats.as_dict() for key, stats in self.stats.items()},
+        }
+
+    def format_latency(self) -> str:
+        lines = [f"Ekran yakalama: {self.captures} kez, {self.capture_ms:.1f} ms"]
+        for key, stats in self.stats.items():
+            entry = stats.as_dict()
+            lines.append(
+                f"  {key:<24} ort {entry['avg_ms']:7.1f} ms  son {entry['last_ms']:7.1f} ms  "
+                f"bulundu {entry['hits']}/{entry['calls']}  (ROI {entry['roi_hits']}, tam ekran {entry['full_scans']})"
+                + (f"  ölçek {entry['last_scale']:.2f}" if entry['last_scale'] is not None else "")
+            )
+        return "\n".join(lines)
+
+
+_default_locator = ScreenLocator(window_title=None)
 
 
 def locate_on_screen(template_path: str, confidence: float = 0.8) -> Optional[Tuple[int, int]]:
@@ -17,14 +266,6 @@ def locate_on_screen(template_path: str, confidence: float = 0.8) -> Optional[Tu
     Returns:
         Top-left coordinates of the best match if found, otherwise ``None``.
     """
-    screenshot = pyautogui.screenshot()
-    screen = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-    template = cv2.imread(template_path, cv2.IMREAD_COLOR)
-    if template is None:
-        raise FileNotFoundError(f"Template not found: {template_path}")
-
-    result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
-    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-    if max_val >= confidence:
-        return max_loc
-    return None
+    # Tek seferlik çağrı: her seferinde güncel ekran
+    with _default_locator.step():
+        return _default_locator.locate(template_path, confidence)